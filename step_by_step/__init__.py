@@ -1,8 +1,22 @@
 """STEP-BY-STEP modular dashboard tool."""
 
-from .core.config_manager import ConfigManager, UserPreferences
-from .core.startup import StartupManager
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - for type checking only
+    from .core.config_manager import ConfigManager, UserPreferences
+    from .core.startup import StartupManager
 
 __all__ = ["ConfigManager", "UserPreferences", "StartupManager", "__version__"]
 
 __version__ = "0.2.0"
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy re-exports (PEP 562), see ``step_by_step.core``.
+    if name in ("ConfigManager", "UserPreferences", "StartupManager"):
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,70 +2,99 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from itertools import islice
 from typing import Iterable, List, Optional, Sequence, TextIO
 
+from step_by_step.core.compat import DATACLASS_SLOTS
 from step_by_step.core.startup import StartupReport
 
+# Fixed line prefixes (Einrückung) shared by all report sections.
+_BULLET = "  • "
+_SUB = "    - "
+# Status tokens shared by all sections.
+_OK = sys.intern("OK")
+_FAIL = sys.intern("FEHLER")
+_WARN = sys.intern("ACHTUNG")
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class StartupReportPresenter:
-    """Convert a :class:`StartupReport` into readable console output."""
+    """Convert a :class:`StartupReport` into readable console output.
+
+    The rendered text is cached after the first :meth:`render` call; create a
+    new presenter when the report changes afterwards.
+    """
 
     report: StartupReport
+    _cached_render: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def iter_lines(self) -> Iterable[str]:
         """Yield all console lines for the stored report."""
 
+        report = self.report
         yield "[Startprüfung] Zusammenfassung der automatischen Kontrollen:"
-        yield from self._iter_progress_messages()
-        yield from self._iter_dependency_messages()
-        yield from self._iter_self_test_messages()
-        yield from self._iter_security_messages()
-        yield from self._iter_color_audit_messages()
-        yield from self._iter_diagnostics_messages()
-        yield from self._iter_offline_messages()
+        # Leere Abschnitte werden übersprungen, ohne ihre Generatoren anzulegen.
+        if report.messages or report.repaired_paths:
+            yield from self._iter_progress_messages()
+        if report.dependency_messages:
+            yield from self._iter_dependency_messages()
+        if report.self_tests:
+            yield from self._iter_self_test_messages()
+        if report.security_summary is not None:
+            yield from self._iter_security_messages()
+        if report.color_audit:
+            yield from self._iter_color_audit_messages()
+        if (
+            report.diagnostics_messages
+            or report.diagnostics_path
+            or report.diagnostics_html_path
+        ):
+            yield from self._iter_diagnostics_messages()
+        if report.offline_mode_enabled:
+            yield from self._iter_offline_messages()
 
     def render(self) -> str:
         """Return the console report as a single string."""
 
-        return "\n".join(self.iter_lines())
+        if self._cached_render is None:
+            self._cached_render = "\n".join(self.iter_lines())
+        return self._cached_render
 
     def print(self, stream: Optional[TextIO] = None) -> None:
-        """Write all report lines to ``stream`` (defaults to ``sys.stdout``)."""
+        """Write all report lines to ``stream`` (defaults to ``sys.stdout``).
 
-        if stream is None:
-            import sys
+        The report is emitted with a single ``write`` call instead of one call
+        per line, which keeps slow consoles and pipes responsive.
+        """
 
+        if stream is None:
             stream = sys.stdout
-        for line in self.iter_lines():
-            print(line, file=stream)
+        stream.write(self.render() + "\n")
+        stream.flush()
 
     # ------------------------------------------------------------------
     def _iter_progress_messages(self) -> Iterable[str]:
         for message in self.report.messages:
-            yield f"  • {message}"
+            yield _BULLET + message
         if self.report.repaired_paths:
             repaired = ", ".join(str(path) for path in self.report.repaired_paths)
-            yield f"  • Reparaturen: {repaired}"
+            yield _BULLET + "Reparaturen: " + repaired
 
     # ------------------------------------------------------------------
     def _iter_dependency_messages(self) -> Iterable[str]:
-        if not self.report.dependency_messages:
-            return
         yield "  • Paketinstallationen:"
         for description in self.report.dependency_messages:
-            yield f"    - {description}"
+            yield _SUB + description
 
     # ------------------------------------------------------------------
     def _iter_self_test_messages(self) -> Iterable[str]:
-        if not self.report.self_tests:
-            return
         yield "[Selbsttest] Ergebnisse:"
         for result in self.report.self_tests:
-            status = "OK" if result.passed else "FEHLER"
-            detail = f" – {result.details}" if result.details else ""
-            yield f"  [{status}] {result.name}{detail}"
+            status = _OK if result.passed else _FAIL
+            detail = " – " + result.details if result.details else ""
+            yield "".join(("  [", status, "] ", result.name, detail))
         if self.report.all_self_tests_passed():
             yield "[Selbsttest] Alle Prüfungen bestanden. Das Protokoll liegt unter logs/startup.log."
         else:
@@ -76,29 +105,29 @@ class StartupReportPresenter:
         summary = self.report.security_summary
         if summary is None:
             return
-        status_label = "OK" if summary.status == "ok" else "ACHTUNG"
+        status_label = _OK if summary.status == "ok" else _WARN
         yield "[Datensicherheit] Manifest-Prüfung:"
         yield f"  [{status_label}] {summary.verified} Dateien kontrolliert, {len(summary.issues)} Abweichungen"
         for issue in summary.issues:
-            yield f"    - Warnung: {issue}"
+            yield _SUB + "Warnung: " + issue
         for backup in summary.backups:
-            yield f"    - Sicherung erstellt: {backup}"
+            yield _SUB + "Sicherung erstellt: " + backup
 
     # ------------------------------------------------------------------
     def _iter_color_audit_messages(self) -> Iterable[str]:
         audit = self.report.color_audit
-        if not audit:
+        if audit is None:
             return
         overall = str(audit.get("overall_status", "unknown"))
         worst_ratio = self._parse_float(audit.get("worst_ratio", 0.0))
-        label = "OK" if overall == "ok" else "ACHTUNG"
+        label = _OK if overall == "ok" else _WARN
         yield "[Farbaudit] Zusammenfassung:"
         yield (
             "  "
             f"[{label}] Niedrigster Kontrast {worst_ratio:.2f}:1 – vollständiger Bericht: data/color_audit.json"
         )
-        issues = list(audit.get("issues", []))
-        recommendations = list(audit.get("recommendations", []))
+        issues = audit.get("issues") or ()
+        recommendations = audit.get("recommendations") or ()
         if issues:
             yield "  • Hinweise auf schwache Kontraste:"
             yield from self._iter_bullet_list(issues)
@@ -111,8 +140,7 @@ class StartupReportPresenter:
         messages: List[str] = []
         if self.report.diagnostics_messages:
             messages.append("[Diagnose] Systemüberblick:")
-            for line in self.report.diagnostics_messages:
-                messages.append(f"  • {line}")
+            messages.extend(_BULLET + line for line in self.report.diagnostics_messages)
         if self.report.diagnostics_path:
             messages.append(f"[Diagnose] Vollständiger Bericht: {self.report.diagnostics_path}")
         if self.report.diagnostics_html_path:
@@ -121,15 +149,13 @@ class StartupReportPresenter:
 
     # ------------------------------------------------------------------
     def _iter_offline_messages(self) -> Iterable[str]:
-        if not self.report.offline_mode_enabled:
-            return
         yield "[Offline-Modus] Keine Paketnachinstallation möglich – Tool läuft mit Bordmitteln."
         for reason in self.report.offline_reasons:
-            yield f"  • Hinweis: {reason}"
+            yield _BULLET + "Hinweis: " + reason
         if self.report.degraded_features:
             yield "  • Eingeschränkte Zusatzfunktionen:"
             for feature in self.report.degraded_features:
-                yield f"    - {feature}"
+                yield _SUB + feature
         yield (
             "  • Sobald Internet verfügbar ist: 'python -m pip install -r requirements.txt' ausführen,"
             " um die Pakete nachzuladen."
@@ -137,9 +163,9 @@ class StartupReportPresenter:
 
     # ------------------------------------------------------------------
     @staticmethod
-    def _iter_bullet_list(entries: Sequence[str], prefix: str = "    - ") -> Iterable[str]:
-        for entry in entries[:5]:
-            yield f"{prefix}{entry}"
+    def _iter_bullet_list(entries: Sequence[str], prefix: str = _SUB) -> Iterable[str]:
+        for entry in islice(entries, 5):
+            yield prefix + str(entry)
         remaining = len(entries) - 5
         if remaining > 0:
             yield f"    … {remaining} weitere Hinweise im Bericht"
@@ -3,26 +3,30 @@
 from __future__ import annotations
 
 import argparse
+import importlib
+import logging
 import os
 import subprocess
 import sys
-import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from step_by_step.cli.reporting import StartupReportPresenter
-from step_by_step.core import ConfigManager, get_logger, setup_logging
+from step_by_step.core import ConfigManager, flush_logging, get_logger, setup_logging
 from step_by_step.core.startup import (
     RELAUNCH_ENV_FLAG,
     StartupManager,
     StartupReport,
 )
-from step_by_step.ui.main_window import MainWindow
 
+if TYPE_CHECKING:  # pragma: no cover - for type checking only
+    from step_by_step.ui.main_window import MainWindow
 
-def parse_args() -> argparse.Namespace:
-    """Leserliche Argumente für den Schnellstart (Headless = ohne Fenster)."""
+GUI_MODULE = "step_by_step.ui.main_window"
 
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
             "Startet das STEP-BY-STEP Tool und prüft vorher alle notwendigen "
@@ -34,33 +38,94 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Nur Selbsttest ausführen, aber keine Oberfläche (GUI) öffnen.",
     )
-    return parser.parse_args()
+    return parser
+
+
+# Der Parser wird einmal beim Import gebaut und für jeden Aufruf wiederverwendet.
+_PARSER = _build_parser()
+
+
+def parse_args() -> argparse.Namespace:
+    """Leserliche Argumente für den Schnellstart (Headless = ohne Fenster)."""
+
+    return _PARSER.parse_args()
+
 
 def relaunch_if_needed(report: StartupReport, logger: Logger) -> Optional[int]:
-    """Restart the launcher inside the virtual environment when required."""
+    """Restart the launcher inside the virtual environment when required.
+
+    On POSIX systems the current process is replaced (``exec``), so no second
+    interpreter waits in the background. Windows keeps the subprocess call,
+    because ``exec`` there does not hand over the console cleanly.
+    """
 
     if not report.relaunch_command:
         return None
-    env = os.environ.copy()
-    env[RELAUNCH_ENV_FLAG] = "1"
+    # Der Kindprozess erbt die Umgebung direkt; nur der Schalter wird gesetzt
+    # und danach wieder auf den alten Stand gebracht.
+    previous = os.environ.get(RELAUNCH_ENV_FLAG)
+    os.environ[RELAUNCH_ENV_FLAG] = "1"
     logger.info("Starte Tool erneut innerhalb der virtuellen Umgebung: %s", report.relaunch_command)
-    return subprocess.call(report.relaunch_command, env=env)
+    try:
+        if os.name == "posix":
+            _replace_process(report.relaunch_command, logger)
+        return subprocess.call(report.relaunch_command)
+    finally:
+        if previous is None:
+            os.environ.pop(RELAUNCH_ENV_FLAG, None)
+        else:
+            os.environ[RELAUNCH_ENV_FLAG] = previous
+
+
+def _replace_process(command: List[str], logger: Logger) -> None:
+    """Replace the running interpreter with ``command`` (returns only on error)."""
+
+    # Nach exec laufen weder der Log-Thread noch atexit – vorher alles schreiben.
+    flush_logging()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvp(command[0], command)
+    except OSError as error:
+        logger.warning("Prozesswechsel nicht möglich, starte als Unterprozess: %s", error)
+
 
+def preload_gui(logger: Logger) -> None:
+    """Import the GUI modules while the startup checks are still running.
 
-def apply_font_scaling(app: MainWindow, scale: float, logger) -> None:
+    The Tk import and the widget modules take a noticeable amount of time; doing
+    this in parallel to the (I/O-bound) checks lets the window appear sooner.
+    The window itself is created only after the checks, because it reads the
+    data files repaired by the startup routine.
+    """
+
+    try:
+        importlib.import_module(GUI_MODULE)
+    except ImportError as error:
+        logger.warning("Oberfläche konnte nicht vorgeladen werden: %s", error)
+
+
+def apply_font_scaling(app: "MainWindow", scale: float, logger) -> None:
     """Adjust the Tk (Toolkit für grafische Oberflächen) scaling factor."""
 
     if scale == 1.0:
         return
+    import tkinter as tk
+
     try:
+        current = float(app.tk.call("tk", "scaling"))
+        if abs(current - scale) < 1e-3:
+            return
         app.tk.call("tk", "scaling", scale)
-    except tk.TclError:
+    except (tk.TclError, ValueError):
         logger.warning("Skalierung konnte nicht angepasst werden.")
 
 
 def launch_gui(preferences) -> None:
     """Create and run the main application window."""
 
+    from step_by_step.ui.main_window import MainWindow
+
     ui_logger = get_logger("ui")
     app = MainWindow(preferences=preferences, logger=ui_logger)
     apply_font_scaling(app, preferences.font_scale, ui_logger)
@@ -76,7 +141,11 @@ def main() -> int:
     logger.info("Launcher gestartet (Argumente: %s)", args)
 
     startup = StartupManager()
-    report = startup.run_startup_checks(argv=sys.argv)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="startup-checks") as executor:
+        pending_report = executor.submit(startup.run_startup_checks, argv=sys.argv)
+        if not args.headless:
+            preload_gui(logger)
+        report = pending_report.result()
     StartupReportPresenter(report).print()
 
     relaunch_code = relaunch_if_needed(report, logger)
@@ -85,7 +154,8 @@ def main() -> int:
 
     config_manager = ConfigManager()
     preferences = config_manager.load_preferences()
-    logger.info("Einstellungen geladen: %s", preferences.to_dict())
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Einstellungen geladen: %s", preferences.to_dict())
 
     if args.headless:
         print("[Headless] Der Selbsttest ist abgeschlossen. Aktive Einstellungen:")
@@ -108,5 +178,6 @@ __all__ = [
     "launch_gui",
     "main",
     "parse_args",
+    "preload_gui",
     "relaunch_if_needed",
 ]
@@ -1,20 +1,72 @@
-"""Core infrastructure for STEP-BY-STEP."""
-
-from .color_audit import ColorAuditReport, ColorAuditor
-from .config_manager import ConfigManager, UserPreferences
-from .diagnostics import DiagnosticsManager, DiagnosticsReport, PackageStatus, PathStatus
-from .log_reader import LogEntry, LogReader
-from .logging_manager import get_logger, setup_logging
-from .security import SecurityManager, SecuritySummary
-from .startup import StartupManager, StartupReport
-from .themes import COLOR_THEMES, THEME_ORDER, get_theme_colors
-from .validators import ensure_existing_path, ensure_unique
+"""Core infrastructure for STEP-BY-STEP.
+
+The re-exported names are loaded lazily (PEP 562): a submodule is imported only
+when one of its names is accessed for the first time, so the headless launcher
+does not pay for audits or diagnostics it never touches.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover - for type checking only
+    from .color_audit import ColorAuditReport, ColorAuditor
+    from .config_manager import ConfigManager, UserPreferences
+    from .diagnostics import DiagnosticsManager, DiagnosticsReport, PackageStatus, PathStatus
+    from .log_reader import LogEntry, LogReader
+    from .logging_manager import flush_logging, get_logger, setup_logging
+    from .security import SecurityManager, SecuritySummary
+    from .startup import StartupManager, StartupReport
+    from .themes import COLOR_THEMES, THEME_ORDER, get_theme_colors
+    from .validators import ensure_existing_path, ensure_unique
+
+# Exportierter Name -> Submodul, aus dem er beim ersten Zugriff geladen wird.
+_LAZY_EXPORTS: Dict[str, str] = {
+    "ConfigManager": "config_manager",
+    "UserPreferences": "config_manager",
+    "setup_logging": "logging_manager",
+    "get_logger": "logging_manager",
+    "flush_logging": "logging_manager",
+    "LogReader": "log_reader",
+    "LogEntry": "log_reader",
+    "StartupManager": "startup",
+    "StartupReport": "startup",
+    "SecurityManager": "security",
+    "SecuritySummary": "security",
+    "DiagnosticsManager": "diagnostics",
+    "DiagnosticsReport": "diagnostics",
+    "PackageStatus": "diagnostics",
+    "PathStatus": "diagnostics",
+    "ColorAuditor": "color_audit",
+    "ColorAuditReport": "color_audit",
+    "COLOR_THEMES": "themes",
+    "THEME_ORDER": "themes",
+    "get_theme_colors": "themes",
+    "ensure_existing_path": "validators",
+    "ensure_unique": "validators",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
+
 
 __all__ = [
     "ConfigManager",
     "UserPreferences",
     "setup_logging",
     "get_logger",
+    "flush_logging",
     "LogReader",
     "LogEntry",
     "StartupManager",
@@ -2,84 +2,127 @@
 
 from __future__ import annotations
 
+import bisect
+import copy
 import datetime as dt
+import math
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Sequence
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from .logging_manager import get_logger
 from .themes import THEME_ORDER, get_theme_colors
 
+
+class AuditRule(NamedTuple):
+    """Foreground/background pair that must reach a minimum contrast."""
+
+    label: str
+    foreground: str
+    background: str
+    minimum: float
+
+
 # Which combinations should be tested for minimum contrast.
-AUDIT_COMBINATIONS: Sequence[Dict[str, object]] = (
-    {
-        "label": "Basis-Text",
-        "foreground": "on_background",
-        "background": "background",
-        "minimum": 4.5,
-    },
-    {
-        "label": "Karten/Textfelder",
-        "foreground": "on_surface",
-        "background": "surface",
-        "minimum": 4.5,
-    },
-    {
-        "label": "Aktionsbutton",
-        "foreground": "surface",
-        "background": "accent",
-        "minimum": 4.5,
-    },
-    {
-        "label": "Warnhinweis",
-        "foreground": "on_background",
-        "background": "warning",
-        "minimum": 3.0,
-    },
-    {
-        "label": "Erfolgsnachricht",
-        "foreground": "on_background",
-        "background": "success",
-        "minimum": 3.0,
-    },
+AUDIT_COMBINATIONS: Tuple[AuditRule, ...] = (
+    AuditRule("Basis-Text", "on_background", "background", 4.5),
+    AuditRule("Karten/Textfelder", "on_surface", "surface", 4.5),
+    AuditRule("Aktionsbutton", "surface", "accent", 4.5),
+    AuditRule("Warnhinweis", "on_background", "warning", 3.0),
+    AuditRule("Erfolgsnachricht", "on_background", "success", 3.0),
 )
 
 
-def _hex_to_rgb(color: str) -> Iterable[float]:
-    color = color.strip().lstrip("#")
-    if len(color) != 6:
-        raise ValueError(f"Ungültige Farbe: {color}")
-    return tuple(int(color[i : i + 2], 16) / 255.0 for i in range(0, 6, 2))
+def _linearise(channel: float) -> float:
+    """sRGB-Kanal (0–1) in linearen Lichtwert umrechnen (WCAG-Formel)."""
+
+    return channel / 12.92 if channel <= 0.03928 else ((channel + 0.055) / 1.055) ** 2.4
+
 
+# Ein Farbkanal hat nur 256 mögliche Werte – die Umrechnung wird einmal vorab
+# berechnet und danach nur noch nachgeschlagen.
+_SRGB_LUT: Tuple[float, ...] = tuple(_linearise(value / 255.0) for value in range(256))
 
-def _relative_luminance(rgb: Sequence[float]) -> float:
-    def adjust(channel: float) -> float:
-        return channel / 12.92 if channel <= 0.03928 else ((channel + 0.055) / 1.055) ** 2.4
 
-    r, g, b = (adjust(channel) for channel in rgb)
-    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+# Farbwerte wiederholen sich zwischen Themen und Regeln; beide Umrechnungen sind
+# reine Funktionen und werden daher pro Hex-Wert zwischengespeichert.
+@lru_cache(maxsize=512)
+def _hex_to_rgb(color: str) -> bytes:
+    """Return the three 0–255 channel values of a ``#RRGGBB`` colour.
 
+    ``bytes.fromhex`` converts all channels in one call; the resulting bytes
+    index ``_SRGB_LUT`` directly.
+    """
 
-def _contrast_ratio(foreground: str, background: str) -> float:
-    fg_lum = _relative_luminance(_hex_to_rgb(foreground))
-    bg_lum = _relative_luminance(_hex_to_rgb(background))
+    value = color.strip().lstrip("#")
+    try:
+        rgb = bytes.fromhex(value) if len(value) == 6 else b""
+    except ValueError:
+        rgb = b""
+    if len(rgb) != 3:
+        raise ValueError(f"Ungültige Farbe: {value}")
+    return rgb
+
+
+@lru_cache(maxsize=512)
+def _relative_luminance(color: str) -> float:
+    r, g, b = _hex_to_rgb(color)
+    return 0.2126 * _SRGB_LUT[r] + 0.7152 * _SRGB_LUT[g] + 0.0722 * _SRGB_LUT[b]
+
+
+def _ratio_from_luminance(fg_lum: float, bg_lum: float) -> float:
     lighter = max(fg_lum, bg_lum)
     darker = min(fg_lum, bg_lum)
     return (lighter + 0.05) / (darker + 0.05)
 
 
+def contrast_ratio(foreground: str, background: str) -> float:
+    """WCAG contrast ratio of two ``#RRGGBB`` colours (1.0 bis 21.0)."""
+
+    return _ratio_from_luminance(_relative_luminance(foreground), _relative_luminance(background))
+
+
+def _luminance_table(palettes: Iterable[Tuple[str, Dict[str, str]]]) -> Dict[str, float]:
+    """Compute the relative luminance once for every audited colour.
+
+    The table contains each distinct colour used by an audit rule plus the
+    fallback colours for missing palette keys.
+    """
+
+    colors = {"#000000", "#FFFFFF"}
+    for _, palette in palettes:
+        for rule in AUDIT_COMBINATIONS:
+            for key in (rule.foreground, rule.background):
+                if key in palette:
+                    colors.add(palette[key])
+    return {color: _relative_luminance(color) for color in colors}
+
+
+class AuditEntry(NamedTuple):
+    """Result of one audit rule for one theme."""
+
+    element: str
+    foreground: str
+    background: str
+    ratio: float
+    minimum: float
+    passes: bool
+    suggestion: Optional[str]
+
+
 @dataclass
 class ThemeAudit:
     """Single theme evaluation result."""
 
     name: str
-    entries: List[Dict[str, object]] = field(default_factory=list)
+    entries: List[AuditEntry] = field(default_factory=list)
     worst_ratio: float = 21.0
     status: str = "ok"
 
     def to_dict(self) -> Dict[str, object]:
         return {
             "name": self.name,
-            "entries": list(self.entries),
+            "entries": [entry._asdict() for entry in self.entries],
             "worst_ratio": self.worst_ratio,
             "status": self.status,
         }
@@ -93,16 +136,23 @@ class ColorAuditReport:
     themes: List[ThemeAudit] = field(default_factory=list)
     issues: List[str] = field(default_factory=list)
     recommendations: List[str] = field(default_factory=list)
+    # Both summaries are maintained by add_theme()/add_issue() so that reading
+    # them does not walk the theme or issue lists again.
+    overall_status: str = "ok"
+    worst_ratio: float = 0.0
+
+    def add_theme(self, theme: ThemeAudit) -> None:
+        """Append *theme* and fold its worst ratio into the report summary."""
 
-    @property
-    def overall_status(self) -> str:
-        return "ok" if not self.issues else "attention"
+        if not self.themes or theme.worst_ratio < self.worst_ratio:
+            self.worst_ratio = theme.worst_ratio
+        self.themes.append(theme)
 
-    @property
-    def worst_ratio(self) -> float:
-        if not self.themes:
-            return 0.0
-        return min(theme.worst_ratio for theme in self.themes)
+    def add_issue(self, issue: str) -> None:
+        """Record *issue* and mark the report as needing attention."""
+
+        self.issues.append(issue)
+        self.overall_status = "attention"
 
     def to_dict(self) -> Dict[str, object]:
         return {
@@ -115,88 +165,152 @@ class ColorAuditReport:
         }
 
 
+# Letzter Bericht samt Paletten-Fingerabdruck. Auf Modulebene, weil der Start
+# für jeden Lauf einen neuen ColorAuditor anlegt.
+_report_cache: Optional[Tuple[int, ColorAuditReport]] = None
+
+
 class ColorAuditor:
     """Audit all palettes and return a structured report."""
 
     def __init__(self) -> None:
         self.logger = get_logger("core.color_audit")
 
+    def invalidate(self) -> None:
+        """Forget the cached report (z.B. nach dem Neuladen von Paletten)."""
+
+        global _report_cache
+        _report_cache = None
+
     def generate_report(self) -> ColorAuditReport:
+        """Audit all palettes; unchanged palettes reuse the previous result."""
+
+        global _report_cache
+
         timestamp = dt.datetime.now().isoformat()
+        palettes = [(name, get_theme_colors(name)) for name in THEME_ORDER]
+        fingerprint = hash(tuple((name, tuple(sorted(palette.items()))) for name, palette in palettes))
+        cache = _report_cache
+        if cache is not None and cache[0] == fingerprint:
+            self.logger.debug("Farbaudit unverändert – Ergebnis aus dem Zwischenspeicher")
+            cached = copy.deepcopy(cache[1])
+            cached.generated_at = timestamp
+            return cached
+
         report = ColorAuditReport(generated_at=timestamp)
+        luminance = _luminance_table(palettes)
 
-        for name in THEME_ORDER:
-            palette = get_theme_colors(name)
-            entries: List[Dict[str, object]] = []
+        for name, palette in palettes:
+            entries: List[AuditEntry] = [None] * len(AUDIT_COMBINATIONS)  # type: ignore[list-item]
             worst_ratio = 21.0
             status = "ok"
-            for rule in AUDIT_COMBINATIONS:
-                fg_key = str(rule["foreground"])
-                bg_key = str(rule["background"])
-                minimum = float(rule["minimum"])
-                fg = palette.get(fg_key, "#000000")
-                bg = palette.get(bg_key, "#FFFFFF")
-                ratio = _contrast_ratio(fg, bg)
+            for index, rule in enumerate(AUDIT_COMBINATIONS):
+                minimum = rule.minimum
+                fg = palette.get(rule.foreground, "#000000")
+                bg = palette.get(rule.background, "#FFFFFF")
+                ratio = _ratio_from_luminance(luminance[fg], luminance[bg])
                 worst_ratio = min(worst_ratio, ratio)
                 passes = ratio >= minimum
                 suggestion = None
                 if not passes:
                     status = "attention"
                     issue = (
-                        f"Thema '{name}': {rule['label']} erreicht nur {ratio:.2f}:1 (benötigt {minimum}:1)"
+                        f"Thema '{name}': {rule.label} erreicht nur {ratio:.2f}:1 (benötigt {minimum}:1)"
                     )
                     suggestion = _suggest_adjustment(
                         theme=name,
-                        element=str(rule["label"]),
-                        foreground=fg,
-                        background=bg,
+                        element=rule.label,
+                        fg_lum=luminance[fg],
+                        bg_lum=luminance[bg],
                         minimum=minimum,
                         ratio=ratio,
                     )
-                    report.issues.append(issue)
+                    report.add_issue(issue)
                     if suggestion and suggestion not in report.recommendations:
                         report.recommendations.append(suggestion)
-                entries.append(
-                    {
-                        "element": rule["label"],
-                        "foreground": fg,
-                        "background": bg,
-                        "ratio": round(ratio, 2),
-                        "minimum": minimum,
-                        "passes": passes,
-                        "suggestion": suggestion,
-                    }
+                entries[index] = AuditEntry(
+                    rule.label, fg, bg, round(ratio, 2), minimum, passes, suggestion
                 )
-            report.themes.append(ThemeAudit(name=name, entries=entries, worst_ratio=worst_ratio, status=status))
+            report.add_theme(ThemeAudit(name=name, entries=entries, worst_ratio=worst_ratio, status=status))
 
         if report.issues:
             self.logger.warning("Farbaudit mit %s Hinweisen abgeschlossen", len(report.issues))
         else:
             self.logger.info("Farbaudit ohne Auffälligkeiten abgeschlossen")
 
+        _report_cache = (fingerprint, copy.deepcopy(report))
         return report
 
 
 def _suggest_adjustment(
     theme: str,
     element: str,
-    foreground: str,
-    background: str,
+    fg_lum: float,
+    bg_lum: float,
     minimum: float,
     ratio: float,
 ) -> str:
-    """Return a human-readable hint on how to raise the contrast."""
+    """Return a human-readable hint on how to raise the contrast.
+
+    The luminances are passed in from the audit loop, which has already
+    computed them for the contrast ratio. The required luminance is solved
+    from the WCAG formula; a binary search over ``_SRGB_LUT`` turns it back
+    into a channel value, which gives a concrete percentage.
+    """
 
-    delta = max(0.0, minimum - ratio)
-    fg_lum = _relative_luminance(_hex_to_rgb(foreground))
-    bg_lum = _relative_luminance(_hex_to_rgb(background))
     if fg_lum > bg_lum:
-        action = "Hintergrund dunkler wählen oder Textfarbe leicht aufhellen"
+        darker, lighter = "Hintergrund", "Textfarbe"
+    else:
+        darker, lighter = "Textfarbe", "Hintergrund"
+    low, high = sorted((fg_lum, bg_lum))
+
+    darken = _darken_percent(low, (high + 0.05) / minimum - 0.05)
+    if darken is not None:
+        action = f"{darker} um ~{darken} % abdunkeln"
     else:
-        action = "Textfarbe dunkler setzen oder Hintergrund aufhellen"
-    return (
-        f"{theme}: {element} erreicht {ratio:.2f}:1 – {action} (benötigt {minimum}:1, Differenz {delta:.2f})."
-    )
+        lighten = _lighten_percent(high, minimum * (low + 0.05) - 0.05)
+        if lighten is not None:
+            action = f"{lighter} um ~{lighten} % aufhellen"
+        else:
+            action = f"{darker} dunkler und {lighter} heller wählen"
+    return f"{theme}: {element} erreicht {ratio:.2f}:1 – {action} (benötigt {minimum}:1)."
+
+
+def _channel_for(luminance: float) -> int:
+    """Grey channel value (0–255) whose luminance is closest from below."""
+
+    return max(0, bisect.bisect_right(_SRGB_LUT, luminance) - 1)
+
+
+def _darken_percent(current: float, target: float) -> Optional[int]:
+    """Percentage towards black needed to reach *target*; ``None`` if impossible."""
+
+    if target < 0.0:
+        return None
+    now = _channel_for(current)
+    if now == 0:
+        return None
+    goal = _channel_for(target)
+    return max(1, math.ceil((now - goal) * 100 / now))
+
+
+def _lighten_percent(current: float, target: float) -> Optional[int]:
+    """Percentage towards white needed to reach *target*; ``None`` if impossible."""
+
+    if target > 1.0:
+        return None
+    now = _channel_for(current)
+    if now == 255:
+        return None
+    goal = min(255, bisect.bisect_left(_SRGB_LUT, target))
+    return max(1, math.ceil((goal - now) * 100 / (255 - now)))
 
 
-__all__ = ["ColorAuditor", "ColorAuditReport", "ThemeAudit"]
+__all__ = [
+    "AuditEntry",
+    "AuditRule",
+    "ColorAuditor",
+    "ColorAuditReport",
+    "ThemeAudit",
+    "contrast_ratio",
+]
@@ -0,0 +1,12 @@
+"""Small helpers that smooth over differences between Python versions."""
+
+from __future__ import annotations
+
+import sys
+from typing import Dict
+
+# ``slots=True`` spart das Instanz-Dictionary, gibt es aber erst ab Python 3.10.
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+__all__ = ["DATACLASS_SLOTS"]
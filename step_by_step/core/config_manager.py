@@ -10,20 +10,35 @@ corrections and keeps a log of adjustments for the start report.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
+import hashlib
 import json
+import operator
+import os
+
+try:  # pragma: no cover - optional dependency handled dynamically
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None  # type: ignore
 
 from .defaults import DEFAULT_SETTINGS
-from .file_utils import atomic_write_json
+from .file_utils import atomic_write_bytes, dumps_json
 from .logging_manager import get_logger
 from .validators import SettingsValidator
 
 
 CONFIG_FILE = Path("data/settings.json")
 
+# (st_mtime_ns, st_size) of settings.json
+_SourceKey = Tuple[int, int]
+
+
+# (content digest, sanitised payload, adjustment notes, canonical encoding)
+_NormaliseResult = Tuple[bytes, Dict[str, Any], List[str], Optional[bytes]]
+
 
 @dataclass
 class UserPreferences:
@@ -39,13 +54,20 @@ class UserPreferences:
     audio_volume: float = 0.8
     extra: Dict[str, Any] = field(default_factory=dict)
 
+    # Filled in right after the class definition (see below).
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]] = ()
+    _KNOWN_FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+    _FIELD_GETTER: ClassVar[Callable[[Any], Tuple[Any, ...]]]
+
     @classmethod
-    def from_dict(cls, raw: Dict[str, Any]) -> "UserPreferences":
+    def from_dict(cls, raw: Mapping[str, Any]) -> "UserPreferences":
         """Create an instance from an untyped dictionary."""
 
-        known_fields = set(cls.__dataclass_fields__.keys())  # type: ignore[attr-defined]
-        data = {key: value for key, value in raw.items() if key in known_fields}
-        extras = {key: value for key, value in raw.items() if key not in known_fields}
+        known_fields = cls._KNOWN_FIELDS
+        data: Dict[str, Any] = {}
+        extras: Dict[str, Any] = {}
+        for key, value in raw.items():
+            (data if key in known_fields else extras)[key] = value
         instance = cls(**data)
         instance.extra = extras
         return instance
@@ -53,11 +75,22 @@ class UserPreferences:
     def to_dict(self) -> Dict[str, Any]:
         """Return a JSON serialisable representation including extras."""
 
-        payload = {field: getattr(self, field) for field in self.__dataclass_fields__}
+        payload = dict(zip(self._FIELD_NAMES, self._FIELD_GETTER(self)))
         payload.update(self.extra)
         return payload
 
 
+# Feldnamen einmalig berechnen statt bei jedem Aufruf neu aufzubauen.
+# ``extra`` wird flach in die Nutzlast gemischt und ist daher kein eigener Schlüssel.
+UserPreferences._FIELD_NAMES = tuple(
+    item.name for item in fields(UserPreferences) if item.name != "extra"
+)
+# Ältere Versionen schrieben zusätzlich ``"extra": {...}``; der Schlüssel gilt
+# weiter als bekannt, damit er beim Laden verworfen statt übernommen wird.
+UserPreferences._KNOWN_FIELDS = frozenset(item.name for item in fields(UserPreferences))
+UserPreferences._FIELD_GETTER = operator.attrgetter(*UserPreferences._FIELD_NAMES)
+
+
 class ConfigManager:
     """Load and persist configuration values with validation."""
 
@@ -66,41 +99,74 @@ class ConfigManager:
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = get_logger("core.config")
         self.validator = SettingsValidator()
+        self._cached_key: Optional[_SourceKey] = None
+        self._cached_payload: Optional[Dict[str, Any]] = None
+        self._normalise_cache: Optional[_NormaliseResult] = None
 
     # ------------------------------------------------------------------
     def load_preferences(self) -> UserPreferences:
-        """Return stored preferences, sanitising invalid payloads."""
+        """Return stored preferences, sanitising invalid payloads.
+
+        While the file keeps its modification time and size, the last parsed
+        payload is reused from memory.
+        """
+
+        key = self._source_key()
+        if key is not None and key == self._cached_key and self._cached_payload is not None:
+            return UserPreferences.from_dict(self._cached_payload)
 
         if not self.file_path.exists():
             self.logger.warning("Einstellungsdatei fehlte – Standardwerte werden angelegt.")
-            defaults = dict(DEFAULT_SETTINGS)
-            self._write_payload(defaults)
-            return UserPreferences.from_dict(defaults)
+            self._write_payload(DEFAULT_SETTINGS)
+            return UserPreferences.from_dict(DEFAULT_SETTINGS)
 
         try:
-            with self.file_path.open("r", encoding="utf-8") as handle:
-                raw_content: Dict[str, Any] = json.load(handle)
-        except json.JSONDecodeError:
+            raw_bytes = self.file_path.read_bytes()
+            sanitised, adjustments, encoded = self._normalise(raw_bytes)
+        except (json.JSONDecodeError, UnicodeDecodeError):
             self.logger.error(
                 "Einstellungsdatei beschädigt – Standardwerte werden wiederhergestellt."
             )
-            defaults = dict(DEFAULT_SETTINGS)
-            self._write_payload(defaults)
-            return UserPreferences.from_dict(defaults)
+            self._write_payload(DEFAULT_SETTINGS)
+            return UserPreferences.from_dict(DEFAULT_SETTINGS)
         except OSError as error:
             self.logger.error("Einstellungen konnten nicht gelesen werden: %s", error)
             return UserPreferences()
 
-        sanitised, adjustments = self.validator.normalise(raw_content)
-        if sanitised != raw_content:
-            self._write_payload(sanitised)
+        # Compare the canonical encoding with the file bytes instead of walking
+        # both dicts; identical bytes mean there is nothing to write back.
+        if encoded is None or encoded != raw_bytes:
+            self._write_payload(sanitised, encoded=encoded)
             if adjustments:
                 self.logger.info("Einstellungen korrigiert: %s", "; ".join(adjustments))
             else:
                 self.logger.info("Einstellungen auf empfohlene Standardwerte gebracht.")
 
+        self._remember(sanitised)
         return UserPreferences.from_dict(sanitised)
 
+    # ------------------------------------------------------------------
+    def _normalise(self, raw_bytes: bytes) -> Tuple[Dict[str, Any], List[str], Optional[bytes]]:
+        """Parse, validate and re-encode *raw_bytes*, memoised by content hash.
+
+        Unlike the modification-time cache this also catches rewrites with
+        identical content, so the validator only runs for new payloads.
+        """
+
+        digest = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+        cached = self._normalise_cache
+        if cached is not None and cached[0] == digest:
+            return cached[1], cached[2], cached[3]
+
+        raw_content: Dict[str, Any] = _loads(raw_bytes)
+        sanitised, adjustments = self.validator.normalise(raw_content)
+        try:
+            encoded: Optional[bytes] = dumps_json(sanitised)
+        except (TypeError, ValueError):
+            encoded = None
+        self._normalise_cache = (digest, sanitised, adjustments, encoded)
+        return sanitised, adjustments, encoded
+
     # ------------------------------------------------------------------
     def save_preferences(self, preferences: UserPreferences) -> None:
         """Persist the provided preferences as JSON."""
@@ -108,10 +174,47 @@ class ConfigManager:
         self._write_payload(preferences.to_dict())
 
     # ------------------------------------------------------------------
-    def _write_payload(self, payload: Dict[str, Any]) -> None:
-        if not atomic_write_json(self.file_path, payload, logger=self.logger):
+    def _write_payload(self, payload: Mapping[str, Any], *, encoded: Optional[bytes] = None) -> None:
+        """Write *payload*; ``encoded`` skips serialising it a second time."""
+
+        # Gespeicherte Werte sind nicht validiert – der nächste Ladevorgang
+        # muss die Datei daher wieder prüfen.
+        self._cached_key = self._cached_payload = None
+        written = False
+        if encoded is None:
+            try:
+                encoded = dumps_json(payload)
+            except (TypeError, ValueError) as error:
+                self.logger.error("JSON konnte nicht serialisiert werden: %s", error)
+        if encoded is not None:
+            written = atomic_write_bytes(self.file_path, encoded, logger=self.logger)
+        if not written:
             self.logger.error("Einstellungen konnten nicht gespeichert werden.")
 
+    # ------------------------------------------------------------------
+    def _source_key(self) -> Optional[_SourceKey]:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    # ------------------------------------------------------------------
+    def _remember(self, payload: Dict[str, Any]) -> None:
+        """Keep the sanitised payload in memory for the next load."""
+
+        key = self._source_key()
+        if key is not None:
+            self._cached_key, self._cached_payload = key, payload
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes with ``orjson`` when available (schneller C-Parser)."""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
 
 __all__ = ["ConfigManager", "UserPreferences"]
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 
 # Central place for persistent default preferences so that startup checks,
 # configuration loading, and validators rely on the same payload.
-DEFAULT_SETTINGS: Dict[str, Any] = {
+_SETTINGS: Dict[str, Any] = {
     "font_scale": 1.2,
     "theme": "light",
     "autosave_interval_minutes": 10,
@@ -18,5 +19,9 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
     "audio_volume": 0.8,
 }
 
+# Read-only view: callers can share it without defensive copies and nobody can
+# change the defaults by accident.
+DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType(_SETTINGS)
+
 
 __all__ = ["DEFAULT_SETTINGS"]
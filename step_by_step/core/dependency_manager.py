@@ -2,10 +2,26 @@
 
 from __future__ import annotations
 
+import re
 import subprocess
+import sys
+import threading
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Callable, Deque, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+# Anzahl der pip-Ausgabezeilen, die pro Datenstrom aufbewahrt werden.
+MAX_OUTPUT_LINES = 200
+
+NETWORK_HINT = "Keine Netzwerkverbindung erreichbar – Installation wurde übersprungen."
+TIMEOUT_HINT = "Netzwerk-Zeitüberschreitung: Verbindung prüfen und später erneut versuchen."
+
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
+# (sys.path beim Scan, kanonischer Name -> Version); geteilt von Start und Diagnose.
+_installed_cache: Optional[Tuple[Tuple[str, ...], Dict[str, str]]] = None
+_installed_lock = threading.Lock()
 
 
 @dataclass
@@ -20,6 +36,30 @@ class DependencyInstallOutcome:
     offline_hint: str = ""
 
 
+class _OutputTail:
+    """Keep the last lines of a pip output stream and remember offline hints."""
+
+    def __init__(self, detect_hint: Callable[[str], Optional[str]]) -> None:
+        self.lines: Deque[str] = deque(maxlen=MAX_OUTPUT_LINES)
+        self.hint: Optional[str] = None
+        self._detect_hint = detect_hint
+
+    def consume(self, stream: Optional[Iterable[str]]) -> None:
+        if stream is None:
+            return
+        for line in stream:
+            self.lines.append(line)
+            # Netzwerkfehler haben Vorrang vor einer Zeitüberschreitung.
+            if self.hint == NETWORK_HINT:
+                continue
+            hint = self._detect_hint(line)
+            if hint == NETWORK_HINT or self.hint is None:
+                self.hint = hint
+
+    def text(self) -> str:
+        return "".join(self.lines).strip()
+
+
 class DependencyManager:
     """Run pip commands with enhanced diagnostics and offline detection."""
 
@@ -32,6 +72,10 @@ class DependencyManager:
         "network is unreachable",
         "proxy connection failed",
     )
+    # Ein Suchmuster pro Hinweistext: ein Durchlauf über die pip-Ausgabe statt
+    # einer Suche je Stichwort. Netzwerkfehler haben Vorrang vor Zeitüberschreitungen.
+    _OFFLINE_RE = re.compile("|".join(map(re.escape, OFFLINE_MARKERS)), re.IGNORECASE)
+    _TIMEOUT_RE = re.compile(re.escape("timed out"), re.IGNORECASE)
 
     def __init__(self, python_executable: str) -> None:
         self.python_executable = python_executable
@@ -68,41 +112,65 @@ class DependencyManager:
 
     # ------------------------------------------------------------------
     def _run(self, command: Sequence[str], description: str) -> DependencyInstallOutcome:
-        """Execute ``pip`` and capture stdout/stderr with offline detection."""
+        """Execute ``pip`` and stream stdout/stderr with offline detection.
+
+        Only the last :data:`MAX_OUTPUT_LINES` lines of each stream are kept, so
+        memory stays constant even for very chatty installations. Offline
+        markers are checked line by line while the output arrives.
+        """
 
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 command,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=True,
+                errors="replace",
+                bufsize=1,
             )
-        except subprocess.CalledProcessError as error:
-            stderr = (error.stderr or "").strip()
-            stdout = (error.stdout or "").strip()
-            hint = self._detect_offline_hint(stderr or stdout)
+        except OSError as error:
+            message = str(error)
+            hint = self._detect_offline_hint(message)
             return DependencyInstallOutcome(
                 description=description,
                 success=False,
-                stdout=stdout,
-                stderr=stderr,
+                stdout="",
+                stderr=message,
                 offline_detected=hint is not None,
                 offline_hint=hint or "",
             )
-        except OSError as error:
-            message = str(error)
-            hint = self._detect_offline_hint(message)
+
+        stdout_tail = _OutputTail(self._detect_offline_hint)
+        stderr_tail = _OutputTail(self._detect_offline_hint)
+        # Der with-Block schließt beide Pipes und wartet auf den Prozess, auch
+        # wenn das Auslesen mit einer Ausnahme abbricht.
+        with process:
+            # stderr in eigenem Thread lesen, damit keine der beiden Pipes volläuft.
+            stderr_reader = threading.Thread(
+                target=stderr_tail.consume, args=(process.stderr,), daemon=True
+            )
+            stderr_reader.start()
+            try:
+                stdout_tail.consume(process.stdout)
+            finally:
+                stderr_reader.join()
+            returncode = process.wait()
+        # pip kann auch bei einem Fehler schon Pakete installiert haben.
+        invalidate_installed_versions()
+
+        stdout = stdout_tail.text()
+        stderr = stderr_tail.text()
+        if returncode != 0:
+            hint = stderr_tail.hint if stderr else stdout_tail.hint
             return DependencyInstallOutcome(
                 description=description,
                 success=False,
-                stdout="",
-                stderr=message,
+                stdout=stdout,
+                stderr=stderr,
                 offline_detected=hint is not None,
                 offline_hint=hint or "",
             )
 
-        stdout = (result.stdout or "").strip()
-        stderr = (result.stderr or "").strip()
         return DependencyInstallOutcome(
             description=description,
             success=True,
@@ -114,13 +182,56 @@ class DependencyManager:
     def _detect_offline_hint(self, message: str) -> Optional[str]:
         """Return a human-readable hint when no network is available."""
 
-        lowered = message.lower()
-        for marker in self.OFFLINE_MARKERS:
-            if marker in lowered:
-                return "Keine Netzwerkverbindung erreichbar – Installation wurde übersprungen."
-        if "connection timed out" in lowered or "timed out" in lowered:
-            return "Netzwerk-Zeitüberschreitung: Verbindung prüfen und später erneut versuchen."
+        if self._OFFLINE_RE.search(message):
+            return NETWORK_HINT
+        if self._TIMEOUT_RE.search(message):
+            return TIMEOUT_HINT
         return None
 
 
-__all__ = ["DependencyManager", "DependencyInstallOutcome"]
+def canonical_name(name: str) -> str:
+    """Normalise a distribution name (PEP 503), e.g. ``Foo_Bar`` -> ``foo-bar``."""
+
+    return _NAME_SEPARATORS.sub("-", name).lower()
+
+
+def installed_versions() -> Mapping[str, str]:
+    """Map canonical distribution names to versions with a single scan.
+
+    The result is shared by all callers and reused until ``sys.path`` changes
+    or a pip run finishes. As with ``importlib.metadata.version`` the first
+    distribution on the path wins.
+    """
+
+    global _installed_cache
+    search_path = tuple(sys.path)
+    with _installed_lock:
+        cached = _installed_cache
+        if cached is not None and cached[0] == search_path:
+            return cached[1]
+        # Erst hier importieren: importlib.metadata zieht email/zipfile & Co. nach.
+        from importlib import metadata as importlib_metadata
+
+        installed: Dict[str, str] = {}
+        for distribution in importlib_metadata.distributions():
+            name = distribution.metadata["Name"]
+            if name:
+                installed.setdefault(canonical_name(name), distribution.version)
+        _installed_cache = (search_path, installed)
+        return installed
+
+
+def invalidate_installed_versions() -> None:
+    """Forget the last scan, e.g. after pip changed the environment."""
+
+    global _installed_cache
+    _installed_cache = None
+
+
+__all__ = [
+    "DependencyManager",
+    "DependencyInstallOutcome",
+    "canonical_name",
+    "installed_versions",
+    "invalidate_installed_versions",
+]
@@ -3,29 +3,65 @@
 from __future__ import annotations
 
 import datetime as dt
-import html
-import json
+import logging
+import operator
 import os
-import platform
 import re
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING
 
-from .file_utils import atomic_write_json, atomic_write_text
+from .compat import DATACLASS_SLOTS
+from .dependency_manager import canonical_name, installed_versions
+from .file_utils import atomic_write_bytes, dumps_json
 from .logging_manager import get_logger
 
-try:  # Python 3.8 compatibility guard
-    from importlib import metadata as importlib_metadata
-except ImportError:  # pragma: no cover - fallback for very old runtimes
-    import importlib_metadata  # type: ignore
+try:  # pragma: no cover - optional dependency handled dynamically
+    from packaging.version import InvalidVersion, Version
+except ImportError:  # pragma: no cover - numeric comparison is the fallback
+    Version = None  # type: ignore
+    InvalidVersion = ValueError  # type: ignore
 
 if TYPE_CHECKING:  # pragma: no cover - for type checking only
     from .startup import StartupReport
 
-
-@dataclass
+_REQUIREMENT_RE = re.compile(r"^([A-Za-z0-9_.-]+)\s*([<>=!~]+\s*.+)?$")
+_COMPARATOR_RE = re.compile(r"^(>=|<=|==|>|<|~=)?\s*(.+)$")
+_DIGITS_RE = re.compile(r"\d+")
+
+# Ein einziger translate()-Durchlauf ersetzt alle Zeichen, die html.escape()
+# (mit quote=True) maskiert.
+_HTML_TRANS = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+# Pfade, die die Diagnose prüft, mit ihrer Art (Ordner oder Datei).
+_PATH_SPECS: Tuple[Tuple[Path, str], ...] = (
+    (Path("data"), "folder"),
+    (Path("logs"), "folder"),
+    (Path("data/backups"), "folder"),
+    (Path("data/exports"), "folder"),
+    (Path("data/converted_audio"), "folder"),
+    (Path("logs/startup.log"), "file"),
+)
+# Zweck bekannter Pakete; alle anderen gelten als allgemeine Abhängigkeit.
+_PURPOSE_MAP: Mapping[str, str] = MappingProxyType({"simpleaudio": "Audiowiedergabe"})
+# ``~=`` wird vereinfacht als Mindestversion geprüft.
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "~=": operator.ge,
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PackageStatus:
     """Status information for a required package."""
 
@@ -49,7 +85,7 @@ class PackageStatus:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PathStatus:
     """Represent a path check (Ordner oder Datei)."""
 
@@ -67,7 +103,7 @@ class PathStatus:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DiagnosticsReport:
     """Container for the collected diagnostics values."""
 
@@ -79,106 +115,44 @@ class DiagnosticsReport:
     summary: Dict[str, object]
     startup: Dict[str, object]
     html_report_path: str = ""
+    _cached_dict: Optional[Dict[str, object]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def to_dict(self) -> Dict[str, object]:
-        return {
-            "generated_at": self.generated_at,
-            "python": self.python,
-            "virtualenv": self.virtualenv,
-            "paths": self.paths,
-            "packages": self.packages,
-            "summary": self.summary,
-            "startup": self.startup,
-            "html_report_path": self.html_report_path,
-        }
-
-
-class DiagnosticsManager:
-    """Collect and persist diagnostic information for professional support."""
-
-    TARGET_FILE = Path("data/diagnostics_report.json")
-
-    def __init__(self) -> None:
-        self.logger = get_logger("core.diagnostics")
-
-    # ------------------------------------------------------------------
-    def collect(self, report: Optional["StartupReport"] = None) -> DiagnosticsReport:
-        """Gather environment, dependency, and path status information."""
-
-        generated_at = dt.datetime.now().isoformat()
-        python_info = {
-            "version": sys.version.split()[0],
-            "executable": sys.executable,
-            "implementation": platform.python_implementation(),
-            "platform": platform.platform(),
-            "cwd": str(Path.cwd()),
-            "fs_encoding": sys.getfilesystemencoding(),
-        }
-
-        virtualenv_info = self._collect_virtualenv_info()
-        path_checks = list(self._collect_paths())
-        package_checks = list(self._collect_packages())
-
-        summary = self._build_summary(virtualenv_info, path_checks, package_checks)
-        startup_snapshot = self._build_startup_snapshot(report)
-
-        diagnostics = DiagnosticsReport(
-            generated_at=generated_at,
-            python=python_info,
-            virtualenv=virtualenv_info,
-            paths=[status.to_dict() for status in path_checks],
-            packages=[status.to_dict() for status in package_checks],
-            summary=summary,
-            startup=startup_snapshot,
-        )
-        return diagnostics
-
-    # ------------------------------------------------------------------
-    def save(self, diagnostics: DiagnosticsReport) -> Path:
-        """Persist the diagnostics report to the default JSON file."""
-
-        target = self.TARGET_FILE
-        payload = diagnostics.to_dict()
-        if atomic_write_json(target, payload, logger=self.logger):
-            self.logger.info("Diagnosebericht gespeichert: %s", target)
-        else:
-            self.logger.error("Diagnosebericht konnte nicht gespeichert werden: %s", target)
-        return target
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_cached_dict":
+            # Jede Feldänderung macht das zwischengespeicherte Dictionary ungültig.
+            object.__setattr__(self, "_cached_dict", None)
 
-    # ------------------------------------------------------------------
-    def export_html(self, diagnostics: DiagnosticsReport) -> Path:
-        """Create an accessible HTML snapshot of the diagnostics."""
-
-        target = Path("data/diagnostics_report.html")
-        target.parent.mkdir(parents=True, exist_ok=True)
-        summary = diagnostics.summary if isinstance(diagnostics.summary, dict) else {}
-        issues = summary.get("issues", [])
-        recommendations = summary.get("recommendations", [])
-
-        def _render_rows(entries: Sequence[Dict[str, object]], keys: Sequence[str]) -> str:
-            rows: List[str] = []
-            for entry in entries:
-                cells = []
-                for key in keys:
-                    value = entry.get(key, "") if isinstance(entry, dict) else ""
-                    cells.append(f"<td>{html.escape(str(value))}</td>")
-                rows.append("<tr>" + "".join(cells) + "</tr>")
-            return "\n".join(rows)
-
-        package_rows = _render_rows(
-            diagnostics.packages,
-            ["name", "version", "required", "installed", "meets_requirement", "message"],
-        )
-        path_rows = _render_rows(
-            diagnostics.paths,
-            ["path", "kind", "exists", "writable"],
-        )
-
-        html_payload = f"""
+    def to_dict(self) -> Dict[str, object]:
+        """Return the report as a dictionary.
+
+        ``save``, the startup report and other consumers share the same
+        dictionary until a field is reassigned; treat it as read-only.
+        """
+
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "generated_at": self.generated_at,
+                "python": self.python,
+                "virtualenv": self.virtualenv,
+                "paths": self.paths,
+                "packages": self.packages,
+                "summary": self.summary,
+                "startup": self.startup,
+                "html_report_path": self.html_report_path,
+            }
+        return self._cached_dict
+
+
+# Seitenvorlage für export_html(); wird per str.format befüllt, alle
+# eingesetzten Werte sind bereits HTML-maskiert.
+_HTML_TEMPLATE = """
 <!DOCTYPE html>
-<html lang=\"de\">
+<html lang="de">
   <head>
-    <meta charset=\"utf-8\" />
+    <meta charset="utf-8" />
     <title>STEP-BY-STEP – Systemdiagnose</title>
     <style>
       body {{ font-family: 'Segoe UI', Arial, sans-serif; background: #0f0f0f; color: #f4f4f4; margin: 2rem; }}
@@ -194,26 +168,26 @@ class DiagnosticsManager:
   </head>
   <body>
     <h1>Systemdiagnose</h1>
-    <p>Erstellt am <strong>{html.escape(diagnostics.generated_at)}</strong></p>
+    <p>Erstellt am <strong>{generated_at}</strong></p>
 
     <h2>Python</h2>
     <ul>
-      <li>Version: <code>{html.escape(diagnostics.python.get('version', ''))}</code></li>
-      <li>Interpreter: {html.escape(diagnostics.python.get('executable', ''))}</li>
-      <li>Implementierung: {html.escape(diagnostics.python.get('implementation', ''))}</li>
-      <li>Plattform: {html.escape(diagnostics.python.get('platform', ''))}</li>
+      <li>Version: <code>{python_version}</code></li>
+      <li>Interpreter: {executable}</li>
+      <li>Implementierung: {implementation}</li>
+      <li>Plattform: {platform}</li>
     </ul>
 
     <h2>Virtuelle Umgebung</h2>
-    <p>Status: <strong class=\"{'ok' if diagnostics.virtualenv.get('active') else 'warn'}\">{ 'aktiv' if diagnostics.virtualenv.get('active') else 'nicht aktiv' }</strong></p>
+    <p>Status: <strong class="{venv_class}">{venv_label}</strong></p>
     <ul>
-      <li>Erwarteter Pfad: {html.escape(diagnostics.virtualenv.get('expected_path', ''))}</li>
-      <li>Aktueller Prefix: {html.escape(diagnostics.virtualenv.get('current_prefix', ''))}</li>
-      <li>Umgebungsvariable: {html.escape(diagnostics.virtualenv.get('environment_path', ''))}</li>
+      <li>Erwarteter Pfad: {expected_path}</li>
+      <li>Aktueller Prefix: {current_prefix}</li>
+      <li>Umgebungsvariable: {environment_path}</li>
     </ul>
 
     <h2>Pfadprüfung</h2>
-    <table aria-label=\"Pfadstatus\">
+    <table aria-label="Pfadstatus">
       <thead><tr><th>Pfad</th><th>Typ</th><th>Vorhanden</th><th>Schreibbar</th></tr></thead>
       <tbody>
         {path_rows}
@@ -221,7 +195,7 @@ class DiagnosticsManager:
     </table>
 
     <h2>Pakete</h2>
-    <table aria-label=\"Paketstatus\">
+    <table aria-label="Paketstatus">
       <thead><tr><th>Paket</th><th>Installierte Version</th><th>Vorgabe</th><th>Installiert</th><th>Version ok</th><th>Hinweis</th></tr></thead>
       <tbody>
         {package_rows}
@@ -229,23 +203,122 @@ class DiagnosticsManager:
     </table>
 
     <h2>Zusammenfassung</h2>
-    <p>Status: <strong class=\"{'ok' if summary.get('status') == 'ok' else 'warn'}\">{html.escape(summary.get('status', 'unbekannt'))}</strong></p>
+    <p>Status: <strong class="{summary_class}">{summary_status}</strong></p>
     <h3>Hinweise</h3>
     <ul>
-      {''.join(f'<li>{html.escape(item)}</li>' for item in issues) or '<li>Keine Hinweise</li>'}
+      {issue_items}
     </ul>
     <h3>Empfehlungen</h3>
     <ul>
-      {''.join(f'<li>{html.escape(item)}</li>' for item in recommendations) or '<li>Keine Empfehlungen</li>'}
+      {recommendation_items}
     </ul>
 
     <h2>Startlauf</h2>
-    <pre>{html.escape(json.dumps(diagnostics.startup, indent=2, ensure_ascii=False))}</pre>
+    <pre>{startup_json}</pre>
   </body>
 </html>
 """
 
-        if atomic_write_text(target, html_payload, logger=self.logger):
+
+class DiagnosticsManager:
+    """Collect and persist diagnostic information for professional support."""
+
+    TARGET_FILE = Path("data/diagnostics_report.json")
+
+    @cached_property
+    def logger(self) -> logging.Logger:
+        # Erst beim ersten Logeintrag anlegen – reine Datensammler brauchen ihn nicht.
+        return get_logger("core.diagnostics")
+
+    # ------------------------------------------------------------------
+    def collect(self, report: Optional["StartupReport"] = None) -> DiagnosticsReport:
+        """Gather environment, dependency, and path status information."""
+
+        # Sekundengenau genügt für Anzeige und Bericht.
+        generated_at = dt.datetime.now().isoformat(timespec="seconds")
+        # Nur der Arbeitsordner kann sich während des Programmlaufs ändern.
+        python_info = {**_python_info(), "cwd": str(Path.cwd())}
+
+        # Die drei Prüfungen warten überwiegend auf das Dateisystem und laufen
+        # daher nebeneinander.
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="diagnostics") as pool:
+            virtualenv_future = pool.submit(self._collect_virtualenv_info)
+            paths_future = pool.submit(list, self._collect_paths())
+            packages_future = pool.submit(list, self._collect_packages())
+            virtualenv_info = virtualenv_future.result()
+            path_checks: List[PathStatus] = paths_future.result()
+            package_checks: List[PackageStatus] = packages_future.result()
+
+        summary = self._build_summary(virtualenv_info, path_checks, package_checks)
+        startup_snapshot = self._build_startup_snapshot(report)
+
+        diagnostics = DiagnosticsReport(
+            generated_at=generated_at,
+            python=python_info,
+            virtualenv=virtualenv_info,
+            paths=[status.to_dict() for status in path_checks],
+            packages=[status.to_dict() for status in package_checks],
+            summary=summary,
+            startup=startup_snapshot,
+        )
+        return diagnostics
+
+    # ------------------------------------------------------------------
+    def save(self, diagnostics: DiagnosticsReport) -> Path:
+        """Persist the diagnostics report to the default JSON file."""
+
+        target = self.TARGET_FILE
+        try:
+            data = dumps_json(diagnostics.to_dict())
+        except (TypeError, ValueError) as error:
+            self.logger.error("JSON konnte nicht serialisiert werden: %s", error)
+            written = False
+        else:
+            written = atomic_write_bytes(target, data, logger=self.logger)
+        if written:
+            self.logger.info("Diagnosebericht gespeichert: %s", target)
+        else:
+            self.logger.error("Diagnosebericht konnte nicht gespeichert werden: %s", target)
+        return target
+
+    # ------------------------------------------------------------------
+    def export_html(self, diagnostics: DiagnosticsReport) -> Path:
+        """Create an accessible HTML snapshot of the diagnostics."""
+
+        target = Path("data/diagnostics_report.html")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        summary = diagnostics.summary if isinstance(diagnostics.summary, dict) else {}
+        issues = summary.get("issues", [])
+        recommendations = summary.get("recommendations", [])
+        startup_json = dumps_json(diagnostics.startup).decode("utf-8")
+
+        package_rows = "\n".join([_format_package_row(entry) for entry in diagnostics.packages])
+        path_rows = "\n".join([_format_path_row(entry) for entry in diagnostics.paths])
+
+        virtualenv = diagnostics.virtualenv
+        python_info = diagnostics.python
+        venv_active = bool(virtualenv.get("active"))
+        html_payload = _HTML_TEMPLATE.format(
+            generated_at=_esc(diagnostics.generated_at),
+            python_version=_esc(python_info.get("version", "")),
+            executable=_esc(python_info.get("executable", "")),
+            implementation=_esc(python_info.get("implementation", "")),
+            platform=_esc(python_info.get("platform", "")),
+            venv_class="ok" if venv_active else "warn",
+            venv_label="aktiv" if venv_active else "nicht aktiv",
+            expected_path=_esc(virtualenv.get("expected_path", "")),
+            current_prefix=_esc(virtualenv.get("current_prefix", "")),
+            environment_path=_esc(virtualenv.get("environment_path", "")),
+            path_rows=path_rows,
+            package_rows=package_rows,
+            summary_class="ok" if summary.get("status") == "ok" else "warn",
+            summary_status=_esc(summary.get("status", "unbekannt")),
+            issue_items=_list_items(issues, "Keine Hinweise"),
+            recommendation_items=_list_items(recommendations, "Keine Empfehlungen"),
+            startup_json=_esc(startup_json),
+        )
+
+        if atomic_write_bytes(target, html_payload.encode("utf-8"), logger=self.logger):
             self.logger.info("Diagnosebericht (HTML) gespeichert: %s", target)
         else:
             self.logger.error("Diagnosebericht (HTML) konnte nicht gespeichert werden: %s", target)
@@ -286,7 +359,7 @@ class DiagnosticsManager:
 
         missing_packages = [pkg["name"] for pkg in packages if not pkg.get("installed")]
         if missing_packages:
-            names = ", ".join(sorted(missing_packages))
+            names = ", ".join(missing_packages)
             lines.append(f"Fehlende Pakete: {names}.")
         outdated_packages = [
             pkg["name"]
@@ -294,7 +367,7 @@ class DiagnosticsManager:
             if pkg.get("installed") and not pkg.get("meets_requirement", True)
         ]
         if outdated_packages:
-            names = ", ".join(sorted(outdated_packages))
+            names = ", ".join(outdated_packages)
             lines.append(
                 f"Versionsabweichung erkannt bei: {names} (Version kleiner als Vorgabe)."
             )
@@ -306,17 +379,15 @@ class DiagnosticsManager:
 
     # ------------------------------------------------------------------
     def _collect_virtualenv_info(self) -> Dict[str, object]:
-        expected_path = Path(".venv").resolve()
+        expected_path = _expected_venv(os.getcwd())
         env_path_raw = os.environ.get("VIRTUAL_ENV")
         env_path = Path(env_path_raw).resolve() if env_path_raw else None
-        try:
-            current_prefix = Path(sys.prefix).resolve()
-        except Exception:  # pragma: no cover - defensive fallback
-            current_prefix = Path(sys.prefix)
+        current_prefix = _current_prefix()
 
-        active = expected_path.exists() and (
-            current_prefix == expected_path or (env_path and env_path == expected_path)
-        )
+        # Die Existenzprüfung (ein weiterer stat-Aufruf) nur, wenn ein Pfad passt.
+        active = (
+            current_prefix == expected_path or env_path == expected_path
+        ) and expected_path.exists()
         return {
             "active": active,
             "expected_path": str(expected_path),
@@ -326,31 +397,45 @@ class DiagnosticsManager:
 
     # ------------------------------------------------------------------
     def _collect_paths(self) -> Iterable[PathStatus]:
-        for raw_path, kind in (
-            (Path("data"), "folder"),
-            (Path("logs"), "folder"),
-            (Path("data/backups"), "folder"),
-            (Path("data/exports"), "folder"),
-            (Path("data/converted_audio"), "folder"),
-            (Path("logs/startup.log"), "file"),
-        ):
-            exists = raw_path.exists()
-            writable = os.access(raw_path if exists else raw_path.parent, os.W_OK)
+        """Check the required paths with one directory listing per parent.
+
+        Missing paths report whether their parent folder is writable, so that
+        access check is also done only once per parent.
+        """
+
+        listings: Dict[Path, Optional[Dict[str, os.DirEntry]]] = {}
+        parent_writable: Dict[Path, bool] = {}
+        for raw_path, kind in _PATH_SPECS:
+            parent = raw_path.parent
+            if parent not in listings:
+                listings[parent] = _list_directory(parent)
+            entries = listings[parent]
+            if entries is None:
+                exists = raw_path.exists()
+            else:
+                entry = entries.get(raw_path.name)
+                # Symlinks zählen nur, wenn ihr Ziel existiert (wie Path.exists).
+                exists = entry is not None and (not entry.is_symlink() or raw_path.exists())
+            if exists:
+                writable = os.access(raw_path, os.W_OK)
+            else:
+                if parent not in parent_writable:
+                    parent_writable[parent] = os.access(parent, os.W_OK)
+                writable = parent_writable[parent]
             yield PathStatus(path=raw_path, exists=exists, writable=writable, kind=kind)
 
     # ------------------------------------------------------------------
     def _collect_packages(self) -> Iterable[PackageStatus]:
-        purpose_map: Dict[str, str] = {
-            "simpleaudio": "Audiowiedergabe",
-        }
-        requirements = self._parse_requirements()
-        package_names = sorted({*purpose_map.keys(), *requirements.keys()})
-
-        for package in package_names:
-            purpose = purpose_map.get(package, "Abhängigkeit")
-            required_spec = requirements.get(package, "")
-            try:
-                version = importlib_metadata.version(package)
+        """Yield one status per package, sorted by name.
+
+        ``summary_lines`` relies on this order and does not sort again.
+        """
+
+        installed = installed_versions()
+
+        for package, purpose, required_spec in _package_plan(*self._requirements_source()):
+            version = installed.get(canonical_name(package))
+            if version is not None:
                 meets_requirement, hint = self._check_requirement(version, required_spec)
                 message = hint or "Paket verfügbar."
                 yield PackageStatus(
@@ -362,7 +447,7 @@ class DiagnosticsManager:
                     meets_requirement=meets_requirement,
                     message=message,
                 )
-            except importlib_metadata.PackageNotFoundError:
+            else:
                 required_text = f" – benötigt {required_spec}" if required_spec else ""
                 yield PackageStatus(
                     name=package,
@@ -436,64 +521,176 @@ class DiagnosticsManager:
         }
 
     # ------------------------------------------------------------------
-    def _parse_requirements(self) -> Dict[str, str]:
-        requirements: Dict[str, str] = {}
+    def _parse_requirements(self) -> Mapping[str, str]:
+        path, mtime_ns = self._requirements_source()
+        if not path:
+            return {}
+        return _read_requirements(path, mtime_ns)
+
+    def _requirements_source(self) -> Tuple[str, int]:
+        """Cache key for ``requirements.txt``: absolute path and mtime (or ``("", 0)``)."""
+
         requirements_file = Path("requirements.txt")
-        if not requirements_file.exists():
-            return requirements
-        for line in requirements_file.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            match = re.match(r"^([A-Za-z0-9_.-]+)\s*([<>=!~]+\s*.+)?$", line)
-            if not match:
-                continue
-            name = match.group(1)
-            spec = (match.group(2) or "").strip()
-            requirements[name] = spec
-        return requirements
+        try:
+            mtime_ns = requirements_file.stat().st_mtime_ns
+        except OSError:
+            return "", 0
+        return os.path.abspath(requirements_file), mtime_ns
 
     # ------------------------------------------------------------------
     def _check_requirement(self, current: str, spec: str) -> Tuple[bool, str]:
         if not spec:
             return True, ""
-        comparator_match = re.match(r"^(>=|<=|==|>|<|~=)?\s*(.+)$", spec)
+        comparator_match = _COMPARATOR_RE.match(spec)
         if not comparator_match:
             return True, ""
         comparator = comparator_match.group(1) or ">="
-        required_version = comparator_match.group(2)
-        current_version = self._parse_version(current)
-        target_version = self._parse_version(required_version)
-        comparison = self._compare_versions(current_version, target_version)
-
-        operations = {
-            ">": comparison > 0,
-            ">=": comparison >= 0,
-            "<": comparison < 0,
-            "<=": comparison <= 0,
-            "==": comparison == 0,
-            "~=": comparison >= 0,
-        }
-        meets = operations.get(comparator, True)
-        if meets:
+        compare = _COMPARATORS.get(comparator)
+        if compare is None:
+            return True, ""
+        # Umgebungsmarker (``; platform_system != "Linux"``) gehören nicht zur Version.
+        required_version = comparator_match.group(2).split(";", 1)[0].strip()
+        if compare(*_comparable_versions(current, required_version)):
             return True, ""
         return False, f"Version {current} erfüllt Vorgabe {spec} nicht."
 
-    def _parse_version(self, value: str) -> Tuple[int, ...]:
-        parts = re.findall(r"\d+", value)
-        if not parts:
-            return (0,)
-        return tuple(int(part) for part in parts)
-
-    def _compare_versions(self, current: Tuple[int, ...], target: Tuple[int, ...]) -> int:
-        length = max(len(current), len(target))
-        current_extended = current + (0,) * (length - len(current))
-        target_extended = target + (0,) * (length - len(target))
-        if current_extended > target_extended:
-            return 1
-        if current_extended < target_extended:
-            return -1
-        return 0
+
+def _comparable_versions(current: str, required: str) -> Tuple[Any, Any]:
+    """Return both versions as comparable objects.
+
+    ``packaging.version.Version`` handles pre-releases and local versions
+    correctly; without it (or for non PEP 440 strings) the numeric parts are
+    compared as zero-padded tuples.
+    """
+
+    if Version is not None:
+        try:
+            return Version(current), Version(required)
+        except InvalidVersion:
+            pass
+    current_parts = tuple(int(part) for part in _DIGITS_RE.findall(current)) or (0,)
+    required_parts = tuple(int(part) for part in _DIGITS_RE.findall(required)) or (0,)
+    length = max(len(current_parts), len(required_parts))
+    return (
+        current_parts + (0,) * (length - len(current_parts)),
+        required_parts + (0,) * (length - len(required_parts)),
+    )
+
+
+@lru_cache(maxsize=1)
+def _python_info() -> Mapping[str, str]:
+    """Interpreter details that stay fixed for the whole process.
+
+    ``platform.platform()`` may call ``uname`` and is therefore asked only
+    once; ``platform`` itself is imported on first use.
+    """
+
+    import platform
+
+    return MappingProxyType(
+        {
+            "version": sys.version.split()[0],
+            "executable": sys.executable,
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "fs_encoding": sys.getfilesystemencoding(),
+        }
+    )
+
+
+# Weder sys.prefix noch (je Arbeitsordner) der erwartete .venv-Pfad ändern sich
+# während eines Programmlaufs; realpath() muss daher nur einmal laufen.
+@lru_cache(maxsize=4)
+def _expected_venv(cwd: str) -> Path:
+    return (Path(cwd) / ".venv").resolve()
+
+
+@lru_cache(maxsize=1)
+def _current_prefix() -> Path:
+    try:
+        return Path(sys.prefix).resolve()
+    except Exception:  # pragma: no cover - defensive fallback
+        return Path(sys.prefix)
+
+
+def _list_directory(folder: Path) -> Optional[Dict[str, os.DirEntry]]:
+    """Return the entries of *folder* by name, or ``None`` if it cannot be listed."""
+
+    try:
+        with os.scandir(folder) as iterator:
+            return {entry.name: entry for entry in iterator}
+    except OSError:
+        return None
+
+
+def _esc(value: object) -> str:
+    return str(value).translate(_HTML_TRANS)
+
+
+def _row_formatter(keys: Sequence[str]) -> Callable[[object], str]:
+    """Build a formatter for table rows with a fixed column layout.
+
+    The ``<tr>``/``<td>`` skeleton and the key lookup are prepared once, so a
+    row is a single itemgetter call, one ``map`` over the cells and one
+    ``str.format``.
+    """
+
+    template = "<tr>" + "<td>{}</td>" * len(keys) + "</tr>"
+    getter = operator.itemgetter(*keys)
+
+    def format_row(entry: object) -> str:
+        try:
+            values = getter(entry)
+        except (KeyError, TypeError):  # unvollständige oder fremde Einträge
+            values = tuple(entry.get(key, "") if isinstance(entry, dict) else "" for key in keys)
+        return template.format(*map(_esc, values))
+
+    return format_row
+
+
+_format_package_row = _row_formatter(
+    ("name", "version", "required", "installed", "meets_requirement", "message")
+)
+_format_path_row = _row_formatter(("path", "kind", "exists", "writable"))
+
+
+def _list_items(items: Sequence[str], empty_text: str) -> str:
+    if not items:
+        return f"<li>{empty_text}</li>"
+    return "".join([f"<li>{_esc(item)}</li>" for item in items])
+
+
+@lru_cache(maxsize=1)
+def _read_requirements(path: str, mtime_ns: int) -> Mapping[str, str]:
+    """Parse ``requirements.txt``; cached until the file's mtime changes.
+
+    The returned mapping is shared between calls and must not be modified.
+    """
+
+    requirements: Dict[str, str] = {}
+    for line in Path(path).read_bytes().decode("utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = _REQUIREMENT_RE.match(line)
+        if not match:
+            continue
+        requirements[match.group(1)] = (match.group(2) or "").strip()
+    return MappingProxyType(requirements)
+
+
+@lru_cache(maxsize=4)
+def _package_plan(path: str, mtime_ns: int) -> Tuple[Tuple[str, str, str], ...]:
+    """Return ``(package, purpose, required_spec)`` for every package, sorted by name.
+
+    Like the parsed requirements, the plan only changes with the file.
+    """
+
+    requirements = _read_requirements(path, mtime_ns) if path else {}
+    return tuple(
+        (package, _PURPOSE_MAP.get(package, "Abhängigkeit"), requirements.get(package, ""))
+        for package in sorted({*_PURPOSE_MAP, *requirements})
+    )
 
 
 __all__ = ["DiagnosticsManager", "DiagnosticsReport", "PackageStatus", "PathStatus"]
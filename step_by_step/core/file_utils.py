@@ -2,52 +2,85 @@
 
 from __future__ import annotations
 
+import codecs
+import errno
 import json
 import logging
 import os
+import sys
 import tempfile
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Mapping, Optional
+
+try:  # pragma: no cover - optional dependency handled dynamically
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback
+    orjson = None  # type: ignore
 
 DEFAULT_ENCODING = "utf-8"
 
+# Fehlercodes, mit denen ``O_TMPFILE``/``linkat`` signalisieren, dass der Weg
+# hier nicht verfügbar ist (altes Kernel, NFS, fehlendes /proc, Sandbox).
+_TMPFILE_UNSUPPORTED = frozenset(
+    {errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL, errno.ENOENT, errno.EXDEV, errno.EPERM}
+)
+_tmpfile_supported = sys.platform.startswith("linux") and hasattr(os, "O_TMPFILE")
 
-def atomic_write_text(
+
+def dumps_json(payload: Any) -> bytes:
+    """Serialise ``payload`` as indented UTF-8 JSON.
+
+    Uses the C serialiser ``orjson`` when it is installed (extra ``fast``) and
+    falls back to the standard library otherwise. Both indent by two spaces
+    and keep non-ASCII text, but details differ: ``orjson`` writes NaN and
+    infinity as ``null`` and may format floats differently. Read-only
+    mappings (z.B. ``MappingProxyType``) are accepted as well.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            default=_plain_mapping,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(payload, indent=2, ensure_ascii=False, default=_plain_mapping).encode(
+        DEFAULT_ENCODING
+    )
+
+
+def _plain_mapping(value: Any) -> Dict[Any, Any]:
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def atomic_write_bytes(
     target_path: Path,
-    content: str,
+    data: bytes,
     *,
-    encoding: str = DEFAULT_ENCODING,
+    durable: bool = True,
     logger: Optional[logging.Logger] = None,
 ) -> bool:
-    """Write ``content`` atomically to ``target_path``.
+    """Write ``data`` atomically to ``target_path``.
 
     The file is written to a temporary location within the same folder first and
     then moved into place.  This protects against partial writes when the
     process is interrupted.  Returns ``True`` on success.
+
+    ``durable=False`` skips the ``fsync`` of the temporary file.  The rename
+    stays atomic – readers see either the old or the new content – but after
+    a power loss the new content may be missing or empty.  Use it only for
+    small, frequently rewritten state files that can be rebuilt.
     """
 
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    handle: Optional[tempfile.NamedTemporaryFile] = None
-    temp_name: Optional[str] = None
 
     try:
-        handle = tempfile.NamedTemporaryFile(
-            "w",
-            encoding=encoding,
-            dir=str(target_path.parent),
-            delete=False,
-        )
-        handle.write(content)
-        handle.flush()
-        os.fsync(handle.fileno())
-        temp_name = handle.name
+        temp_name = _write_temporary(target_path.parent, data, durable)
     except Exception as error:  # pragma: no cover - extremely unlikely edge case
         if logger is not None:
             logger.error("Temporäre Datei konnte nicht geschrieben werden: %s", error)
         return False
-    finally:
-        if handle is not None:
-            handle.close()
 
     try:
         os.replace(temp_name, target_path)
@@ -58,27 +91,136 @@ def atomic_write_text(
             Path(temp_name).unlink(missing_ok=True)
         return False
 
+    if durable:
+        _fsync_directory(target_path.parent)
     return True
 
 
+def _write_temporary(folder: Path, data: bytes, durable: bool) -> str:
+    """Write ``data`` to a new temporary file inside ``folder``; return its name."""
+
+    global _tmpfile_supported
+    if _tmpfile_supported:
+        try:
+            return _write_anonymous(folder, data, durable)
+        except OSError as error:
+            if error.errno not in _TMPFILE_UNSUPPORTED:
+                raise
+            # Kernel, Dateisystem oder Sandbox erlauben den Weg nicht – für den
+            # Rest des Prozesses direkt die klassische Variante nehmen.
+            _tmpfile_supported = False
+
+    with tempfile.NamedTemporaryFile("wb", dir=str(folder), delete=False) as handle:
+        handle.write(data)
+        handle.flush()
+        if durable:
+            os.fsync(handle.fileno())
+    return handle.name
+
+
+def _write_anonymous(folder: Path, data: bytes, durable: bool) -> str:
+    """Linux: fill an unnamed ``O_TMPFILE`` and link it in once it is complete.
+
+    The folder never shows a half-written file, so sync tools (Dropbox, NFS)
+    only notice the finished temporary name and the final rename.
+    """
+
+    fd = os.open(str(folder), os.O_TMPFILE | os.O_WRONLY, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if durable:
+            os.fsync(fd)
+        for _ in range(8):
+            temp_name = str(folder / f".tmp{os.urandom(6).hex()}")
+            try:
+                os.link(f"/proc/self/fd/{fd}", temp_name)
+            except FileExistsError:
+                continue
+            return temp_name
+        raise FileExistsError(errno.EEXIST, "Kein freier temporärer Dateiname", str(folder))
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(folder: Path) -> None:
+    """Flush the directory entry so the rename itself survives a crash.
+
+    Without this, ext4/XFS may show an empty file after a power loss even
+    though ``os.replace`` succeeded.  Windows has no ``O_DIRECTORY``; there
+    the call is skipped.
+    """
+
+    if not hasattr(os, "O_DIRECTORY"):  # pragma: no cover - Windows
+        return
+    try:
+        dirfd = os.open(str(folder), os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(dirfd)
+    except OSError:
+        pass
+    finally:
+        os.close(dirfd)
+
+
+def atomic_write_text(
+    target_path: Path,
+    content: str,
+    *,
+    encoding: str = DEFAULT_ENCODING,
+    durable: bool = True,
+    logger: Optional[logging.Logger] = None,
+) -> bool:
+    """Encode ``content`` and write it atomically (see ``atomic_write_bytes``)."""
+
+    try:
+        data = content.encode(encoding)
+    except (LookupError, UnicodeEncodeError) as error:
+        if logger is not None:
+            logger.error("Text konnte nicht kodiert werden: %s", error)
+        return False
+    return atomic_write_bytes(target_path, data, durable=durable, logger=logger)
+
+
 def atomic_write_json(
     target_path: Path,
     payload: Any,
     *,
     encoding: str = DEFAULT_ENCODING,
+    durable: bool = True,
     logger: Optional[logging.Logger] = None,
 ) -> bool:
     """Serialise ``payload`` as JSON and write it atomically to ``target_path``."""
 
     try:
-        content = json.dumps(payload, indent=2, ensure_ascii=False)
+        data = dumps_json(payload)
     except (TypeError, ValueError) as error:
         if logger is not None:
             logger.error("JSON konnte nicht serialisiert werden: %s", error)
         return False
 
-    return atomic_write_text(target_path, content, encoding=encoding, logger=logger)
+    if not _is_utf8(encoding):
+        return atomic_write_text(
+            target_path,
+            data.decode(DEFAULT_ENCODING),
+            encoding=encoding,
+            durable=durable,
+            logger=logger,
+        )
+    return atomic_write_bytes(target_path, data, durable=durable, logger=logger)
+
+
+def _is_utf8(encoding: str) -> bool:
+    """True if ``encoding`` names UTF-8 under any alias (``utf8``, ``UTF_8`` …)."""
+
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
 
 
-__all__ = ["atomic_write_json", "atomic_write_text"]
+__all__ = ["atomic_write_bytes", "atomic_write_json", "atomic_write_text", "dumps_json"]
 
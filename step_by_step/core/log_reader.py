@@ -2,9 +2,31 @@
 
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Blockgröße für das Lesen der Logdatei (64 KiB).
+BUFFER_SIZE = 65536
+
+# So viele Bytes vom Dateiende werden gemerkt, um Rotation/Neuschreiben zu erkennen.
+_MARKER_SIZE = 64
+
+# Nicht-ASCII-Zeichen, deren casefold() ASCII enthält (ß -> ss, ſ -> s, K -> k,
+# ŉ -> ʼn, ﬀ -> ff, İ -> i̇). Blöcke mit diesen Zeichen laufen über den
+# langsameren Textvergleich; ein Test gleicht die Liste mit str.casefold ab.
+_FOLDS_TO_ASCII_CHARS = (
+    "\u00df\u0130\u0149\u017f\u01f0"
+    "\u1e96\u1e97\u1e98\u1e99\u1e9a\u1e9e"
+    "\u212a"
+    "\ufb00\ufb01\ufb02\ufb03\ufb04\ufb05\ufb06"
+)
+_FOLDS_TO_ASCII = re.compile(
+    b"|".join(re.escape(char.encode("utf-8")) for char in _FOLDS_TO_ASCII_CHARS)
+)
 
 
 @dataclass
@@ -21,6 +43,7 @@ class LogReader:
     def __init__(self, file_path: Path) -> None:
         self.file_path = file_path
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tail: Optional[_TailState] = None
 
     # ------------------------------------------------------------------
     def ensure_exists(self) -> None:
@@ -34,36 +57,208 @@ class LogReader:
         """Return the ``limit`` latest lines from the log file."""
 
         self.ensure_exists()
-        lines = self._read_lines()
-        start_index = max(0, len(lines) - limit)
         return [
-            LogEntry(line_number=index + 1, content=line.rstrip("\n"))
-            for index, line in enumerate(lines[start_index:])
+            LogEntry(line_number=index + 1, content=line)
+            for index, line in enumerate(self._tail_lines(limit))
         ]
 
     # ------------------------------------------------------------------
-    def search(self, term: str, limit: int = 50) -> List[LogEntry]:
-        """Return log lines that contain ``term`` (case-insensitive)."""
+    def search(self, term: str, limit: int = 50, *, regex: bool = False) -> List[LogEntry]:
+        """Return log lines that contain ``term`` (case-insensitive).
+
+        With ``regex=True`` the term is treated as a regular expression; an
+        invalid expression raises ``ValueError``.
+        """
 
         self.ensure_exists()
-        term_cf = term.casefold()
-        matches: List[LogEntry] = []
-        if not term_cf:
+        if not term.casefold():
             return self.read_tail(limit=limit)
-        for index, line in enumerate(self._read_lines()):
-            if term_cf in line.casefold():
-                matches.append(LogEntry(line_number=index + 1, content=line.rstrip("\n")))
+        needle, matches_line = _compile_query(term, regex)
+        matches: List[LogEntry] = []
+        line_count = 0
+        for block in self._blocks():
+            if needle is not None and not _FOLDS_TO_ASCII.search(block):
+                found = _find_in_block(block, needle, line_count, limit - len(matches))
+            else:
+                found = _match_in_block(block, matches_line, line_count, limit - len(matches))
+            matches.extend(found)
             if len(matches) >= limit:
                 break
+            line_count += block.count(b"\n")
         return matches
 
     # ------------------------------------------------------------------
-    def _read_lines(self) -> List[str]:
+    def _tail_lines(self, limit: int) -> List[str]:
+        """Read only the end of the file, block by block from the back.
+
+        Memory and I/O grow with ``limit`` instead of the size of the log.
+        The result is remembered: as long as the log only grows, the next call
+        reads just the appended bytes.
+        """
+
+        if limit <= 0:
+            return []
+        with self.file_path.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            state = self._extend_tail(handle, stat, limit)
+            if state is None:
+                state = _read_tail_backwards(handle, stat, limit)
+        self._tail = state
+        return [_decode(line) for line in state.lines]
+
+    # ------------------------------------------------------------------
+    def _extend_tail(self, handle: BinaryIO, stat: os.stat_result, limit: int) -> Optional[_TailState]:
+        """Update the remembered tail with appended data, if that is possible."""
+
+        state = self._tail
+        if (
+            state is None
+            or state.limit != limit
+            or state.file_id != (stat.st_dev, stat.st_ino)
+            or not state.size <= stat.st_size <= state.size + BUFFER_SIZE
+        ):
+            return None
+        # Gleiche Datei (nicht rotiert oder neu geschrieben)? Die letzten
+        # bekannten Bytes müssen noch an derselben Stelle stehen.
+        handle.seek(state.size - len(state.marker))
+        if handle.read(len(state.marker)) != state.marker:
+            return None
+        appended = handle.read()
+        if not appended:
+            return state
+        lines = list(state.lines)
+        pending = b""
+        if lines and not state.marker.endswith(b"\n"):
+            # Letzte Zeile war noch offen (oder endete auf "\r", dem ein "\n"
+            # folgen kann) – zusammen mit den neuen Bytes erneut aufteilen.
+            pending = lines.pop() + (b"\r" if state.marker.endswith(b"\r") else b"")
+        lines.extend((pending + appended).splitlines())
+        return _TailState(
+            file_id=state.file_id,
+            size=handle.tell(),
+            limit=limit,
+            lines=tuple(lines[-limit:]),
+            marker=(state.marker + appended)[-_MARKER_SIZE:],
+        )
+
+    # ------------------------------------------------------------------
+    def _blocks(self) -> Iterator[bytes]:
+        """Yield the file in ``BUFFER_SIZE`` blocks that end on a line break.
+
+        Only the final block may lack the closing newline.
+        """
+
+        carry = b""
+        with self.file_path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(BUFFER_SIZE), b""):
+                block = carry + chunk
+                cut = block.rfind(b"\n") + 1
+                carry = block[cut:]
+                if cut:
+                    yield block[:cut]
+        if carry:
+            yield carry
+
+
+class _TailState(NamedTuple):
+    """Remembered end of a log file (see ``LogReader._tail_lines``)."""
+
+    file_id: Tuple[int, int]
+    size: int
+    limit: int
+    lines: Tuple[bytes, ...]
+    marker: bytes
+
+
+def _read_tail_backwards(handle: BinaryIO, stat: os.stat_result, limit: int) -> _TailState:
+    chunks: List[bytes] = []
+    newlines = 0
+    position = stat.st_size
+    # Ein Zeilenumbruch mehr als nötig garantiert, dass die erste der
+    # gewünschten Zeilen vollständig im Puffer liegt.
+    while position > 0 and newlines <= limit:
+        step = min(BUFFER_SIZE, position)
+        position -= step
+        handle.seek(position)
+        chunk = handle.read(step)
+        newlines += chunk.count(b"\n")
+        chunks.append(chunk)
+    data = b"".join(reversed(chunks))
+    return _TailState(
+        file_id=(stat.st_dev, stat.st_ino),
+        size=stat.st_size,
+        limit=limit,
+        lines=tuple(data.splitlines()[-limit:]),
+        marker=data[-_MARKER_SIZE:],
+    )
+
+
+def _find_in_block(block: bytes, needle: bytes, line_count: int, limit: int) -> List[LogEntry]:
+    """Byte search for an ASCII ``needle``; ``line_count`` lines precede ``block``."""
+
+    matches: List[LogEntry] = []
+    lowered = block.lower()
+    counted = 0
+    hit = lowered.find(needle)
+    while hit != -1 and len(matches) < limit:
+        start = lowered.rfind(b"\n", 0, hit) + 1
+        end = lowered.find(b"\n", hit)
+        if end == -1:
+            end = len(block)
+        line_count += block.count(b"\n", counted, start)
+        counted = start
+        matches.append(
+            LogEntry(line_number=line_count + 1, content=_decode(block[start:end]).rstrip("\r"))
+        )
+        hit = lowered.find(needle, end + 1)
+    return matches
+
+
+@lru_cache(maxsize=64)
+def _compile_query(term: str, regex: bool) -> Tuple[Optional[bytes], Callable[[str], bool]]:
+    """Prepare a search term once; repeated UI searches reuse the result.
+
+    Returns the ASCII byte needle for the fast block search (``None`` if the
+    term needs the line-wise comparison) and a predicate for single lines.
+    """
+
+    if regex:
         try:
-            return self.file_path.read_text(encoding="utf-8").splitlines()
-        except UnicodeDecodeError:
-            # Fallback: read as latin-1 to avoid crashes and still show lines
-            return self.file_path.read_text(encoding="latin-1").splitlines()
+            pattern = re.compile(term, re.IGNORECASE)
+        except re.error as error:
+            raise ValueError(f"Ungültiger Suchausdruck '{term}': {error}") from error
+        return None, lambda line: pattern.search(line) is not None
+    # ASCII-Begriffe werden direkt in den Bytes gesucht; nur Trefferzeilen
+    # werden dekodiert.
+    term_cf = term.casefold()
+    needle = term_cf.encode("ascii") if term_cf.isascii() else None
+    return needle, lambda line: term_cf in line.casefold()
+
+
+def _match_in_block(
+    block: bytes, matches_line: Callable[[str], bool], line_count: int, limit: int
+) -> List[LogEntry]:
+    """Decode and test ``block`` line by line (regex, non-ASCII terms, ß etc.)."""
+
+    matches: List[LogEntry] = []
+    lines = block.split(b"\n")
+    if block.endswith(b"\n"):
+        lines.pop()
+    for number, raw in enumerate(lines, start=line_count + 1):
+        line = _decode(raw).rstrip("\r")
+        if matches_line(line):
+            matches.append(LogEntry(line_number=number, content=line))
+            if len(matches) >= limit:
+                break
+    return matches
+
+
+def _decode(raw: bytes) -> str:
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        # Fallback: read as latin-1 to avoid crashes and still show lines
+        return raw.decode("latin-1")
 
 
 __all__ = ["LogEntry", "LogReader"]
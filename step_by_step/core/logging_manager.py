@@ -2,19 +2,33 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
 LOG_DIR = Path("logs")
 DEFAULT_LOG_FILE = LOG_DIR / "tool.log"
 
+# Anzahl gepufferter Meldungen, bevor die Logdatei geschrieben wird.
+FILE_BUFFER_CAPACITY = 1024
+
+_listener: Optional[QueueListener] = None
+
+# Das Format nutzt weder Thread- noch Prozessangaben; ohne diese Felder wird
+# jeder LogRecord schneller erzeugt.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 
 def setup_logging(log_file: Path = DEFAULT_LOG_FILE) -> logging.Logger:
     """Configure a root logger with console and file output."""
 
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
     logger = logging.getLogger("step_by_step")
     if logger.handlers:
         return logger
@@ -26,25 +40,84 @@ def setup_logging(log_file: Path = DEFAULT_LOG_FILE) -> logging.Logger:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    file_handler = RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=3)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # Aufrufer legen Meldungen nur in eine Warteschlange; Datei und Konsole
+    # schreibt ein eigener Hintergrund-Thread.
+    global _listener
+    queue_handler = QueueHandler(queue.SimpleQueue())
+    _listener = QueueListener(
+        queue_handler.queue,
+        _buffered_file_handler(log_file, formatter),
+        console_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
+    # atexit läuft rückwärts: erst die Warteschlange leeren, danach schließt
+    # logging.shutdown die Handler.
+    atexit.register(_listener.stop)
+    logger.addHandler(queue_handler)
 
     logger.debug("Logging initialised")
     return logger
 
 
+def flush_logging() -> None:
+    """Write every queued and buffered record to its destination now.
+
+    Needed before the process is replaced (``os.execvp``): neither the
+    listener thread nor the ``atexit`` hooks get to run afterwards.  The
+    listener is stopped, which drains the queue, its handlers are flushed
+    (the memory buffer passes its records on to the log file) and the
+    listener is started again so that logging keeps working if the caller
+    continues, e.g. because the exec failed.
+    """
+
+    listener = _listener
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+        target = getattr(handler, "target", None)
+        if target is not None:
+            target.flush()
+    listener.start()
+
+
+def _buffered_file_handler(log_file: Path, formatter: logging.Formatter) -> MemoryHandler:
+    """Rotating log file behind a memory buffer.
+
+    DEBUG/INFO records are collected and written in batches; a WARNING or
+    higher flushes the buffer immediately.  ``logging.shutdown`` (registered
+    by the logging module at exit) flushes the rest; a process that is
+    replaced via exec has to call ``flush_logging`` first.
+    """
+
+    file_handler = RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=3)
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+
+    buffered = MemoryHandler(
+        capacity=FILE_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+    )
+    buffered.setLevel(logging.DEBUG)
+    return buffered
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
-    """Return a configured logger; create configuration if needed."""
+    """Return a configured logger; create configuration if needed.
+
+    Results are memoised, because loggers are process-wide singletons anyway.
+    """
 
     root_logger = setup_logging()
     return root_logger if name is None else root_logger.getChild(name)
 
 
-__all__ = ["get_logger", "setup_logging", "DEFAULT_LOG_FILE"]
+__all__ = ["get_logger", "setup_logging", "flush_logging", "DEFAULT_LOG_FILE"]
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Callable, Dict, Iterable, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Mapping, Tuple
 
 from .defaults import DEFAULT_SETTINGS
+from .file_utils import dumps_json
 
 # Pfade (paths) für dauerhaft benötigte Ordner.
 REQUIRED_FOLDERS: Tuple[Path, ...] = (
@@ -24,7 +25,7 @@ ARCHIVE_DB_PATH = Path("data/archive.db")
 def _dump(payload: object) -> str:
     """Hilfsfunktion zum schönen JSON-Format (indentiert)."""
 
-    return json.dumps(payload, indent=2, ensure_ascii=False)
+    return dumps_json(payload).decode("utf-8")
 
 
 def _settings_template() -> str:
@@ -161,10 +162,19 @@ def _diagnostics_template() -> str:
 
 
 def _security_manifest_template() -> str:
-    return _dump({"files": {}, "created_at": "", "updated_at": ""})
+    return _dump(
+        {
+            "sha256": {},
+            "size": {},
+            "mtime_ns": {},
+            "last_checked": {},
+            "created_at": "",
+            "updated_at": "",
+        }
+    )
 
 
-FILE_TEMPLATES: Dict[Path, Callable[[], str]] = {
+_TEMPLATE_FACTORIES: Dict[Path, Callable[[], str]] = {
     Path("data/settings.json"): _settings_template,
     Path("data/todo_items.json"): _empty_items_template,
     Path("data/playlists.json"): _empty_tracks_template,
@@ -178,21 +188,26 @@ FILE_TEMPLATES: Dict[Path, Callable[[], str]] = {
     Path("data/security_manifest.json"): _security_manifest_template,
 }
 
+# Alle Vorlagen sind Konstanten – sie werden einmal beim Import serialisiert
+# und danach nur noch nachgeschlagen (read-only).
+FILE_TEMPLATES: Mapping[Path, str] = MappingProxyType(
+    {path: factory() for path, factory in _TEMPLATE_FACTORIES.items()}
+)
+
 
 def iter_required_files() -> Iterable[Tuple[Path, str]]:
     """Erzeuge Tupel (Paare) aus Pfad und Inhalt für Pflichtdateien."""
 
-    for path, factory in FILE_TEMPLATES.items():
-        yield path, factory()
+    return FILE_TEMPLATES.items()
 
 
 def required_file_content(path: Path) -> str:
     """Gib den Standardinhalt für einen Pfad zurück."""
 
-    factory = FILE_TEMPLATES.get(path)
-    if factory is None:
-        raise KeyError(f"Keine Vorlage für {path} hinterlegt")
-    return factory()
+    try:
+        return FILE_TEMPLATES[path]
+    except KeyError:
+        raise KeyError(f"Keine Vorlage für {path} hinterlegt") from None
 
 
 __all__ = [
@@ -5,11 +5,16 @@ from __future__ import annotations
 import datetime as dt
 import hashlib
 import json
+import mmap
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import BinaryIO, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+from .compat import DATACLASS_SLOTS
 from .file_utils import atomic_write_json
 from .logging_manager import get_logger
 from .resources import ARCHIVE_DB_PATH
@@ -18,8 +23,20 @@ from .resources import ARCHIVE_DB_PATH
 DEFAULT_MANIFEST_PATH = Path("data/security_manifest.json")
 DEFAULT_BACKUP_DIR = Path("data/backups")
 
+# Obergrenze für parallele Prüfsummen-Berechnungen.
+_MAX_HASH_WORKERS = 8
+
+# Ab dieser Größe wird die Datei eingeblendet (mmap) statt gelesen.
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# Spalten des spaltenweise gespeicherten Manifests.
+_MANIFEST_COLUMNS = ("sha256", "size", "mtime_ns", "last_checked")
+
+# Originaler Dateiname -> [(mtime_ns, Backup-Pfad)], neueste zuerst.
+_BackupIndex = Dict[str, List[Tuple[int, Path]]]
+
 # Files that should be protected by checksum validation.
-SENSITIVE_FILES: Iterable[Path] = (
+SENSITIVE_FILES: Tuple[Path, ...] = (
     Path("data/settings.json"),
     Path("data/todo_items.json"),
     Path("data/playlists.json"),
@@ -34,8 +51,18 @@ SENSITIVE_FILES: Iterable[Path] = (
     Path("todo.txt"),
 )
 
+# (Pfad, Manifest-Schlüssel) und Backup-Namen, einmal beim Import berechnet.
+_SENSITIVE_REL: Tuple[Tuple[Path, str], ...] = tuple((path, str(path)) for path in SENSITIVE_FILES)
+_BACKUP_NAMES: Mapping[str, str] = MappingProxyType(
+    {rel_path: path.name for path, rel_path in _SENSITIVE_REL}
+)
+
+
+def _now_iso() -> str:
+    return dt.datetime.now().isoformat(timespec="seconds")
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class SecuritySummary:
     """Collect the outcome of a manifest validation run."""
 
@@ -48,22 +75,54 @@ class SecuritySummary:
     restore_points: List[Dict[str, object]] = field(default_factory=list)
     restore_issues: List[str] = field(default_factory=list)
     updated_manifest: bool = False
-    timestamp: str = dt.datetime.now().isoformat()
+    timestamp: str = field(default_factory=_now_iso)
 
     def to_dict(self) -> Dict[str, object]:
+        """Plain-dict view for the JSON report.
+
+        The summary is complete once ``verify_files`` returns, so the lists
+        are handed out as they are instead of being copied.
+        """
+
         return {
             "status": self.status,
             "verified": self.verified,
-            "issues": list(self.issues),
-            "backups": list(self.backups),
-            "size_alerts": list(self.size_alerts),
-            "pruned_backups": list(self.pruned_backups),
-            "restore_points": [dict(item) for item in self.restore_points],
-            "restore_issues": list(self.restore_issues),
+            "issues": self.issues,
+            "backups": self.backups,
+            "size_alerts": self.size_alerts,
+            "pruned_backups": self.pruned_backups,
+            "restore_points": self.restore_points,
+            "restore_issues": self.restore_issues,
             "updated_manifest": self.updated_manifest,
             "timestamp": self.timestamp,
         }
 
+    def merge(self, partial: "SecuritySummary") -> None:
+        """Fold the result of a ``verify_files(paths=...)`` run into this summary.
+
+        Findings are appended; the restore points of the re-checked files
+        replace the older entries for the same files.
+        """
+
+        self.issues.extend(partial.issues)
+        self.backups.extend(partial.backups)
+        self.size_alerts.extend(partial.size_alerts)
+        self.pruned_backups.extend(partial.pruned_backups)
+        refreshed = {entry.get("file") for entry in partial.restore_points}
+        self.restore_points = [
+            entry for entry in self.restore_points if entry.get("file") not in refreshed
+        ]
+        self.restore_points.extend(partial.restore_points)
+        self.restore_issues = [
+            entry["message"]
+            for entry in self.restore_points
+            if entry.get("status") != "ok" and entry.get("message")
+        ]
+        self.updated_manifest = self.updated_manifest or partial.updated_manifest
+        if self.issues or self.restore_issues:
+            self.status = "attention"
+        self.timestamp = partial.timestamp
+
 
 class SecurityManager:
     """Manage checksum manifest validation and backups."""
@@ -90,51 +149,78 @@ class SecurityManager:
         return manifest
 
     # ------------------------------------------------------------------
-    def verify_files(self) -> SecuritySummary:
-        """Verify protected files against the checksum manifest."""
-
+    def verify_files(
+        self, *, force: bool = False, paths: Optional[Iterable[Path]] = None
+    ) -> SecuritySummary:
+        """Verify protected files against the checksum manifest.
+
+        Files whose size and modification time (``st_mtime_ns``) match the
+        manifest keep their stored checksum without being read again;
+        ``force=True`` hashes every file regardless.  ``paths`` limits the run
+        (including the restore check) to those protected files, e.g. after a
+        single file was rewritten; see ``SecuritySummary.merge``.
+        """
+
+        entries = _SENSITIVE_REL
+        if paths is not None:
+            selected = set(paths)
+            entries = tuple(entry for entry in _SENSITIVE_REL if entry[0] in selected)
         manifest = self.ensure_manifest()
-        files_section = manifest.setdefault("files", {})
+        # Spaltenweise Ablage: je Kennzahl ein flaches Dict Pfad -> Wert.
+        hashes: Dict[str, Optional[str]] = manifest["sha256"]
+        sizes: Dict[str, Optional[int]] = manifest["size"]
+        mtimes: Dict[str, Optional[int]] = manifest["mtime_ns"]
+        checked: Dict[str, str] = manifest["last_checked"]
         summary = SecuritySummary(status="ok")
-
-        for path in SENSITIVE_FILES:
-            rel_path = str(path)
-            entry = files_section.setdefault(rel_path, {})
-            checksum = self._hash_file(path)
-            size = self._file_size(path)
+        timestamp = summary.timestamp
+        stats = [_stat(path) for path, _ in entries]
+
+        stale = [
+            path
+            for (path, rel_path), stat in zip(entries, stats)
+            if force or not _unchanged(rel_path, stat, hashes, sizes, mtimes)
+        ]
+        fresh = dict(zip(stale, self._hash_many(stale)))
+        backups = self._scan_backups()
+
+        for (path, rel_path), stat in zip(entries, stats):
+            expected = hashes.get(rel_path)
+            checksum = fresh.get(path, expected)
+            size = stat.st_size if stat is not None else None
             summary.verified += 1
 
-            expected = entry.get("sha256")
+            checked[rel_path] = timestamp
             if checksum == "missing":
                 summary.issues.append(f"{rel_path}: Datei fehlt – bitte prüfen")
                 summary.status = "attention"
-                summary.updated_manifest = True
-                entry["sha256"] = "missing"
-                entry["size"] = None
-                entry["last_checked"] = summary.timestamp
+                if expected != "missing" or sizes.get(rel_path) is not None:
+                    hashes[rel_path] = "missing"
+                    sizes[rel_path] = None
+                    mtimes[rel_path] = None
+                    summary.updated_manifest = True
                 continue
             if expected is None:
-                entry["sha256"] = checksum
-                entry["size"] = size
+                hashes[rel_path] = checksum
+                sizes[rel_path] = size
                 summary.updated_manifest = True
                 self.logger.info("Manifest ergänzt: %s", rel_path)
             elif checksum != expected:
-                backup_file = self._create_backup(path)
+                backup_file = self._create_backup(path, backups)
                 message = (
                     f"Checksum-Abweichung erkannt – Datei gesichert unter {backup_file}"
                 )
                 summary.issues.append(f"{rel_path}: {message}")
                 summary.backups.append(str(backup_file))
-                pruned = self._prune_old_backups(path.name)
+                pruned = self._prune_old_backups(path.name, backups=backups)
                 if pruned:
                     summary.pruned_backups.extend(str(item) for item in pruned)
-                entry["sha256"] = checksum
-                entry["size"] = size
+                hashes[rel_path] = checksum
+                sizes[rel_path] = size
                 summary.updated_manifest = True
                 summary.status = "attention"
                 self.logger.warning("%s – neue Prüfsumme gespeichert", message)
             else:
-                previous_size = entry.get("size")
+                previous_size = sizes.get(rel_path)
                 if previous_size is not None and size is not None and previous_size != size:
                     alert = (
                         f"{rel_path}: Dateigröße von {previous_size} auf {size} Byte geändert"
@@ -142,11 +228,13 @@ class SecurityManager:
                     summary.issues.append(alert)
                     summary.size_alerts.append(alert)
                     summary.status = "attention"
-                entry["size"] = size
+                sizes[rel_path] = size
 
-            entry["last_checked"] = summary.timestamp
+            if stat is not None and mtimes.get(rel_path) != stat.st_mtime_ns:
+                mtimes[rel_path] = stat.st_mtime_ns
+                summary.updated_manifest = True
 
-            baseline = self._ensure_baseline_backup(path, checksum)
+            baseline = self._ensure_baseline_backup(path, checksum, backups)
             if baseline is not None:
                 summary.backups.append(str(baseline))
 
@@ -154,7 +242,9 @@ class SecurityManager:
             self._write_manifest(manifest)
             self.logger.info("Sicherheitsmanifest aktualisiert.")
 
-        summary.restore_points = self._collect_restore_points(files_section)
+        if paths is not None:
+            hashes = {rel_path: hashes.get(rel_path) for _, rel_path in entries}
+        summary.restore_points = self._collect_restore_points(hashes, backups)
         summary.restore_issues.extend(
             entry["message"]
             for entry in summary.restore_points
@@ -171,98 +261,168 @@ class SecurityManager:
         return summary
 
     # ------------------------------------------------------------------
-    def _ensure_baseline_backup(self, path: Path, checksum: str) -> Optional[Path]:
+    def _ensure_baseline_backup(
+        self, path: Path, checksum: str, backups: Optional[_BackupIndex] = None
+    ) -> Optional[Path]:
         """Create a first backup when none exists yet."""
 
         if checksum in ("missing", None):
             return None
-        if self._latest_backup(path.name) is not None:
+        if self._latest_backup(path.name, backups) is not None:
             return None
         if not path.exists():
             return None
 
-        backup = self._create_backup(path)
+        backup = self._create_backup(path, backups)
         self.logger.info("Initiales Backup angelegt: %s", backup)
         return backup
 
     # ------------------------------------------------------------------
     def _initial_manifest(self) -> Dict[str, object]:
-        payload: Dict[str, Dict[str, object]] = {"files": {}}
-        timestamp = dt.datetime.now().isoformat()
-        for path in SENSITIVE_FILES:
-            payload["files"][str(path)] = {
-                "sha256": self._hash_file(path),
-                "size": self._file_size(path),
-                "last_checked": timestamp,
-            }
-        payload["created_at"] = timestamp
-        payload["updated_at"] = timestamp
-        return payload
+        timestamp = _now_iso()
+        hashes: Dict[str, Optional[str]] = {}
+        sizes: Dict[str, Optional[int]] = {}
+        mtimes: Dict[str, Optional[int]] = {}
+        checked: Dict[str, str] = {}
+        checksums = self._hash_many([path for path, _ in _SENSITIVE_REL])
+        for (path, rel_path), checksum in zip(_SENSITIVE_REL, checksums):
+            stat = _stat(path)
+            hashes[rel_path] = checksum
+            sizes[rel_path] = stat.st_size if stat is not None else None
+            mtimes[rel_path] = stat.st_mtime_ns if stat is not None else None
+            checked[rel_path] = timestamp
+        return {
+            "sha256": hashes,
+            "size": sizes,
+            "mtime_ns": mtimes,
+            "last_checked": checked,
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
 
     def _load_manifest(self) -> Dict[str, object]:
         if not self.manifest_path.exists():
             return {}
         try:
-            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
             self.logger.error("Sicherheitsmanifest konnte nicht gelesen werden – wird neu erstellt")
             return {}
+        if not isinstance(manifest, dict):
+            self.logger.error("Sicherheitsmanifest hat ein unbekanntes Format – wird neu erstellt")
+            return {}
+        if not manifest:
+            return {}
+        migrate = "files" in manifest
+        manifest = _columnar_manifest(manifest)
+        if migrate:
+            self._write_manifest(manifest)
+            self.logger.info("Sicherheitsmanifest in das Spaltenformat übertragen.")
+        return manifest
 
     def _write_manifest(self, manifest: Dict[str, object]) -> None:
-        manifest["updated_at"] = dt.datetime.now().isoformat()
+        manifest["updated_at"] = _now_iso()
         if not atomic_write_json(self.manifest_path, manifest, logger=self.logger):
             self.logger.error("Sicherheitsmanifest konnte nicht gespeichert werden: %s", self.manifest_path)
 
+    def _hash_many(self, paths: Sequence[Path]) -> List[str]:
+        """Hash several files concurrently; results keep the order of *paths*.
+
+        ``hashlib`` releases the GIL while digesting larger buffers, so reading
+        and hashing different files overlap across threads.
+        """
+
+        if len(paths) < 2:
+            return [self._hash_file(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(_MAX_HASH_WORKERS, len(paths))) as pool:
+            return list(pool.map(self._hash_file, paths))
+
     def _hash_file(self, path: Path) -> str:
-        sha256 = hashlib.sha256()
         if not path.exists():
             self.logger.warning("Datei für Sicherheitsprüfung fehlt: %s", path)
             return "missing"
         with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(65536), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            return _sha256_of(handle)
 
-    def _file_size(self, path: Path) -> Optional[int]:
-        try:
-            return path.stat().st_size
-        except FileNotFoundError:
-            return None
+    def _scan_backups(self) -> _BackupIndex:
+        """Sweep the backup folder once: original name -> backups, newest first.
 
-    def _prune_old_backups(self, original_name: str, keep: int = 5) -> List[Path]:
-        if not self.backup_dir.exists():
-            return []
-        candidates = sorted(
-            self.backup_dir.glob(f"{original_name}.*.bak"),
-            key=lambda item: item.stat().st_mtime,
-            reverse=True,
-        )
+        ``os.scandir`` caches the ``stat`` result per entry, so every backup is
+        stat'ed once per run instead of once per lookup.
+        """
+
+        backups: _BackupIndex = {}
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".bak"):
+                        continue
+                    # "<name>.<zeitstempel>.bak" -> "<name>"
+                    original, sep, _timestamp = entry.name[: -len(".bak")].rpartition(".")
+                    if not sep or not original:
+                        continue
+                    try:
+                        mtime_ns = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    backups.setdefault(original, []).append((mtime_ns, Path(entry.path)))
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+        for items in backups.values():
+            items.sort(reverse=True)
+        return backups
+
+    def _prune_old_backups(
+        self, original_name: str, keep: int = 5, backups: Optional[_BackupIndex] = None
+    ) -> List[Path]:
+        if backups is None:
+            backups = self._scan_backups()
+        candidates = backups.get(original_name, [])
         removed: List[Path] = []
-        for obsolete in candidates[keep:]:
+        for item in candidates[keep:]:
+            obsolete = item[1]
             try:
                 obsolete.unlink()
                 removed.append(obsolete)
+                candidates.remove(item)
             except OSError:
                 self.logger.warning("Backup konnte nicht gelöscht werden: %s", obsolete)
         return removed
 
-    def _create_backup(self, path: Path) -> Path:
+    def _create_backup(self, path: Path, backups: Optional[_BackupIndex] = None) -> Path:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         timestamp = dt.datetime.now().strftime("%Y%m%d-%H%M%S")
         backup_name = f"{path.name}.{timestamp}.bak"
         backup_path = self.backup_dir / backup_name
         if path.exists():
             shutil.copy2(path, backup_path)
+            if backups is not None:
+                items = [item for item in backups.get(path.name, []) if item[1] != backup_path]
+                items.append((backup_path.stat().st_mtime_ns, backup_path))
+                items.sort(reverse=True)
+                backups[path.name] = items
         return backup_path
 
-    def _collect_restore_points(self, files_section: Dict[str, Dict[str, object]]) -> List[Dict[str, object]]:
+    def _collect_restore_points(
+        self, hashes: Dict[str, Optional[str]], backups: Optional[_BackupIndex] = None
+    ) -> List[Dict[str, object]]:
         """Evaluate whether recent backups can restore protected files."""
 
+        if backups is None:
+            backups = self._scan_backups()
+        candidates = [
+            (rel_path, checksum, self._latest_backup(_backup_name(rel_path), backups))
+            for rel_path, checksum in hashes.items()
+        ]
+        to_hash = [
+            latest
+            for _, checksum, latest in candidates
+            if latest and checksum not in (None, "missing")
+        ]
+        backup_hashes = dict(zip(to_hash, self._hash_many(to_hash)))
+
         restore_points: List[Dict[str, object]] = []
-        for rel_path, entry in files_section.items():
-            name = Path(rel_path).name
-            latest = self._latest_backup(name)
-            checksum = entry.get("sha256")
+        for rel_path, checksum, latest in candidates:
             if not latest:
                 restore_points.append(
                     {
@@ -282,7 +442,7 @@ class SecurityManager:
                     }
                 )
                 continue
-            backup_hash = self._hash_file(latest)
+            backup_hash = backup_hashes[latest]
             if backup_hash == checksum:
                 restore_points.append(
                     {
@@ -306,13 +466,87 @@ class SecurityManager:
                 )
         return restore_points
 
-    def _latest_backup(self, original_name: str) -> Optional[Path]:
-        if not self.backup_dir.exists():
-            return None
-        candidates = list(self.backup_dir.glob(f"{original_name}.*.bak"))
-        if not candidates:
-            return None
-        return max(candidates, key=lambda item: item.stat().st_mtime)
+    def _latest_backup(
+        self, original_name: str, backups: Optional[_BackupIndex] = None
+    ) -> Optional[Path]:
+        if backups is None:
+            backups = self._scan_backups()
+        candidates = backups.get(original_name)
+        return candidates[0][1] if candidates else None
+
+
+def _backup_name(rel_path: str) -> str:
+    """File name used for the backups of *rel_path*."""
+
+    name = _BACKUP_NAMES.get(rel_path)
+    return name if name is not None else Path(rel_path).name
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _unchanged(
+    rel_path: str,
+    stat: Optional[os.stat_result],
+    hashes: Dict[str, Optional[str]],
+    sizes: Dict[str, Optional[int]],
+    mtimes: Dict[str, Optional[int]],
+) -> bool:
+    """True if *stat* matches the manifest, so the stored checksum still holds."""
+
+    return (
+        stat is not None
+        and hashes.get(rel_path) not in (None, "missing")
+        and sizes.get(rel_path) == stat.st_size
+        and mtimes.get(rel_path) == stat.st_mtime_ns
+    )
+
+
+def _sha256_of(handle: BinaryIO) -> str:
+    """SHA-256 of an open binary file.
+
+    Large files are mapped into memory and hashed in a single call without
+    copying them into Python buffers.  Smaller files use
+    ``hashlib.file_digest`` (Python 3.11+), older interpreters the chunked loop.
+    """
+
+    if os.fstat(handle.fileno()).st_size >= _MMAP_THRESHOLD:
+        try:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        except (OSError, ValueError):  # pragma: no cover - e.g. special files
+            handle.seek(0)
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+    sha256 = hashlib.sha256()  # Python < 3.11
+    for chunk in iter(lambda: handle.read(65536), b""):
+        sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _columnar_manifest(manifest: Dict[str, object]) -> Dict[str, object]:
+    """Bring a loaded manifest into the column layout used by ``verify_files``.
+
+    Older versions stored one nested entry per file under ``"files"``; those
+    entries are moved into the columns.
+    """
+
+    legacy = manifest.pop("files", None)
+    for column in _MANIFEST_COLUMNS:
+        if not isinstance(manifest.get(column), dict):
+            manifest[column] = {}
+    if isinstance(legacy, dict):
+        for rel_path, entry in legacy.items():
+            if not isinstance(entry, dict):
+                continue
+            for column in _MANIFEST_COLUMNS:
+                if column in entry:
+                    manifest[column].setdefault(rel_path, entry[column])
+    return manifest
 
 
 __all__ = ["SecurityManager", "SecuritySummary"]
@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
-import compileall
+import atexit
 import datetime as dt
+import hashlib
+import importlib.util
+import io
 import json
 import os
+import py_compile
 import subprocess
 import sys
+import threading
+import venv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
-
-from .color_audit import ColorAuditor
-from .dependency_manager import DependencyInstallOutcome, DependencyManager
-from .file_utils import atomic_write_json, atomic_write_text
-from .diagnostics import DiagnosticsManager
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .compat import DATACLASS_SLOTS
+from .dependency_manager import (
+    DependencyInstallOutcome,
+    DependencyManager,
+    canonical_name,
+    installed_versions,
+)
+from .file_utils import atomic_write_bytes, atomic_write_json, atomic_write_text
 from .logging_manager import get_logger
 from .resources import (
     ARCHIVE_DB_PATH,
@@ -23,11 +35,14 @@ from .resources import (
     iter_required_files,
     required_file_content,
 )
-from .security import SecurityManager, SecuritySummary
 from .validators import SettingsValidator
 
+if TYPE_CHECKING:  # pragma: no cover - for type checking only
+    from .security import SecuritySummary
+
 
 MAX_STARTUP_LOG_LINES = 2000
+TRIM_BLOCK_SIZE = 8192
 
 DEPENDENCY_COMMANDS: Dict[str, List[str]] = {}
 if sys.platform.startswith("win") or sys.platform == "darwin":
@@ -36,10 +51,71 @@ if sys.platform.startswith("win") or sys.platform == "darwin":
 VENV_PATH = Path(".venv")
 REQUIREMENTS_FILE = Path("requirements.txt")
 DEV_REQUIREMENTS_FILE = Path("requirements-dev.txt")
+STARTUP_LOG_FILE = Path("logs/startup.log")
 INSTALL_DEV_ENV_FLAG = "STEP_BY_STEP_INSTALL_DEV"
 RELAUNCH_ENV_FLAG = "STEP_BY_STEP_VENV_ACTIVE"
 
 
+def _requirements_fingerprint(requirements_file: Path, python_executable: str) -> Optional[str]:
+    """Hash of *requirements_file* plus the interpreter it was installed into."""
+
+    try:
+        digest = hashlib.sha256(requirements_file.read_bytes()).hexdigest()
+    except OSError:
+        return None
+    return f"{digest}\n{python_executable}\n"
+
+
+def _stale_sources(root: str) -> List[str]:
+    """Return all ``.py`` files below *root* whose bytecode is missing or older."""
+
+    stale: List[str] = []
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return stale
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name != "__pycache__":
+                stale.extend(_stale_sources(entry.path))
+            continue
+        if not entry.name.endswith(".py"):
+            continue
+        try:
+            compiled = os.stat(importlib.util.cache_from_source(entry.path)).st_mtime_ns
+        except (OSError, NotImplementedError):
+            compiled = -1
+        if entry.stat().st_mtime_ns > compiled:
+            stale.append(entry.path)
+    return stale
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """``(st_ino, st_size, st_mtime_ns)`` of *path*; ``None`` if it is missing."""
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _read_stamp(stamp: Path) -> Optional[str]:
+    try:
+        return stamp.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _available_cpus() -> int:
+    """Return how many CPUs this process may use (CPU-Affinität)."""
+
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - Windows/macOS
+        return os.cpu_count() or 1
+
+
 @dataclass
 class SelfTestResult:
     """Represent the outcome of a single self-test."""
@@ -49,7 +125,7 @@ class SelfTestResult:
     details: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StartupReport:
     """Collect details about performed startup actions."""
 
@@ -73,6 +149,16 @@ class StartupReport:
     def add_message(self, message: str) -> None:
         self.messages.append(message)
 
+    def add_repaired(self, path: Path) -> None:
+        """Record *path* as repaired; each path is listed only once.
+
+        The list holds at most the handful of required files, so the
+        membership test stays cheap without a parallel set.
+        """
+
+        if path not in self.repaired_paths:
+            self.repaired_paths.append(path)
+
     def all_self_tests_passed(self) -> bool:
         if not self.self_tests:
             return True
@@ -85,10 +171,17 @@ class StartupManager:
     def __init__(self) -> None:
         self.logger = get_logger("core.startup")
         self.report = StartupReport()
-        self.diagnostics_file = Path("logs/startup.log")
+        # Absolut, weil der atexit-Flush sonst gegen das dann aktuelle
+        # Arbeitsverzeichnis schreiben würde.
+        self.diagnostics_file = STARTUP_LOG_FILE.absolute()
         self.diagnostics_file.parent.mkdir(parents=True, exist_ok=True)
         self._argv: List[str] = list(sys.argv)
         self.settings_validator = SettingsValidator()
+        self._report_lock = threading.Lock()
+        # Zeilen für logs/startup.log; geschrieben wird gesammelt pro Stufe.
+        self._diag_buffer: List[str] = []
+        # Pfad und Dateisignatur der zuletzt normalisierten settings.json.
+        self._settings_checked: Optional[Tuple[Path, Tuple[int, int, int]]] = None
 
     # ------------------------------------------------------------------
     def run_startup_checks(self, argv: Optional[List[str]] = None) -> StartupReport:
@@ -106,40 +199,65 @@ class StartupManager:
                 )
             )
 
-        steps: Sequence[Tuple[str, Callable[[], None]]] = (
-            ("Strukturprüfung", self.ensure_structure),
-            ("Virtuelle Umgebung prüfen", self.ensure_virtual_environment),
-            ("Abhängigkeiten prüfen", self.ensure_dependencies),
-            ("Datensicherheit prüfen", self.verify_data_security),
-            ("Farbaudit ausführen", self.audit_color_contrast),
-            ("Selbsttests ausführen", self.run_self_tests),
-            ("Diagnose erfassen", self.capture_diagnostics),
+        # Schritte innerhalb einer Stufe (level) sind unabhängig voneinander und
+        # laufen parallel; die Stufen selbst werden nacheinander abgearbeitet.
+        # Die Selbsttests folgen wie bisher erst nach Sicherheitsprüfung und
+        # Abhängigkeiten: sie können data/settings.json neu schreiben, die die
+        # Sicherheitsprüfung gleichzeitig hashen und sichern würde.
+        levels: Sequence[Sequence[Tuple[str, Callable[[], None]]]] = (
+            (("Strukturprüfung", self.ensure_structure),),
+            (
+                ("Virtuelle Umgebung prüfen", self.ensure_virtual_environment),
+                ("Datensicherheit prüfen", self.verify_data_security),
+            ),
+            (
+                ("Abhängigkeiten prüfen", self.ensure_dependencies),
+                ("Farbaudit ausführen", self.audit_color_contrast),
+            ),
+            (("Selbsttests ausführen", self.run_self_tests),),
+            (("Diagnose erfassen", self.capture_diagnostics),),
         )
 
-        for label, step in steps:
-            self._run_step(label, step)
-
-        self._persist_report()
-
-        self.logger.info("Startroutine beendet")
-        self._write_diagnostic("Startroutine beendet.")
+        try:
+            for level in levels:
+                self._run_level(level)
+                # Nach jeder Stufe schreiben: die Diagnose sieht das Protokoll
+                # und bei einem Absturz fehlt höchstens die laufende Stufe.
+                self._flush_diagnostics()
+
+            self._persist_report()
+
+            self.logger.info("Startroutine beendet")
+            self._write_diagnostic("Startroutine beendet.")
+        finally:
+            self._flush_diagnostics()
         return self.report
 
     # ------------------------------------------------------------------
     def ensure_structure(self) -> None:
-        for folder in REQUIRED_FOLDERS:
+        # Beim Warmstart existiert alles: ein stat pro Eintrag, eine
+        # Sammelmeldung statt einer Zeile je Ordner bzw. Datei.
+        missing = [folder for folder in REQUIRED_FOLDERS if not folder.is_dir()]
+        for folder in missing:
             folder.mkdir(parents=True, exist_ok=True)
-            self._log_progress(f"Ordner geprüft: {folder}")
+            self._log_progress(f"Ordner angelegt: {folder}")
+        self._log_progress(
+            f"Ordner geprüft: {len(REQUIRED_FOLDERS) - len(missing)}/"
+            f"{len(REQUIRED_FOLDERS)} bereits vorhanden."
+        )
 
+        present = total = 0
         for path, template in iter_required_files():
+            total += 1
             if not path.exists():
                 atomic_write_text(path, template, logger=self.logger)
-                self.report.repaired_paths.append(path)
+                self.report.add_repaired(path)
                 self._log_progress(f"Datei ergänzt: {path}")
             else:
-                self._log_progress(f"Datei vorhanden: {path}")
+                present += 1
             if path.name == "settings.json":
                 self._ensure_settings_defaults(path)
+        self._log_progress(f"Dateien geprüft: {present}/{total} bereits vorhanden.")
 
         self._ensure_archive_database()
 
@@ -162,7 +280,7 @@ class StartupManager:
             )
             return
 
-        self.report.repaired_paths.append(ARCHIVE_DB_PATH)
+        self.report.add_repaired(ARCHIVE_DB_PATH)
         self._log_progress(f"Archiv-Datenbank initialisiert: {ARCHIVE_DB_PATH}")
 
     # ------------------------------------------------------------------
@@ -185,14 +303,12 @@ class StartupManager:
         python_exec = self._python_for_dependencies()
         dependency_manager = DependencyManager(python_exec)
 
-        self._log_progress("Installationsbefehl gestartet: requirements.txt installieren")
-        outcome = dependency_manager.install_requirements(
-            REQUIREMENTS_FILE, "requirements.txt installieren"
-        )
-        if outcome is None:
+        if not REQUIREMENTS_FILE.exists():
             self._log_progress("Keine requirements.txt gefunden – überspringe Installation.")
         else:
-            self._handle_dependency_outcome(outcome)
+            self._install_requirements_cached(
+                dependency_manager, REQUIREMENTS_FILE, "requirements.txt installieren"
+            )
 
         if self._should_install_dev_dependencies():
             if DEV_REQUIREMENTS_FILE.exists():
@@ -200,14 +316,11 @@ class StartupManager:
                     "Entwicklungswerkzeuge werden installiert, da "
                     f"{INSTALL_DEV_ENV_FLAG} gesetzt ist."
                 )
-                self._log_progress(
-                    "Installationsbefehl gestartet: requirements-dev.txt installieren"
-                )
-                outcome = dependency_manager.install_requirements(
-                    DEV_REQUIREMENTS_FILE, "requirements-dev.txt installieren"
+                self._install_requirements_cached(
+                    dependency_manager,
+                    DEV_REQUIREMENTS_FILE,
+                    "requirements-dev.txt installieren",
                 )
-                if outcome is not None:
-                    self._handle_dependency_outcome(outcome)
             else:
                 self._log_progress(
                     "Umgebungsvariable STEP_BY_STEP_INSTALL_DEV ist gesetzt, "
@@ -225,6 +338,48 @@ class StartupManager:
             )
             self._handle_dependency_outcome(outcome, optional_feature=package)
 
+    # ------------------------------------------------------------------
+    def _install_requirements_cached(
+        self,
+        dependency_manager: DependencyManager,
+        requirements_file: Path,
+        description: str,
+    ) -> None:
+        """Run ``pip install -r`` unless the file is unchanged since the last success.
+
+        The SHA-256 of the requirements file and the interpreter path are stored
+        next to the virtual environment. A matching stamp skips the pip call,
+        which otherwise dominates every start. Without a ``.venv`` folder no
+        stamp is written, so system interpreters are always checked by pip.
+        """
+
+        stamp = VENV_PATH / f".{requirements_file.stem}.sha256"
+        fingerprint = None
+        if VENV_PATH.is_dir():
+            fingerprint = _requirements_fingerprint(
+                requirements_file, dependency_manager.python_executable
+            )
+        if fingerprint is not None and _read_stamp(stamp) == fingerprint:
+            self._log_progress(
+                f"Abhängigkeiten unverändert – Cache-Treffer ({requirements_file.name})."
+            )
+            return
+
+        self._log_progress(f"Installationsbefehl gestartet: {description}")
+        outcome = dependency_manager.install_requirements(requirements_file, description)
+        if outcome is None:
+            return
+        self._handle_dependency_outcome(outcome)
+        if fingerprint is None:
+            return
+        if outcome.success:
+            atomic_write_text(stamp, fingerprint, durable=False, logger=self.logger)
+            return
+        try:
+            stamp.unlink(missing_ok=True)
+        except OSError as exc:
+            self.logger.warning("Installations-Stempel %s nicht entfernt: %s", stamp, exc)
+
     # ------------------------------------------------------------------
     def _should_install_dev_dependencies(self) -> bool:
         value = os.getenv(INSTALL_DEV_ENV_FLAG, "").strip().lower()
@@ -252,6 +407,8 @@ class StartupManager:
 
     # ------------------------------------------------------------------
     def verify_data_security(self) -> None:
+        from .security import SecurityManager
+
         manager = SecurityManager()
         summary = manager.verify_files()
         self.report.security_summary = summary
@@ -288,6 +445,11 @@ class StartupManager:
 
     # ------------------------------------------------------------------
     def audit_color_contrast(self) -> None:
+        # Audit, Sicherheit und Diagnose werden erst beim Aufruf importiert,
+        # damit schnelle Pfade (z.B. --help) ihre Importkosten nicht tragen.
+        from .color_audit import ColorAuditor
+        from .security import SecurityManager
+
         auditor = ColorAuditor()
         try:
             report = auditor.generate_report()
@@ -323,8 +485,15 @@ class StartupManager:
         for recommendation in getattr(report, "recommendations", []):
             self._log_progress(f"Farbaudit-Tipp: {recommendation}")
 
-        refreshed_summary = SecurityManager().verify_files()
-        self.report.security_summary = refreshed_summary
+        # Nur die eben geschriebene Audit-Datei neu prüfen; die übrigen Dateien
+        # hat verify_data_security in dieser Startroutine bereits kontrolliert.
+        summary = self.report.security_summary
+        if summary is None:
+            refreshed_summary = SecurityManager().verify_files()
+            self.report.security_summary = refreshed_summary
+        else:
+            refreshed_summary = SecurityManager().verify_files(paths=(target,))
+            summary.merge(refreshed_summary)
         self._log_progress(
             (
                 "Datensicherheit nach Farbaudit aktualisiert: "
@@ -351,6 +520,8 @@ class StartupManager:
 
     # ------------------------------------------------------------------
     def capture_diagnostics(self) -> None:
+        from .diagnostics import DiagnosticsManager
+
         manager = DiagnosticsManager()
         try:
             diagnostics = manager.collect(self.report)
@@ -379,29 +550,27 @@ class StartupManager:
             self._log_progress(message, level="error")
             return
 
-        html_path: Optional[Path] = None
+        diagnostics_path: Optional[Path] = None
         try:
-            html_path = manager.export_html(diagnostics)
+            diagnostics_path = manager.save(diagnostics)
         except Exception as error:  # pragma: no cover - defensive guard
             self._log_progress(
-                f"Diagnose-HTML konnte nicht erstellt werden: {error}",
+                f"Diagnosebericht konnte nicht gespeichert werden: {error}",
                 level="error",
             )
 
-        diagnostics_path: Optional[Path] = None
+        html_path: Optional[Path] = None
         try:
-            diagnostics_path = manager.save(diagnostics)
+            html_path = manager.export_html(diagnostics)
         except Exception as error:  # pragma: no cover - defensive guard
             self._log_progress(
-                f"Diagnosebericht konnte nicht gespeichert werden: {error}",
+                f"Diagnose-HTML konnte nicht erstellt werden: {error}",
                 level="error",
             )
 
-        diagnostics_dict = diagnostics.to_dict()
         if html_path:
             diagnostics.html_report_path = str(html_path)
-            diagnostics_dict["html_report_path"] = str(html_path)
-        self.report.diagnostics = diagnostics_dict
+        self.report.diagnostics = diagnostics.to_dict()
         self.report.diagnostics_path = diagnostics_path
         self.report.diagnostics_html_path = html_path
         try:
@@ -416,6 +585,33 @@ class StartupManager:
         if html_path:
             self._log_progress(f"Diagnose als HTML gespeichert: {html_path}")
 
+    # ------------------------------------------------------------------
+    def _run_level(self, steps: Sequence[Tuple[str, Callable[[], None]]]) -> None:
+        """Run the independent steps of one level concurrently (nebenläufig).
+
+        All steps of the level finish before the first error (in step order)
+        is re-raised, so the report stays complete for the user. On a single
+        CPU the steps run one after another without a thread pool.
+        """
+
+        workers = min(len(steps), _available_cpus())
+        if workers <= 1:
+            first_error: Optional[Exception] = None
+            for label, step in steps:
+                try:
+                    self._run_step(label, step)
+                except Exception as error:
+                    if first_error is None:
+                        first_error = error
+            if first_error is not None:
+                raise first_error
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="startup") as executor:
+            futures = [executor.submit(self._run_step, label, step) for label, step in steps]
+        for future in futures:
+            future.result()
+
     # ------------------------------------------------------------------
     def _run_step(self, label: str, step: Callable[[], None]) -> None:
         self._log_progress(f"Starte Schritt: {label}")
@@ -481,11 +677,23 @@ class StartupManager:
 
     # ------------------------------------------------------------------
     def _self_test_compileall(self) -> Tuple[bool, str]:
+        """Compile only sources that are newer than their ``.pyc`` file.
+
+        Unchanged files cost a single ``stat`` each; on a warm start nothing is
+        read or compiled at all.
+        """
+
         try:
-            success = compileall.compile_dir("step_by_step", quiet=1)
+            stale = _stale_sources("step_by_step")
+            for source in stale:
+                py_compile.compile(source, doraise=True)
+        except py_compile.PyCompileError as error:
+            return False, f"Syntaxfehler in {error.file}: {error.exc_value}"
         except Exception as error:  # pragma: no cover - defensive guard
             return False, f"Compilerlauf nicht möglich: {error}"
-        return bool(success), "Python-Dateien konnten erfolgreich geprüft werden." if success else ""
+        if not stale:
+            return True, "Keine Änderungen seit letztem Start."
+        return True, f"{len(stale)} Python-Dateien konnten erfolgreich geprüft werden."
 
     # ------------------------------------------------------------------
     def _self_test_settings(self) -> Tuple[bool, str]:
@@ -496,9 +704,15 @@ class StartupManager:
                 required_file_content(settings_path),
                 logger=self.logger,
             )
-            self.report.repaired_paths.append(settings_path)
+            self.report.add_repaired(settings_path)
             return True, "Einstellungen wurden neu angelegt."
 
+        # Die Strukturprüfung hat die Datei in diesem Lauf schon gelesen und
+        # normalisiert; ist sie seitdem unverändert, entfällt der zweite Durchgang.
+        signature = _file_signature(settings_path)
+        if signature is not None and self._settings_checked == (settings_path, signature):
+            return True, "Einstellungen sind vollständig."
+
         try:
             content = json.loads(settings_path.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
@@ -507,15 +721,13 @@ class StartupManager:
                 required_file_content(settings_path),
                 logger=self.logger,
             )
-            if settings_path not in self.report.repaired_paths:
-                self.report.repaired_paths.append(settings_path)
+            self.report.add_repaired(settings_path)
             return False, "Einstellungen waren beschädigt und wurden zurückgesetzt."
 
         sanitised, adjustments = self.settings_validator.normalise(content)
         if sanitised != content:
             atomic_write_json(settings_path, sanitised, logger=self.logger)
-            if settings_path not in self.report.repaired_paths:
-                self.report.repaired_paths.append(settings_path)
+            self.report.add_repaired(settings_path)
             detail = "; ".join(adjustments) if adjustments else "automatisch korrigiert"
             return True, f"Einstellungen aktualisiert ({detail})."
         return True, "Einstellungen sind vollständig."
@@ -525,21 +737,25 @@ class StartupManager:
         try:
             content = json.loads(settings_path.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
-            content = json.loads(required_file_content(settings_path))
-            atomic_write_json(settings_path, content, logger=self.logger)
-            if settings_path not in self.report.repaired_paths:
-                self.report.repaired_paths.append(settings_path)
+            atomic_write_text(
+                settings_path,
+                required_file_content(settings_path),
+                logger=self.logger,
+            )
+            self.report.add_repaired(settings_path)
             self._log_progress("Einstellungen zurückgesetzt (ungültiges Format).", level="error")
             return
 
         sanitised, adjustments = self.settings_validator.normalise(content)
         if sanitised != content:
             atomic_write_json(settings_path, sanitised, logger=self.logger)
-            if settings_path not in self.report.repaired_paths:
-                self.report.repaired_paths.append(settings_path)
+            self.report.add_repaired(settings_path)
             self._log_progress("Einstellungen automatisch aktualisiert.")
             for note in adjustments:
                 self._log_progress(f"Einstellungs-Hinweis: {note}")
+        signature = _file_signature(settings_path)
+        if signature is not None:
+            self._settings_checked = (settings_path, signature)
 
     # ------------------------------------------------------------------
     def _persist_report(self) -> None:
@@ -575,10 +791,13 @@ class StartupManager:
 
     # ------------------------------------------------------------------
     def _create_virtualenv(self, python_in_venv: Path) -> None:
-        command = [sys.executable, "-m", "venv", str(VENV_PATH)]
         self._log_progress("Virtuelle Umgebung wird erstellt...")
+        # Im laufenden Interpreter statt über "python -m venv": spart einen
+        # kompletten Interpreterstart. Die Optionen entsprechen dem CLI-Standard;
+        # nur ensurepip läuft weiterhin als eigener Prozess.
+        builder = venv.EnvBuilder(with_pip=True, symlinks=os.name != "nt")
         try:
-            subprocess.check_call(command)
+            builder.create(str(VENV_PATH))
         except (subprocess.SubprocessError, OSError) as error:
             self._log_progress(f"Virtuelle Umgebung konnte nicht erstellt werden: {error}", level="error")
             return
@@ -602,15 +821,18 @@ class StartupManager:
 
     # ------------------------------------------------------------------
     def _is_package_installed(self, package: str) -> bool:
-        try:
-            __import__(package)
-        except ImportError:
-            return False
-        return True
+        """Check the installed distributions without importing *package*.
+
+        ``__import__`` would run the package's init code just to answer the
+        question; one ``importlib.metadata`` scan serves all packages instead.
+        """
+
+        return canonical_name(package) in installed_versions()
 
     # ------------------------------------------------------------------
     def _log_progress(self, message: str, level: str = "info") -> None:
-        self.report.add_message(message)
+        with self._report_lock:
+            self.report.add_message(message)
         if level == "error":
             self.logger.error(message)
         else:
@@ -619,29 +841,62 @@ class StartupManager:
 
     # ------------------------------------------------------------------
     def _write_diagnostic(self, message: str) -> None:
-        with self.diagnostics_file.open("a", encoding="utf-8") as handle:
-            handle.write(f"{message}\n")
+        with self._report_lock:
+            if not self._diag_buffer:
+                # Sicherheitsnetz für Zeilen, die nach dem letzten Flush anfallen.
+                atexit.register(self._flush_diagnostics)
+            self._diag_buffer.append(f"{message}\n")
+
+    # ------------------------------------------------------------------
+    def _flush_diagnostics(self) -> None:
+        """Append all buffered lines to ``logs/startup.log`` in one write."""
+
+        with self._report_lock:
+            lines, self._diag_buffer = self._diag_buffer, []
+            if not lines:
+                return
+            atexit.unregister(self._flush_diagnostics)
+            try:
+                with self.diagnostics_file.open("a", encoding="utf-8") as handle:
+                    handle.write("".join(lines))
+            except OSError as error:
+                self.logger.warning("Startprotokoll konnte nicht geschrieben werden: %s", error)
 
     # ------------------------------------------------------------------
     def _trim_diagnostics_log(self, max_lines: int = MAX_STARTUP_LOG_LINES) -> bool:
-        """Kürzt das Startprotokoll auf eine sinnvolle Länge (Hauskeeping)."""
+        """Kürzt das Startprotokoll auf eine sinnvolle Länge (Hauskeeping).
+
+        The file is read backwards in blocks only until ``max_lines + 1`` line
+        breaks are known; the older part of a long log is never read.
+        """
 
         if max_lines <= 0 or not self.diagnostics_file.exists():
             return False
+        chunks: Deque[bytes] = deque()
         try:
-            with self.diagnostics_file.open("r", encoding="utf-8") as handle:
-                lines = handle.readlines()
+            with self.diagnostics_file.open("rb") as handle:
+                position = handle.seek(0, os.SEEK_END)
+                newlines = 0
+                while position > 0 and newlines <= max_lines:
+                    size = min(TRIM_BLOCK_SIZE, position)
+                    position -= size
+                    handle.seek(position)
+                    block = handle.read(size)
+                    chunks.appendleft(block)
+                    newlines += block.count(b"\n")
         except OSError as error:
             self.logger.warning("Startprotokoll konnte nicht gelesen werden: %s", error)
             return False
+        # BytesIO trennt nur an b"\n"; die erste (evtl. angeschnittene) Zeile
+        # fällt durch maxlen heraus, sobald mehr als max_lines vorhanden sind.
+        lines = deque(io.BytesIO(b"".join(chunks)), maxlen=max_lines + 1)
         if len(lines) <= max_lines:
             return False
-        trimmed = lines[-max_lines:]
-        try:
-            with self.diagnostics_file.open("w", encoding="utf-8") as handle:
-                handle.writelines(trimmed)
-        except OSError as error:
-            self.logger.warning("Startprotokoll konnte nicht gekürzt werden: %s", error)
+        lines.popleft()
+        if not atomic_write_bytes(
+            self.diagnostics_file, b"".join(lines), durable=False, logger=self.logger
+        ):
+            self.logger.warning("Startprotokoll konnte nicht gekürzt werden.")
             return False
         self.logger.info(
             "Startprotokoll verkürzt: nur die letzten %s Zeilen bleiben erhalten.",
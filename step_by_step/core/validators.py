@@ -31,7 +31,7 @@ class SettingsValidator:
     max_scale: float = 1.8
 
     def __post_init__(self) -> None:
-        self.defaults = dict(DEFAULT_SETTINGS)
+        self.defaults = DEFAULT_SETTINGS
         self.allowed_themes = {name: name for name in THEME_ORDER}
 
     # ------------------------------------------------------------------
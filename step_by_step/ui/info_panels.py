@@ -7,25 +7,16 @@ import tkinter.font as tkfont
 from tkinter import ttk
 from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from step_by_step.core.color_audit import contrast_ratio
 
-def _hex_to_rgb(color: str) -> Tuple[float, float, float]:
-    color = color.strip()
-    if color.startswith("#"):
-        color = color[1:]
-    if len(color) != 6:
-        raise ValueError("Farben bitte als #RRGGBB eingeben")
-    r = int(color[0:2], 16) / 255.0
-    g = int(color[2:4], 16) / 255.0
-    b = int(color[4:6], 16) / 255.0
-    return r, g, b
 
+def _contrast(foreground: str, background: str) -> float:
+    # Gleiche LUT-basierte Berechnung wie im Farbaudit, ohne Float-Umrechnung.
+    try:
+        return contrast_ratio(foreground, background)
+    except ValueError:
+        raise ValueError("Farben bitte als #RRGGBB eingeben") from None
 
-def _relative_luminance(rgb: Tuple[float, float, float]) -> float:
-    def adjust(channel: float) -> float:
-        return channel / 12.92 if channel <= 0.03928 else ((channel + 0.055) / 1.055) ** 2.4
-
-    r, g, b = (adjust(channel) for channel in rgb)
-    return 0.2126 * r + 0.7152 * g + 0.0722 * b
 
 LegendEntry = Tuple[str, str]
 QuickLink = Tuple[str, str, Callable[[], None]]
@@ -399,13 +390,7 @@ def build_contrast_panel(parent: ttk.LabelFrame, colors: Optional[Dict[str, str]
 
     def evaluate_contrast() -> None:
         try:
-            rgb_fg = _hex_to_rgb(entry_fg.get())
-            rgb_bg = _hex_to_rgb(entry_bg.get())
-            lum_fg = _relative_luminance(rgb_fg)
-            lum_bg = _relative_luminance(rgb_bg)
-            lighter = max(lum_fg, lum_bg)
-            darker = min(lum_fg, lum_bg)
-            ratio = (lighter + 0.05) / (darker + 0.05)
+            ratio = _contrast(entry_fg.get(), entry_bg.get())
             meets_text = ratio >= 4.5
             meets_large = ratio >= 3.0
             text_part = "OK für Text" if meets_text else "zu niedrig für Fließtext"
@@ -454,15 +439,6 @@ def build_palette_panel(parent: ttk.LabelFrame, colors: Dict[str, str]) -> None:
     tree.configure(font=body_font)
     tree.pack(fill="both", expand=True)
 
-    def contrast(fg: str, bg: str) -> float:
-        rgb_fg = _hex_to_rgb(fg)
-        rgb_bg = _hex_to_rgb(bg)
-        lum_fg = _relative_luminance(rgb_fg)
-        lum_bg = _relative_luminance(rgb_bg)
-        lighter = max(lum_fg, lum_bg)
-        darker = min(lum_fg, lum_bg)
-        return (lighter + 0.05) / (darker + 0.05)
-
     entries = (
         ("Hintergrund", colors.get("on_background", "#FFFFFF"), colors.get("background", "#000000")),
         ("Flächen", colors.get("on_surface", "#FFFFFF"), colors.get("surface", "#000000")),
@@ -472,7 +448,7 @@ def build_palette_panel(parent: ttk.LabelFrame, colors: Dict[str, str]) -> None:
     )
 
     for label, fg, bg in entries:
-        ratio = contrast(fg, bg)
+        ratio = _contrast(fg, bg)
         tree.insert(
             "",
             "end",
@@ -1096,7 +1096,11 @@ class MainWindow(tk.Tk):
 
     def _save_notes(self) -> None:
         NOTE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(NOTE_FILE, self.note_text.get("1.0", tk.END).strip(), logger=self.logger)
+        atomic_write_text(
+            NOTE_FILE,
+            self.note_text.get("1.0", tk.END).strip(),
+            logger=self.logger,
+        )
         self.stats_var.set("Notizen gespeichert")
         self.logger.info("Notizen gespeichert (%s)", NOTE_FILE)
 
@@ -1137,7 +1141,7 @@ class MainWindow(tk.Tk):
         data["session_count"] = counter
         self.session_count = counter
         self._update_stats_overview()
-        atomic_write_json(STATS_FILE, data, logger=self.logger)
+        atomic_write_json(STATS_FILE, data, durable=False, logger=self.logger)
         self.logger.info("Statistik aktualisiert: Sitzungen=%s", counter)
 
     def _save_stats(self) -> None:
@@ -1,6 +1,38 @@
 import sys
 from pathlib import Path
+from typing import Callable, List
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+class _AtexitRecorder:
+    """Collect atexit hooks of the startup module so a test can run them itself."""
+
+    def __init__(self) -> None:
+        self.hooks: List[Callable[[], None]] = []
+
+    def register(self, hook: Callable[[], None]) -> Callable[[], None]:
+        self.hooks.append(hook)
+        return hook
+
+    def unregister(self, hook: Callable[[], None]) -> None:
+        self.hooks = [registered for registered in self.hooks if registered != hook]
+
+
+@pytest.fixture
+def isolated_startup_log(tmp_path, monkeypatch):
+    """Point the startup log at tmp_path and flush pending lines after the test."""
+
+    from step_by_step.core import startup
+
+    log_file = tmp_path / "startup-logs" / "startup.log"
+    monkeypatch.setattr(startup, "STARTUP_LOG_FILE", log_file)
+    recorder = _AtexitRecorder()
+    monkeypatch.setattr(startup, "atexit", recorder)
+    yield log_file
+    for hook in list(recorder.hooks):
+        hook()
@@ -81,3 +81,18 @@ def test_presenter_hides_offline_section_when_disabled() -> None:
     text = presenter.render()
 
     assert "Offline-Modus" not in text
+
+
+def test_presenter_renders_only_header_for_empty_report() -> None:
+    presenter = StartupReportPresenter(StartupReport())
+
+    assert list(presenter.iter_lines()) == [
+        "[Startprüfung] Zusammenfassung der automatischen Kontrollen:"
+    ]
+
+
+def test_optional_sections_stay_empty_without_data() -> None:
+    presenter = StartupReportPresenter(StartupReport())
+
+    assert list(presenter._iter_color_audit_messages()) == []
+    assert list(presenter._iter_security_messages()) == []
@@ -0,0 +1,115 @@
+"""Tests for the terminal launcher."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_runner_import_does_not_load_tkinter() -> None:
+    """Der Headless-Pfad darf Tk (grafisches Toolkit) nicht laden."""
+
+    code = (
+        "import sys\n"
+        "import step_by_step.cli.runner\n"
+        "print('tkinter' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_relaunch_sets_flag_only_for_child(monkeypatch) -> None:
+    from step_by_step.cli import runner
+    from step_by_step.core.logging_manager import get_logger
+    from step_by_step.core.startup import RELAUNCH_ENV_FLAG, StartupReport
+
+    monkeypatch.delenv(RELAUNCH_ENV_FLAG, raising=False)
+    seen = {}
+
+    def fake_call(command):
+        seen["command"] = command
+        seen["flag"] = os.environ.get(RELAUNCH_ENV_FLAG)
+        return 3
+
+    def fake_execvp(file, args):
+        seen["exec"] = list(args)
+        raise OSError("exec nicht erlaubt")
+
+    monkeypatch.setattr(runner.subprocess, "call", fake_call)
+    monkeypatch.setattr(runner.os, "execvp", fake_execvp)
+    monkeypatch.setattr(runner.os, "name", "posix")
+    report = StartupReport(relaunch_command=["python", "-m", "step_by_step"])
+
+    assert runner.relaunch_if_needed(report, get_logger("test")) == 3
+    assert seen == {
+        "exec": ["python", "-m", "step_by_step"],
+        "command": ["python", "-m", "step_by_step"],
+        "flag": "1",
+    }
+    assert RELAUNCH_ENV_FLAG not in os.environ
+
+
+class _FakeTk:
+    def __init__(self, current: str) -> None:
+        self.current = current
+        self.calls = []
+
+    def call(self, *args):
+        self.calls.append(args)
+        if len(args) == 2:
+            return self.current
+        return ""
+
+
+class _FakeApp:
+    def __init__(self, current: str) -> None:
+        self.tk = _FakeTk(current)
+
+
+def test_apply_font_scaling_skips_matching_value() -> None:
+    from step_by_step.cli import runner
+    from step_by_step.core.logging_manager import get_logger
+
+    app = _FakeApp("1.2")
+    runner.apply_font_scaling(app, 1.2, get_logger("test"))
+    assert app.tk.calls == [("tk", "scaling")]
+
+    app = _FakeApp("1.0")
+    runner.apply_font_scaling(app, 1.2, get_logger("test"))
+    assert app.tk.calls[-1] == ("tk", "scaling", 1.2)
+
+
+def test_log_records_survive_the_exec_relaunch(monkeypatch) -> None:
+    from step_by_step.cli import runner
+    from step_by_step.core import logging_manager
+
+    logger = logging_manager.get_logger("test.relaunch")
+    log_file = logging_manager._listener.handlers[0].target.baseFilename
+    markers = [f"Vor dem Neustart {index} {time.monotonic_ns()}" for index in range(5)]
+    seen = {}
+
+    def fake_execvp(file, args):
+        # Stand der Logdatei in dem Moment, in dem der Prozess ersetzt würde.
+        with open(log_file, encoding="utf-8") as handle:
+            seen["log"] = handle.read()
+        raise OSError("exec nicht erlaubt")
+
+    monkeypatch.setattr(runner.os, "execvp", fake_execvp)
+    for marker in markers:
+        logger.info(marker)
+
+    runner._replace_process(["/bin/echo", "neu"], logger)
+
+    assert all(marker in seen["log"] for marker in markers)
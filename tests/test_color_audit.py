@@ -0,0 +1,139 @@
+"""Tests for the WCAG colour audit."""
+
+from __future__ import annotations
+
+import pytest
+
+from step_by_step.core import color_audit
+from step_by_step.core.color_audit import ColorAuditor
+
+
+def test_contrast_ratio_matches_wcag_reference_values() -> None:
+    assert color_audit.contrast_ratio("#000000", "#FFFFFF") == pytest.approx(21.0)
+    assert color_audit.contrast_ratio("#FFFFFF", "#FFFFFF") == pytest.approx(1.0)
+    assert color_audit.contrast_ratio("#777777", "#FFFFFF") == pytest.approx(4.48, abs=0.01)
+
+
+def test_invalid_color_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        color_audit.contrast_ratio("#12345", "#FFFFFF")
+    with pytest.raises(ValueError, match="Ungültige Farbe"):
+        color_audit._hex_to_rgb("#12GG45")
+
+
+def test_hex_to_rgb_returns_channel_bytes() -> None:
+    assert tuple(color_audit._hex_to_rgb(" #FF0080 ")) == (255, 0, 128)
+
+
+def test_generate_report_covers_all_themes() -> None:
+    report = ColorAuditor().generate_report()
+
+    assert [theme.name for theme in report.themes] == list(color_audit.THEME_ORDER)
+    assert report.worst_ratio == pytest.approx(3.15, abs=0.01)
+    assert report.overall_status == "ok"
+    payload = report.to_dict()
+    entries = payload["themes"][0]["entries"]
+    assert len(entries) == len(color_audit.AUDIT_COMBINATIONS)
+    assert set(entries[0]) == {
+        "element",
+        "foreground",
+        "background",
+        "ratio",
+        "minimum",
+        "passes",
+        "suggestion",
+    }
+
+
+def test_generate_report_reuses_cached_result(monkeypatch) -> None:
+    auditor = ColorAuditor()
+    first = auditor.generate_report()
+    first.issues.append("nachträglich verändert")
+
+    def fail(*_args):  # pragma: no cover - must not be called
+        raise AssertionError("Luminanz sollte nicht neu berechnet werden")
+
+    monkeypatch.setattr(color_audit, "_luminance_table", fail)
+    second = auditor.generate_report()
+
+    assert second.issues == []
+    assert second.worst_ratio == first.worst_ratio
+
+    auditor.invalidate()
+    with pytest.raises(AssertionError):
+        auditor.generate_report()
+
+
+def test_failing_rule_produces_issue_and_suggestion(monkeypatch) -> None:
+    monkeypatch.setattr(color_audit, "THEME_ORDER", ("grau",))
+    monkeypatch.setattr(
+        color_audit,
+        "get_theme_colors",
+        lambda name: {"background": "#777777", "on_background": "#888888"},
+    )
+
+    report = ColorAuditor().generate_report()
+
+    assert report.overall_status == "attention"
+    assert any("Basis-Text" in issue for issue in report.issues)
+    assert any("Hintergrund um ~" in tip and "abdunkeln" in tip for tip in report.recommendations)
+
+
+def test_suggested_darkening_reaches_the_minimum() -> None:
+    fg_lum = color_audit._relative_luminance("#888888")
+    bg_lum = color_audit._relative_luminance("#777777")
+    ratio = color_audit._ratio_from_luminance(fg_lum, bg_lum)
+
+    tip = color_audit._suggest_adjustment("grau", "Basis-Text", fg_lum, bg_lum, 4.5, ratio)
+    percent = int(tip.split("~")[1].split(" ")[0])
+    channel = round(0x77 * (100 - percent) / 100)
+    darkened = f"#{channel:02X}{channel:02X}{channel:02X}"
+
+    assert color_audit.contrast_ratio("#888888", darkened) >= 4.5
+
+
+def test_suggestion_falls_back_to_lightening() -> None:
+    # Schwarzer Text auf sehr dunklem Grund: Abdunkeln reicht nicht mehr.
+    fg_lum = color_audit._relative_luminance("#000000")
+    bg_lum = color_audit._relative_luminance("#222222")
+    ratio = color_audit._ratio_from_luminance(fg_lum, bg_lum)
+
+    tip = color_audit._suggest_adjustment("dunkel", "Basis-Text", fg_lum, bg_lum, 4.5, ratio)
+
+    assert "Hintergrund um ~" in tip and "aufhellen" in tip
+
+
+def test_report_summary_is_tracked_incrementally() -> None:
+    report = color_audit.ColorAuditReport(generated_at="jetzt")
+    assert report.to_dict()["worst_ratio"] == 0.0
+    assert report.overall_status == "ok"
+
+    report.add_theme(color_audit.ThemeAudit(name="hell", worst_ratio=7.0))
+    report.add_theme(color_audit.ThemeAudit(name="dunkel", worst_ratio=12.0))
+    report.add_issue("Thema 'hell': zu wenig Kontrast")
+
+    assert report.worst_ratio == 7.0
+    assert report.overall_status == "attention"
+    assert report.to_dict()["overall_status"] == "attention"
+
+
+@pytest.mark.usefixtures("isolated_startup_log")
+def test_startup_audit_reuses_report_across_runs(tmp_path, monkeypatch) -> None:
+    from step_by_step.core import startup
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    ColorAuditor().invalidate()
+    calls = []
+    original = color_audit._luminance_table
+    monkeypatch.setattr(
+        color_audit, "_luminance_table", lambda palettes: calls.append(1) or original(palettes)
+    )
+
+    for _ in range(2):
+        manager = startup.StartupManager()
+        manager.audit_color_contrast()
+        manager._flush_diagnostics()
+
+    assert calls == [1]
+    assert manager.report.color_audit["overall_status"] == "ok"
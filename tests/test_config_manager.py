@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from step_by_step.core.config_manager import ConfigManager, UserPreferences
 from step_by_step.core.defaults import DEFAULT_SETTINGS
 
@@ -38,3 +40,105 @@ def test_save_preferences_persists_updates(tmp_path):
     stored = json.loads(config_path.read_text(encoding="utf-8"))
     assert stored["audio_volume"] == 0.42
     assert stored["custom"] == "value"
+
+
+def test_load_preferences_reuses_parsed_payload_in_memory(tmp_path, monkeypatch):
+    config_path = tmp_path / "settings.json"
+    manager = ConfigManager(file_path=config_path)
+    manager.load_preferences()
+    first = manager.load_preferences()
+
+    def fail_read_bytes(*_args, **_kwargs):  # pragma: no cover - must not be called
+        raise AssertionError("unveränderte Datei darf nicht erneut gelesen werden")
+
+    monkeypatch.setattr(type(config_path), "read_bytes", fail_read_bytes)
+    second = manager.load_preferences()
+
+    assert second == first
+    assert second is not first
+
+
+def test_memory_cache_is_invalidated_on_save(tmp_path):
+    config_path = tmp_path / "settings.json"
+    manager = ConfigManager(file_path=config_path)
+    prefs = manager.load_preferences()
+    manager.load_preferences()
+    prefs.audio_volume = 0.3
+
+    manager.save_preferences(prefs)
+
+    assert manager._cached_payload is None
+    assert manager.load_preferences().audio_volume == 0.3
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["settings.json"]
+
+
+def test_load_preferences_skips_rewrite_of_canonical_file(tmp_path, monkeypatch):
+    config_path = tmp_path / "settings.json"
+    manager = ConfigManager(file_path=config_path)
+    manager.load_preferences()
+
+    def fail_write(*_args, **_kwargs):  # pragma: no cover - must not be called
+        raise AssertionError("unveränderte Einstellungen dürfen nicht neu geschrieben werden")
+
+    fresh = ConfigManager(file_path=config_path)
+    monkeypatch.setattr(fresh, "_write_payload", fail_write)
+    assert fresh.load_preferences().theme == DEFAULT_SETTINGS["theme"]
+
+
+def test_load_preferences_rewrites_corrected_values(tmp_path):
+    config_path = tmp_path / "settings.json"
+    payload = dict(DEFAULT_SETTINGS, font_scale=5)
+    config_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    prefs = ConfigManager(file_path=config_path).load_preferences()
+
+    assert prefs.font_scale == 1.8
+    assert json.loads(config_path.read_text(encoding="utf-8"))["font_scale"] == 1.8
+
+
+def test_default_settings_are_read_only():
+    with pytest.raises(TypeError):
+        DEFAULT_SETTINGS["theme"] = "dark"  # type: ignore[index]
+
+
+def test_normalise_is_memoised_by_content(tmp_path, monkeypatch):
+    config_path = tmp_path / "settings.json"
+    manager = ConfigManager(file_path=config_path)
+    manager.load_preferences()
+    first = manager.load_preferences()
+
+    # Gleicher Inhalt neu geschrieben: Zeitstempel-Caches greifen nicht mehr.
+    config_path.write_bytes(config_path.read_bytes())
+    manager._cached_key = None
+
+    def fail_normalise(raw):  # pragma: no cover - must not be called
+        raise AssertionError("Validator sollte nicht erneut laufen")
+
+    monkeypatch.setattr(manager.validator, "normalise", fail_normalise)
+    assert manager.load_preferences() == first
+
+
+def test_to_dict_flattens_extras_without_extra_key():
+    prefs = UserPreferences.from_dict({"theme": "dark", "custom": 1})
+
+    payload = prefs.to_dict()
+
+    assert "extra" not in payload
+    assert payload["theme"] == "dark"
+    assert payload["custom"] == 1
+    assert UserPreferences.from_dict(payload) == prefs
+
+
+def test_legacy_extra_key_is_dropped_on_save(tmp_path):
+    config_path = tmp_path / "settings.json"
+    legacy = dict(DEFAULT_SETTINGS, custom="value", extra={"custom": "value"})
+    config_path.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+    manager = ConfigManager(file_path=config_path)
+
+    prefs = manager.load_preferences()
+    manager.save_preferences(prefs)
+
+    assert prefs.extra == {"custom": "value"}
+    stored = json.loads(config_path.read_text(encoding="utf-8"))
+    assert "extra" not in stored
+    assert stored["custom"] == "value"
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import step_by_step.core as core
+
+
+def test_all_matches_lazy_exports():
+    """__all__ ist für Linter ausgeschrieben und muss zu den Lazy-Exporten passen."""
+
+    assert sorted(core.__all__) == sorted(core._LAZY_EXPORTS)
+    assert len(core.__all__) == len(set(core.__all__))
+
+
+def test_every_export_resolves():
+    for name in core.__all__:
+        assert getattr(core, name) is not None
@@ -1,25 +1,40 @@
 from __future__ import annotations
 
+import io
 import subprocess
+import sys
 from pathlib import Path
 
-from step_by_step.core.dependency_manager import DependencyManager
+import pytest
 
+from step_by_step.core.dependency_manager import MAX_OUTPUT_LINES, DependencyManager
 
-class DummyCompletedProcess:
-    def __init__(self, stdout: str = "", stderr: str = "") -> None:
-        self.stdout = stdout
-        self.stderr = stderr
-        self.returncode = 0
+
+class DummyPopen:
+    def __init__(self, stdout: str = "", stderr: str = "", returncode: int = 0) -> None:
+        self.stdout = io.StringIO(stdout)
+        self.stderr = io.StringIO(stderr)
+        self.returncode = returncode
+
+    def wait(self) -> int:
+        return self.returncode
+
+    def __enter__(self) -> "DummyPopen":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stdout.close()
+        self.stderr.close()
+        self.wait()
 
 
 def test_dependency_manager_success(monkeypatch):
     """A successful installation returns a positive outcome."""
 
-    def fake_run(command, capture_output, text, check):  # noqa: D401 - matches subprocess API
-        return DummyCompletedProcess(stdout="installed")
+    def fake_popen(command, **kwargs):  # noqa: D401 - matches subprocess API
+        return DummyPopen(stdout="installed")
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
     manager = DependencyManager("python")
 
     outcome = manager.install_requirements(Path("requirements.txt"), "requirements installieren")
@@ -32,17 +47,10 @@ def test_dependency_manager_success(monkeypatch):
 def test_dependency_manager_offline_detection(monkeypatch):
     """Offline marker strings should be translated into readable hints."""
 
-    error = subprocess.CalledProcessError(
-        1,
-        ["python", "-m", "pip"],
-        output="",
-        stderr="Name or service not known",
-    )
-
-    def fake_run(*args, **kwargs):
-        raise error
+    def fake_popen(*args, **kwargs):
+        return DummyPopen(stderr="Name or service not known", returncode=1)
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
     manager = DependencyManager("python")
 
     outcome = manager.install_package(
@@ -52,3 +60,80 @@ def test_dependency_manager_offline_detection(monkeypatch):
     assert outcome.success is False
     assert outcome.offline_detected is True
     assert "Keine Netzwerkverbindung" in outcome.offline_hint
+
+
+def test_dependency_manager_keeps_bounded_output_and_early_hints(monkeypatch):
+    """Long pip output is trimmed, early offline markers are still detected."""
+
+    noisy = "Name or service not known\n" + "".join(f"Zeile {i}\n" for i in range(1000))
+
+    def fake_popen(*args, **kwargs):
+        return DummyPopen(stderr=noisy, returncode=1)
+
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
+    outcome = DependencyManager("python").install_package("paket", ["-m", "pip"])
+
+    assert outcome.offline_detected is True
+    assert outcome.stderr.splitlines() == [
+        f"Zeile {i}" for i in range(1000 - MAX_OUTPUT_LINES, 1000)
+    ]
+
+
+def test_offline_hint_prefers_network_errors_over_timeouts():
+    manager = DependencyManager("python")
+
+    assert manager._detect_offline_hint("Read TIMED OUT") == (
+        "Netzwerk-Zeitüberschreitung: Verbindung prüfen und später erneut versuchen."
+    )
+    hint = manager._detect_offline_hint("timed out ... Temporary failure in name resolution")
+    assert hint is not None and "Keine Netzwerkverbindung" in hint
+    assert manager._detect_offline_hint("ERROR: No matching distribution") is None
+
+
+def test_run_closes_pipes_of_a_real_process(monkeypatch):
+    processes = []
+    original = subprocess.Popen
+
+    def tracking_popen(*args, **kwargs):
+        process = original(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(subprocess, "Popen", tracking_popen)
+    command = [sys.executable, "-c", "import sys; print('ok'); print('warn', file=sys.stderr)"]
+
+    outcome = DependencyManager(sys.executable)._run(command, "Test")
+
+    assert outcome.success and outcome.stdout == "ok" and outcome.stderr == "warn"
+    (process,) = processes
+    assert process.stdout.closed and process.stderr.closed
+    assert process.returncode == 0
+
+
+@pytest.mark.usefixtures("isolated_startup_log")
+def test_installed_versions_scan_is_shared_until_pip_runs(monkeypatch):
+    from step_by_step.core import dependency_manager, startup
+    from step_by_step.core.diagnostics import DiagnosticsManager
+
+    calls = []
+
+    class Dist:
+        metadata = {"Name": "SimpleAudio"}
+        version = "1.0"
+
+    def fake_distributions():
+        calls.append(1)
+        return [Dist()]
+
+    monkeypatch.setattr("importlib.metadata.distributions", fake_distributions)
+    dependency_manager.invalidate_installed_versions()
+
+    assert startup.StartupManager()._is_package_installed("simpleaudio")
+    packages = {status.name: status for status in DiagnosticsManager()._collect_packages()}
+    assert packages["simpleaudio"].version == "1.0"
+    assert len(calls) == 1
+
+    monkeypatch.setattr(subprocess, "Popen", lambda command, **kwargs: DummyPopen())
+    DependencyManager("python").install_package("demo", ["-m", "pip", "install", "demo"])
+    dependency_manager.installed_versions()
+    assert len(calls) == 2
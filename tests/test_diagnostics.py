@@ -0,0 +1,241 @@
+"""Tests for the diagnostics collection and export."""
+
+from __future__ import annotations
+
+import html
+import json
+import os
+import threading
+
+import pytest
+
+from step_by_step.core import diagnostics
+from step_by_step.core.dependency_manager import invalidate_installed_versions
+from step_by_step.core.diagnostics import DiagnosticsManager, DiagnosticsReport
+
+
+def _report(**overrides) -> DiagnosticsReport:
+    values = dict(
+        generated_at="2024-01-01T12:00:00",
+        python={"version": "3.11.0", "executable": "/usr/bin/python3"},
+        virtualenv={"active": False},
+        paths=[{"path": "data", "kind": "folder", "exists": True, "writable": True}],
+        packages=[
+            {
+                "name": "simpleaudio",
+                "version": "",
+                "required": ">=1.0",
+                "installed": False,
+                "meets_requirement": False,
+                "message": "Nicht installiert.",
+            }
+        ],
+        summary={"status": "attention", "issues": ["Paket fehlt"], "recommendations": []},
+        startup={"note": "<Größe & Co>"},
+    )
+    values.update(overrides)
+    return DiagnosticsReport(**values)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_save_writes_utf8_json(workdir):
+    report = _report()
+
+    target = DiagnosticsManager().save(report)
+
+    stored = json.loads((workdir / target).read_bytes())
+    assert stored == report.to_dict()
+    assert "Größe" in (workdir / target).read_text(encoding="utf-8")
+
+
+def test_export_html_escapes_startup_snapshot(workdir):
+    target = DiagnosticsManager().export_html(_report())
+
+    content = (workdir / target).read_text(encoding="utf-8")
+    assert "&lt;Größe &amp; Co&gt;" in content
+    assert "<td>simpleaudio</td>" in content
+
+
+def test_collect_packages_scans_distributions_once(workdir, monkeypatch):
+    (workdir / "requirements.txt").write_text("Demo_Pkg>=1.0\nfehlt==2.0\n", encoding="utf-8")
+    calls = []
+
+    class Dist:
+        metadata = {"Name": "demo-pkg"}
+        version = "1.2"
+
+    def fake_distributions():
+        calls.append(1)
+        return [Dist()]
+
+    monkeypatch.setattr("importlib.metadata.distributions", fake_distributions)
+    invalidate_installed_versions()
+    manager = DiagnosticsManager()
+
+    first = {status.name: status for status in manager._collect_packages()}
+    second = list(manager._collect_packages())
+
+    assert len(calls) == 1
+    assert len(second) == len(first)
+    assert first["Demo_Pkg"].installed and first["Demo_Pkg"].version == "1.2"
+    assert not first["fehlt"].installed
+    assert not first["simpleaudio"].installed
+
+
+def test_parse_requirements_is_cached_until_file_changes(workdir):
+    requirements = workdir / "requirements.txt"
+    requirements.write_text("# Kommentar\nalpha>=1.0\nbeta\n", encoding="utf-8")
+    manager = DiagnosticsManager()
+
+    first = manager._parse_requirements()
+    assert dict(first) == {"alpha": ">=1.0", "beta": ""}
+    assert manager._parse_requirements() is first
+
+    requirements.write_text("gamma==2.0\n", encoding="utf-8")
+    stat = requirements.stat()
+    os.utime(requirements, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert dict(manager._parse_requirements()) == {"gamma": "==2.0"}
+
+
+@pytest.mark.parametrize(
+    ("current", "spec", "meets"),
+    [
+        ("1.0.4", '==1.0.4 ; platform_system != "Linux"', True),
+        ("1.10", ">=1.9", True),
+        ("2.0rc1", ">=2.0", False),
+        ("1.2", "<1.2", False),
+        ("unbekannt", ">=0", True),
+    ],
+)
+def test_check_requirement(current, spec, meets):
+    assert DiagnosticsManager()._check_requirement(current, spec)[0] is meets
+
+
+def test_check_requirement_without_packaging(monkeypatch):
+    monkeypatch.setattr(diagnostics, "Version", None)
+    manager = DiagnosticsManager()
+
+    assert manager._check_requirement("1.10", ">=1.9") == (True, "")
+    assert manager._check_requirement("1.2", ">=1.2.1")[0] is False
+
+
+def test_collect_paths_reports_existing_and_missing(workdir):
+    (workdir / "data" / "backups").mkdir(parents=True)
+    (workdir / "logs").mkdir()
+    (workdir / "logs" / "startup.log").write_text("", encoding="utf-8")
+
+    statuses = {str(status.path): status for status in DiagnosticsManager()._collect_paths()}
+
+    assert statuses["data"].exists and statuses["data"].writable
+    assert statuses["data/backups"].exists
+    assert not statuses["data/exports"].exists and statuses["data/exports"].writable
+    assert statuses["logs/startup.log"].exists and statuses["logs/startup.log"].kind == "file"
+
+
+def test_collect_runs_probes_concurrently(workdir, monkeypatch):
+    barrier = threading.Barrier(3, timeout=5)
+    manager = DiagnosticsManager()
+
+    def venv():
+        barrier.wait()
+        return {"active": True}
+
+    def paths():
+        barrier.wait()
+        yield diagnostics.PathStatus(path=workdir, exists=True, writable=True)
+
+    def packages():
+        barrier.wait()
+        yield from ()
+
+    monkeypatch.setattr(manager, "_collect_virtualenv_info", venv)
+    monkeypatch.setattr(manager, "_collect_paths", paths)
+    monkeypatch.setattr(manager, "_collect_packages", packages)
+
+    report = manager.collect()
+
+    assert report.virtualenv == {"active": True}
+    assert len(report.paths) == 1
+    assert report.packages == []
+
+
+def test_virtualenv_info_detects_active_environment(workdir, monkeypatch):
+    (workdir / ".venv").mkdir()
+    monkeypatch.setenv("VIRTUAL_ENV", str(workdir / ".venv"))
+
+    info = DiagnosticsManager()._collect_virtualenv_info()
+
+    assert info["active"] is True
+    assert info["expected_path"] == str((workdir / ".venv").resolve())
+
+    monkeypatch.delenv("VIRTUAL_ENV")
+    assert DiagnosticsManager()._collect_virtualenv_info()["active"] is False
+
+
+def test_esc_matches_html_escape():
+    sample = "<a href=\"x\">Tom & Jerry's</a>"
+    assert diagnostics._esc(sample) == html.escape(sample)
+
+
+def test_collect_packages_yields_sorted_names(workdir, monkeypatch):
+    (workdir / "requirements.txt").write_text("zeta\nalpha\nmitte\n", encoding="utf-8")
+    monkeypatch.setattr("importlib.metadata.distributions", lambda: [])
+    invalidate_installed_versions()
+    manager = DiagnosticsManager()
+
+    names = [status.name for status in manager._collect_packages()]
+    assert names == sorted(names)
+
+    report = manager.collect()
+    assert "Fehlende Pakete: alpha, mitte, simpleaudio, zeta." in manager.summary_lines(report)
+
+
+def test_row_formatter_fills_missing_cells():
+    assert diagnostics._format_path_row({"path": "data", "exists": True}) == (
+        "<tr><td>data</td><td></td><td>True</td><td></td></tr>"
+    )
+    assert diagnostics._format_path_row("kaputt") == "<tr>" + "<td></td>" * 4 + "</tr>"
+
+
+def test_to_dict_is_shared_until_a_field_changes():
+    report = _report()
+
+    first = report.to_dict()
+    assert report.to_dict() is first
+    assert "_cached_dict" not in first
+
+    report.html_report_path = "data/diagnostics_report.html"
+    second = report.to_dict()
+    assert second is not first
+    assert second["html_report_path"] == "data/diagnostics_report.html"
+    assert report == _report(html_report_path="data/diagnostics_report.html")
+
+
+def test_collect_timestamp_has_second_resolution(workdir):
+    report = DiagnosticsManager().collect()
+
+    assert len(report.generated_at) == len("2024-01-01T12:00:00")
+
+
+def test_package_plan_is_reused_while_requirements_are_unchanged(workdir):
+    (workdir / "requirements.txt").write_text("beta>=1\n", encoding="utf-8")
+    manager = DiagnosticsManager()
+
+    plan = diagnostics._package_plan(*manager._requirements_source())
+
+    assert plan == (("beta", "Abhängigkeit", ">=1"), ("simpleaudio", "Audiowiedergabe", ""))
+    assert diagnostics._package_plan(*manager._requirements_source()) is plan
+
+
+def test_python_info_is_computed_once(workdir):
+    first = DiagnosticsManager().collect().python
+    second = DiagnosticsManager().collect().python
+
+    assert first == second
+    assert first["cwd"] == str(workdir)
+    assert diagnostics._python_info.cache_info().currsize == 1
@@ -1,7 +1,13 @@
+import errno
 import json
 import logging
+import os
+from types import MappingProxyType
 
-from step_by_step.core.file_utils import atomic_write_json
+import pytest
+
+from step_by_step.core import file_utils
+from step_by_step.core.file_utils import atomic_write_bytes, atomic_write_json, atomic_write_text
 
 
 def test_atomic_write_json_creates_file(tmp_path):
@@ -24,3 +30,106 @@ def test_atomic_write_json_handles_serialisation_error(tmp_path, caplog):
     assert result is False
     assert not target.exists()
     assert any("JSON konnte nicht serialisiert" in message for message in caplog.text.splitlines())
+
+
+def test_atomic_write_bytes_replaces_content_without_leftovers(tmp_path):
+    target = tmp_path / "data.bin"
+    target.write_bytes(b"alt")
+
+    assert atomic_write_bytes(target, b"neu\n")
+
+    assert target.read_bytes() == b"neu\n"
+    assert [path.name for path in tmp_path.iterdir()] == ["data.bin"]
+
+
+def test_atomic_write_text_encodes_once(tmp_path):
+    target = tmp_path / "notiz.txt"
+
+    assert atomic_write_text(target, "Größe\n")
+
+    assert target.read_bytes() == "Größe\n".encode("utf-8")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_dumps_json_layout_is_backend_independent(monkeypatch, backend):
+    if backend == "json":
+        monkeypatch.setattr(file_utils, "orjson", None)
+    elif file_utils.orjson is None:
+        pytest.skip("orjson ist nicht installiert")
+    payload = {"name": "Größe", "werte": [1, 2], "nur_lesen": MappingProxyType({"a": True})}
+
+    data = file_utils.dumps_json(payload)
+
+    assert data == json.dumps(
+        {**payload, "nur_lesen": {"a": True}}, indent=2, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def test_atomic_write_json_honours_other_encodings(tmp_path):
+    target = tmp_path / "latin.json"
+
+    assert atomic_write_json(target, {"wort": "Größe"}, encoding="latin-1")
+
+    assert json.loads(target.read_text(encoding="latin-1")) == {"wort": "Größe"}
+
+
+def test_atomic_write_json_writes_utf8_aliases_unchanged(tmp_path, monkeypatch):
+    target = tmp_path / "alias.json"
+
+    def fail(*_args, **_kwargs):  # pragma: no cover - must not be called
+        raise AssertionError("UTF-8-Daten sollten nicht erneut kodiert werden")
+
+    monkeypatch.setattr(file_utils, "atomic_write_text", fail)
+
+    assert atomic_write_json(target, {"wort": "Größe"}, encoding="UTF_8")
+    assert target.read_bytes() == file_utils.dumps_json({"wort": "Größe"})
+
+
+@pytest.mark.parametrize("durable", [True, False])
+def test_atomic_write_bytes_fsync_depends_on_durable(tmp_path, monkeypatch, durable):
+    synced = []
+    monkeypatch.setattr(file_utils.os, "fsync", synced.append)
+
+    assert atomic_write_text(tmp_path / "status.txt", "ok", durable=durable)
+
+    assert (tmp_path / "status.txt").read_text(encoding="utf-8") == "ok"
+    # Datei und (wo unterstützt) Ordnereintrag werden nur dauerhaft geschrieben.
+    assert len(synced) == (1 + hasattr(os, "O_DIRECTORY") if durable else 0)
+
+
+@pytest.mark.skipif(not hasattr(os, "O_TMPFILE"), reason="nur unter Linux verfügbar")
+def test_atomic_write_bytes_links_anonymous_tmpfile(tmp_path, monkeypatch):
+    linked = []
+
+    def fake_link(source, destination):
+        # Sandboxen verweigern linkat über /proc; Inhalt stattdessen kopieren.
+        with open(source, "rb") as handle:
+            data = handle.read()
+        linked.append(destination)
+        with open(destination, "xb") as handle:
+            handle.write(data)
+
+    monkeypatch.setattr(file_utils, "_tmpfile_supported", True)
+    monkeypatch.setattr(file_utils.os, "link", fake_link)
+    # O_WRONLY-Deskriptoren lassen sich über /proc nicht lesen – für den Test O_RDWR.
+    monkeypatch.setattr(file_utils.os, "O_WRONLY", os.O_RDWR)
+
+    assert atomic_write_bytes(tmp_path / "daten.json", b"{}")
+
+    assert (tmp_path / "daten.json").read_bytes() == b"{}"
+    assert len(linked) == 1 and linked[0].startswith(str(tmp_path))
+    assert [path.name for path in tmp_path.iterdir()] == ["daten.json"]
+
+
+def test_atomic_write_bytes_falls_back_without_tmpfile_support(tmp_path, monkeypatch):
+    def unsupported(*_args):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(file_utils, "_tmpfile_supported", True)
+    monkeypatch.setattr(file_utils, "_write_anonymous", unsupported)
+
+    assert atomic_write_bytes(tmp_path / "daten.bin", b"123")
+
+    assert (tmp_path / "daten.bin").read_bytes() == b"123"
+    assert file_utils._tmpfile_supported is False
+    assert [path.name for path in tmp_path.iterdir()] == ["daten.bin"]
@@ -0,0 +1,160 @@
+"""Tests for reading and searching log files."""
+
+from __future__ import annotations
+
+import re
+import sys
+
+import pytest
+
+from step_by_step.core import log_reader
+from step_by_step.core.log_reader import LogReader
+
+
+@pytest.fixture
+def small_buffer(monkeypatch):
+    # Kleine Blöcke, damit Zeilen über Blockgrenzen hinweg getestet werden.
+    monkeypatch.setattr(log_reader, "BUFFER_SIZE", 7)
+
+
+def _write(tmp_path, content):
+    target = tmp_path / "logs" / "startup.log"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(content.encode("utf-8") if isinstance(content, str) else content)
+    return LogReader(target)
+
+
+@pytest.mark.parametrize("trailing", ["", "\n"])
+@pytest.mark.parametrize("limit", [1, 3, 50])
+def test_read_tail_matches_full_read(tmp_path, small_buffer, trailing, limit):
+    lines = [f"Zeile {number} – Größe" for number in range(1, 21)]
+    reader = _write(tmp_path, "\n".join(lines) + trailing)
+
+    entries = reader.read_tail(limit=limit)
+
+    assert [entry.content for entry in entries] == lines[-limit:]
+    assert [entry.line_number for entry in entries] == list(range(1, len(entries) + 1))
+
+
+def test_read_tail_handles_empty_and_latin1_files(tmp_path):
+    reader = LogReader(tmp_path / "logs" / "leer.log")
+    assert reader.read_tail() == []
+
+    reader = _write(tmp_path, "Größe\n".encode("latin-1"))
+    assert [entry.content for entry in reader.read_tail()] == ["Größe"]
+
+
+def _reference_search(text: str, term: str, limit: int):
+    term_cf = term.casefold()
+    return [
+        (index + 1, line)
+        for index, line in enumerate(text.splitlines())
+        if term_cf in line.casefold()
+    ][:limit]
+
+
+@pytest.mark.parametrize(
+    ("term", "limit"),
+    [("fehler", 50), ("FEHLER", 2), ("größe", 50), ("strasse", 50), ("xyz", 50)],
+)
+def test_search_matches_casefold_reference(tmp_path, small_buffer, term, limit):
+    text = "\n".join(
+        [
+            "INFO Start",
+            "ERROR Fehler beim Laden",
+            "WARNING Größe geändert",
+            "INFO Straße gespeichert",
+            "DEBUG fehler und FEHLER in einer Zeile",
+            "INFO Ende ohne Umbruch – fehler",
+        ]
+    )
+    reader = _write(tmp_path, text)
+
+    entries = reader.search(term, limit=limit)
+
+    assert [(entry.line_number, entry.content) for entry in entries] == _reference_search(
+        text, term, limit
+    )
+
+
+def test_search_handles_latin1_logs(tmp_path):
+    reader = _write(tmp_path, "INFO ok\nERROR Größe falsch\n".encode("latin-1"))
+
+    assert [(entry.line_number, entry.content) for entry in reader.search("error")] == [
+        (2, "ERROR Größe falsch")
+    ]
+
+
+def test_regex_search_is_case_insensitive_and_cached(tmp_path):
+    reader = _write(tmp_path, "INFO Start\nERROR Code 42\nerror code 7\nINFO Ende\n")
+    log_reader._compile_query.cache_clear()
+
+    first = reader.search(r"error code \d+$", regex=True)
+    second = reader.search(r"error code \d+$", regex=True)
+
+    assert [entry.line_number for entry in first] == [2, 3]
+    assert first == second
+    assert log_reader._compile_query.cache_info().hits == 1
+
+
+def test_invalid_regex_raises_value_error(tmp_path):
+    reader = _write(tmp_path, "INFO Start\n")
+
+    with pytest.raises(ValueError, match="Ungültiger Suchausdruck"):
+        reader.search("(offen", regex=True)
+
+
+def test_read_tail_only_reads_appended_bytes(tmp_path, monkeypatch):
+    reader = _write(tmp_path, "".join(f"Zeile {number}\n" for number in range(1, 200)))
+    assert reader.read_tail(limit=2)[-1].content == "Zeile 199"
+
+    with reader.file_path.open("a", encoding="utf-8") as handle:
+        handle.write("Zeile 200\nZeile 2")
+    monkeypatch.setattr(
+        log_reader,
+        "_read_tail_backwards",
+        lambda *_args: pytest.fail("Nur das Angehängte hätte gelesen werden sollen"),
+    )
+    assert [entry.content for entry in reader.read_tail(limit=2)] == ["Zeile 200", "Zeile 2"]
+
+    with reader.file_path.open("a", encoding="utf-8") as handle:
+        handle.write("01\n")
+    assert [entry.content for entry in reader.read_tail(limit=2)] == ["Zeile 200", "Zeile 201"]
+
+
+def test_read_tail_notices_rotated_log(tmp_path):
+    reader = _write(tmp_path, "alt 1\nalt 2\n")
+    assert reader.read_tail(limit=1)[0].content == "alt 2"
+
+    reader.file_path.write_text("neu 1\nneu 2\nneu 3\n", encoding="utf-8")
+
+    assert [entry.content for entry in reader.read_tail(limit=2)] == ["neu 2", "neu 3"]
+
+
+@pytest.mark.parametrize("term", ["n", "j", "h", "t", "w", "y", "a", "ss"])
+def test_search_finds_characters_that_fold_to_ascii(tmp_path, term):
+    text = "\n".join(["INFO ŉ", "INFO ǰ", "INFO ẖẗẘẙẚ", "INFO ẞ", "INFO leer"])
+    reader = _write(tmp_path, text)
+
+    entries = reader.search(term)
+
+    assert [(entry.line_number, entry.content) for entry in entries] == _reference_search(
+        text, term, 50
+    )
+    assert entries
+
+
+def test_fold_pattern_covers_every_ascii_folding_character():
+    """Die fest eingetragene Liste entspricht str.casefold des Interpreters."""
+
+    ascii_char = re.compile(r"[\x00-\x7f]")
+    expected = "".join(
+        char
+        for char in map(chr, range(0x80, sys.maxunicode + 1))
+        if ascii_char.search(char.casefold())
+    )
+
+    assert log_reader._FOLDS_TO_ASCII_CHARS == expected
+    for char in expected:
+        assert log_reader._FOLDS_TO_ASCII.fullmatch(char.encode("utf-8")), char
+    assert not log_reader._FOLDS_TO_ASCII.search("äöü€".encode("utf-8"))
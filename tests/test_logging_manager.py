@@ -0,0 +1,79 @@
+"""Tests for the central logging setup."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from logging.handlers import MemoryHandler, QueueHandler
+
+from step_by_step.core import logging_manager
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    return logging.LogRecord("step_by_step.test", level, __file__, 1, message, None, None)
+
+
+def test_file_output_is_buffered_until_warning(tmp_path):
+    log_file = tmp_path / "tool.log"
+    handler = logging_manager._buffered_file_handler(log_file, logging.Formatter("%(message)s"))
+    try:
+        handler.handle(_record(logging.INFO, "erste Meldung"))
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        handler.handle(_record(logging.WARNING, "Warnung"))
+        assert log_file.read_text(encoding="utf-8").splitlines() == ["erste Meldung", "Warnung"]
+
+        handler.handle(_record(logging.DEBUG, "beim Schließen"))
+    finally:
+        target = handler.target
+        handler.close()
+        target.close()
+    assert log_file.read_text(encoding="utf-8").splitlines()[-1] == "beim Schließen"
+
+
+def test_records_are_written_by_the_listener_thread():
+    logger = logging_manager.setup_logging()
+    assert [type(handler) for handler in logger.handlers] == [QueueHandler]
+
+    buffered, console = logging_manager._listener.handlers
+    thread_names = []
+    console.addFilter(lambda record: thread_names.append(threading.current_thread().name) or True)
+    try:
+        logger.warning("Hintergrund-Test")
+        deadline = time.monotonic() + 5
+        while not thread_names and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        console.filters.clear()
+
+    assert thread_names and thread_names[0] != threading.current_thread().name
+    assert isinstance(buffered, MemoryHandler)
+
+
+def test_records_skip_thread_and_process_details():
+    record = logging.getLogger("step_by_step.test").makeRecord(
+        "step_by_step.test", logging.INFO, __file__, 1, "Meldung", None, None
+    )
+
+    assert record.threadName is None
+    assert record.processName is None
+
+
+def test_flush_logging_writes_buffered_info_records():
+    logger = logging_manager.setup_logging()
+    buffered = logging_manager._listener.handlers[0]
+    marker = f"Gepufferte Meldung {time.monotonic_ns()}"
+
+    logger.info(marker)
+    logging_manager.flush_logging()
+
+    with open(buffered.target.baseFilename, encoding="utf-8") as handle:
+        assert marker in handle.read()
+
+    # Der Listener läuft danach weiter.
+    later = f"Spätere Meldung {time.monotonic_ns()}"
+    logger.info(later)
+    logging_manager.flush_logging()
+    with open(buffered.target.baseFilename, encoding="utf-8") as handle:
+        assert later in handle.read()
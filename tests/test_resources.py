@@ -0,0 +1,28 @@
+"""Tests for the static file templates."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from step_by_step.core import resources
+from step_by_step.core.defaults import DEFAULT_SETTINGS
+
+
+def test_templates_are_serialised_once(monkeypatch):
+    def fail(_payload):  # pragma: no cover - must not be called
+        raise AssertionError("Vorlagen sollten nicht erneut serialisiert werden")
+
+    monkeypatch.setattr(resources, "_dump", fail)
+
+    content = resources.required_file_content(Path("data/settings.json"))
+
+    assert json.loads(content) == dict(DEFAULT_SETTINGS)
+    assert dict(resources.iter_required_files()) == dict(resources.FILE_TEMPLATES)
+
+
+def test_unknown_template_raises_key_error():
+    with pytest.raises(KeyError, match="Keine Vorlage"):
+        resources.required_file_content(Path("data/unbekannt.json"))
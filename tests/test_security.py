@@ -0,0 +1,213 @@
+"""Tests for the checksum manifest and backups."""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from step_by_step.core import security
+from step_by_step.core.security import SecurityManager
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        security,
+        "_SENSITIVE_REL",
+        tuple((path, str(path)) for path in (Path("data/settings.json"), Path("data/fehlt.json"))),
+    )
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "settings.json").write_text('{"theme": "hell"}', encoding="utf-8")
+    return tmp_path
+
+
+def _manifest(workdir: Path) -> dict:
+    return json.loads((workdir / "data" / "security_manifest.json").read_text(encoding="utf-8"))
+
+
+def test_manifest_is_stored_column_wise(workdir):
+    summary = SecurityManager().verify_files()
+
+    manifest = _manifest(workdir)
+    assert set(manifest["sha256"]) == {"data/settings.json", "data/fehlt.json"}
+    assert manifest["sha256"]["data/fehlt.json"] == "missing"
+    assert manifest["size"]["data/settings.json"] == len('{"theme": "hell"}')
+    assert "files" not in manifest
+    assert summary.verified == 2
+    assert summary.status == "attention"
+
+
+def test_unchanged_files_do_not_rewrite_the_manifest(workdir, monkeypatch):
+    SecurityManager().verify_files()
+    writes = []
+    monkeypatch.setattr(SecurityManager, "_write_manifest", lambda self, manifest: writes.append(1))
+
+    summary = SecurityManager().verify_files()
+
+    assert writes == []
+    assert summary.updated_manifest is False
+
+
+def test_legacy_manifest_is_converted_once(workdir):
+    legacy = {
+        "files": {
+            "data/settings.json": {"sha256": "alt", "size": 3, "last_checked": "gestern"},
+        },
+        "created_at": "gestern",
+        "updated_at": "gestern",
+    }
+    (workdir / "data" / "security_manifest.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    manifest = SecurityManager().ensure_manifest()
+
+    assert manifest["sha256"] == {"data/settings.json": "alt"}
+    assert manifest["size"] == {"data/settings.json": 3}
+    stored = _manifest(workdir)
+    assert "files" not in stored
+    assert stored["last_checked"] == {"data/settings.json": "gestern"}
+
+
+def test_checksum_change_creates_backup(workdir):
+    SecurityManager().verify_files()
+    (workdir / "data" / "settings.json").write_text('{"theme": "dunkel"}', encoding="utf-8")
+
+    summary = SecurityManager().verify_files()
+
+    assert any("Checksum-Abweichung" in issue for issue in summary.issues)
+    assert summary.updated_manifest is True
+    restore = {point["file"]: point["status"] for point in summary.restore_points}
+    assert restore["data/fehlt.json"] == "missing"
+
+
+def test_files_are_hashed_concurrently(workdir, monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+    original = SecurityManager._hash_file
+
+    def hash_file(self, path):
+        barrier.wait()
+        return original(self, path)
+
+    monkeypatch.setattr(SecurityManager, "_hash_file", hash_file)
+
+    manager = SecurityManager()
+    assert manager._hash_many([Path("data/settings.json"), Path("data/fehlt.json")])[1] == "missing"
+
+
+@pytest.mark.parametrize("size", [0, 10, security._MMAP_THRESHOLD + 1])
+def test_sha256_matches_hashlib_for_all_sizes(tmp_path, size):
+    target = tmp_path / "blob.bin"
+    data = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+    target.write_bytes(data)
+
+    with target.open("rb") as handle:
+        assert security._sha256_of(handle) == hashlib.sha256(data).hexdigest()
+
+
+def test_unchanged_files_are_not_hashed_again(workdir, monkeypatch):
+    SecurityManager().verify_files()
+    hashed = []
+    original = SecurityManager._hash_file
+
+    def hash_file(self, path):
+        hashed.append(str(path))
+        return original(self, path)
+
+    monkeypatch.setattr(SecurityManager, "_hash_file", hash_file)
+
+    SecurityManager().verify_files()
+    assert "data/settings.json" not in hashed
+
+    hashed.clear()
+    SecurityManager().verify_files(force=True)
+    assert "data/settings.json" in hashed
+
+
+def test_backup_index_prunes_and_finds_latest(workdir):
+    backup_dir = workdir / "data" / "backups"
+    backup_dir.mkdir()
+    for day in range(1, 8):
+        backup = backup_dir / f"settings.json.2024010{day}-120000.bak"
+        backup.write_text(str(day), encoding="utf-8")
+        os.utime(backup, ns=(day * 10**9, day * 10**9))
+    (backup_dir / "notiz.txt").write_text("kein Backup", encoding="utf-8")
+    manager = SecurityManager()
+
+    backups = manager._scan_backups()
+    assert set(backups) == {"settings.json"}
+
+    removed = manager._prune_old_backups("settings.json", backups=backups)
+
+    assert sorted(path.name for path in removed) == [
+        "settings.json.20240101-120000.bak",
+        "settings.json.20240102-120000.bak",
+    ]
+    assert len(backups["settings.json"]) == 5
+    latest = manager._latest_backup("settings.json", backups)
+    assert latest.name == "settings.json.20240107-120000.bak"
+    assert manager._latest_backup("settings.json") == latest
+
+
+def test_summary_to_dict_shares_lists():
+    summary = security.SecuritySummary(status="ok", issues=["Hinweis"])
+
+    payload = summary.to_dict()
+
+    assert payload["issues"] is summary.issues
+    assert list(payload) == [
+        "status",
+        "verified",
+        "issues",
+        "backups",
+        "size_alerts",
+        "pruned_backups",
+        "restore_points",
+        "restore_issues",
+        "updated_manifest",
+        "timestamp",
+    ]
+
+
+def test_summary_timestamp_is_taken_per_instance(monkeypatch):
+    moment = datetime.datetime(2030, 5, 17, 8, 30, 15, 123456)
+
+    class FakeDatetime:
+        @staticmethod
+        def now():
+            return moment
+
+    monkeypatch.setattr(security, "dt", type("dt", (), {"datetime": FakeDatetime}))
+
+    assert security.SecuritySummary().timestamp == "2030-05-17T08:30:15"
+
+
+def test_partial_verify_only_touches_the_given_file(workdir, monkeypatch):
+    full = SecurityManager().verify_files()
+    (workdir / "data" / "settings.json").write_text('{"theme": "dunkel"}', encoding="utf-8")
+    hashed = []
+    original = SecurityManager._hash_many
+
+    def hash_many(self, paths):
+        hashed.extend(paths)
+        return original(self, paths)
+
+    monkeypatch.setattr(SecurityManager, "_hash_many", hash_many)
+
+    partial = SecurityManager().verify_files(paths=[Path("data/settings.json")])
+
+    assert partial.verified == 1
+    assert [entry["file"] for entry in partial.restore_points] == ["data/settings.json"]
+    assert all(path.name == "settings.json" or path.parent.name == "backups" for path in hashed)
+    assert any("Checksum-Abweichung" in issue for issue in partial.issues)
+
+    points = len(full.restore_points)
+    full.merge(partial)
+    assert len(full.restore_points) == points
+    assert full.status == "attention"
+    assert partial.issues[0] in full.issues
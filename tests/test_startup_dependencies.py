@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import pytest
+
 from step_by_step.core import startup
-from step_by_step.core.dependency_manager import DependencyInstallOutcome
+from step_by_step.core.dependency_manager import (
+    DependencyInstallOutcome,
+    invalidate_installed_versions,
+)
+
+pytestmark = pytest.mark.usefixtures("isolated_startup_log")
 
 
 def test_startup_manager_handles_offline_dependencies(monkeypatch):
@@ -56,3 +63,60 @@ def test_startup_manager_handles_offline_dependencies(monkeypatch):
     assert any("requirements-dev.txt" in message for message in report.dependency_messages)
     assert any("Audiowiedergabe" in feature for feature in report.degraded_features)
     assert any("Netz" in reason for reason in report.offline_reasons)
+
+
+def test_unchanged_requirements_skip_pip(tmp_path, monkeypatch):
+    """Ein gespeicherter Hash der requirements.txt überspringt pip beim nächsten Start."""
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(startup.INSTALL_DEV_ENV_FLAG, raising=False)
+    monkeypatch.setattr(startup, "DEPENDENCY_COMMANDS", {})
+    (tmp_path / ".venv").mkdir()
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("alpha>=1\n", encoding="utf-8")
+    calls = []
+
+    class FakeDependencyManager:
+        def __init__(self, python_executable: str) -> None:
+            self.python_executable = python_executable
+
+        def install_requirements(self, requirements_file, description):
+            calls.append(description)
+            return DependencyInstallOutcome(description=description, success=True)
+
+    monkeypatch.setattr(startup, "DependencyManager", FakeDependencyManager)
+
+    startup.StartupManager().ensure_dependencies()
+    assert len(calls) == 1
+    assert (tmp_path / ".venv" / ".requirements.sha256").exists()
+
+    manager = startup.StartupManager()
+    manager.ensure_dependencies()
+    assert len(calls) == 1
+    assert any("Cache-Treffer" in message for message in manager.report.messages)
+
+    requirements.write_text("alpha>=2\n", encoding="utf-8")
+    startup.StartupManager().ensure_dependencies()
+    assert len(calls) == 2
+
+
+def test_package_check_scans_metadata_once(monkeypatch):
+    calls = []
+
+    class Dist:
+        version = "1.0"
+
+        def __init__(self, name):
+            self.metadata = {"Name": name}
+
+    def fake_distributions():
+        calls.append(1)
+        return [Dist("Simple_Audio"), Dist(None)]
+
+    monkeypatch.setattr("importlib.metadata.distributions", fake_distributions)
+    invalidate_installed_versions()
+    manager = startup.StartupManager()
+
+    assert manager._is_package_installed("simple-audio")
+    assert not manager._is_package_installed("fehlt")
+    assert len(calls) == 1
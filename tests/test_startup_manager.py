@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from step_by_step.core import startup
+
+pytestmark = pytest.mark.usefixtures("isolated_startup_log")
+
+
+def test_run_level_executes_steps_concurrently(monkeypatch):
+    """Unabhängige Schritte einer Stufe laufen gleichzeitig."""
+
+    monkeypatch.setattr(startup, "_available_cpus", lambda: 4)
+    manager = startup.StartupManager()
+    barrier = threading.Barrier(2, timeout=5)
+    finished = []
+
+    def step_a() -> None:
+        barrier.wait()
+        finished.append("a")
+
+    def step_b() -> None:
+        barrier.wait()
+        finished.append("b")
+
+    manager._run_level((("A", step_a), ("B", step_b)))
+
+    assert sorted(finished) == ["a", "b"]
+    assert "Schritt abgeschlossen: A" in manager.report.messages
+    assert "Schritt abgeschlossen: B" in manager.report.messages
+
+
+def test_run_level_runs_sequentially_on_single_cpu(monkeypatch):
+    monkeypatch.setattr(startup, "_available_cpus", lambda: 1)
+    manager = startup.StartupManager()
+    threads = []
+
+    def step() -> None:
+        threads.append(threading.current_thread())
+
+    manager._run_level((("A", step), ("B", step)))
+
+    assert threads == [threading.main_thread(), threading.main_thread()]
+
+
+@pytest.mark.parametrize("cpus", [1, 4])
+def test_run_level_reraises_after_all_steps_finished(monkeypatch, cpus):
+    """Fehler werden erst gemeldet, wenn alle Schritte der Stufe fertig sind."""
+
+    monkeypatch.setattr(startup, "_available_cpus", lambda: cpus)
+    manager = startup.StartupManager()
+    finished = []
+
+    def failing() -> None:
+        raise RuntimeError("kaputt")
+
+    def also_failing() -> None:
+        raise ValueError("später")
+
+    def working() -> None:
+        finished.append("ok")
+
+    with pytest.raises(RuntimeError, match="kaputt"):
+        manager._run_level(
+            (("Fehler", failing), ("Zweiter Fehler", also_failing), ("Arbeit", working))
+        )
+
+    assert finished == ["ok"]
+
+
+def test_self_test_compiles_only_changed_sources(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    package = tmp_path / "step_by_step" / "core"
+    package.mkdir(parents=True)
+    (package / "modul.py").write_text("WERT = 1\n", encoding="utf-8")
+    manager = startup.StartupManager()
+
+    assert manager._self_test_compileall() == (
+        True,
+        "1 Python-Dateien konnten erfolgreich geprüft werden.",
+    )
+    assert manager._self_test_compileall() == (True, "Keine Änderungen seit letztem Start.")
+
+    (package / "kaputt.py").write_text("def fehlt(:\n", encoding="utf-8")
+    passed, message = manager._self_test_compileall()
+    assert not passed
+    assert "kaputt.py" in message
+
+
+def test_diagnostic_lines_are_written_in_one_batch(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = startup.StartupManager()
+
+    manager._log_progress("Erste Zeile")
+    manager._log_progress("Zweite Zeile")
+    assert not manager.diagnostics_file.exists()
+
+    manager._flush_diagnostics()
+    manager._flush_diagnostics()
+    assert manager.diagnostics_file.read_text(encoding="utf-8") == "Erste Zeile\nZweite Zeile\n"
+
+
+@pytest.mark.parametrize("trailing_newline", [True, False])
+def test_trim_keeps_only_the_newest_lines(tmp_path, monkeypatch, trailing_newline):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(startup, "TRIM_BLOCK_SIZE", 16)
+    manager = startup.StartupManager()
+    lines = [f"Meldung {index} – äöü" for index in range(40)]
+    text = "\n".join(lines) + ("\n" if trailing_newline else "")
+    manager.diagnostics_file.write_text(text, encoding="utf-8")
+
+    assert manager._trim_diagnostics_log(max_lines=40) is False
+    assert manager._trim_diagnostics_log(max_lines=5) is True
+
+    kept = manager.diagnostics_file.read_text(encoding="utf-8")
+    assert kept.splitlines() == lines[-5:]
+    assert kept.endswith("\n") is trailing_newline
+
+
+def test_ensure_structure_reports_one_summary_line(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(startup.StartupManager, "_ensure_archive_database", lambda self: None)
+
+    first = startup.StartupManager()
+    first.ensure_structure()
+    assert f"Ordner angelegt: {startup.REQUIRED_FOLDERS[-1]}" in first.report.messages
+
+    manager = startup.StartupManager()
+    manager.ensure_structure()
+
+    folders = len(startup.REQUIRED_FOLDERS)
+    assert f"Ordner geprüft: {folders}/{folders} bereits vorhanden." in manager.report.messages
+    assert not any(message.startswith("Ordner angelegt") for message in manager.report.messages)
+    assert not any(message.startswith("Datei ergänzt") for message in manager.report.messages)
+
+
+def test_self_test_reuses_settings_checked_during_structure(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    settings = tmp_path / "data" / "settings.json"
+    settings.parent.mkdir()
+    settings.write_text(startup.required_file_content(startup.Path("data/settings.json")), encoding="utf-8")
+    manager = startup.StartupManager()
+    manager._ensure_settings_defaults(startup.Path("data/settings.json"))
+    calls = []
+    original = manager.settings_validator.normalise
+    monkeypatch.setattr(
+        manager.settings_validator,
+        "normalise",
+        lambda content: calls.append(1) or original(content),
+    )
+
+    assert manager._self_test_settings() == (True, "Einstellungen sind vollständig.")
+    assert calls == []
+
+    settings.write_text("{kaputt", encoding="utf-8")
+    assert manager._self_test_settings()[0] is False
+
+
+def test_repaired_paths_are_listed_once():
+    report = startup.StartupReport()
+
+    report.add_repaired(startup.Path("data/settings.json"))
+    report.add_repaired(startup.Path("data/settings.json"))
+    report.add_repaired(startup.ARCHIVE_DB_PATH)
+
+    assert report.repaired_paths == [startup.Path("data/settings.json"), startup.ARCHIVE_DB_PATH]
+
+
+def test_self_tests_run_after_security_and_dependencies(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = startup.StartupManager()
+    events = []
+    lock = threading.Lock()
+
+    def recorder(name):
+        def step() -> None:
+            with lock:
+                events.append(f"start:{name}")
+            with lock:
+                events.append(f"end:{name}")
+
+        return step
+
+    for name in (
+        "ensure_structure",
+        "ensure_virtual_environment",
+        "verify_data_security",
+        "ensure_dependencies",
+        "audit_color_contrast",
+        "run_self_tests",
+        "capture_diagnostics",
+    ):
+        monkeypatch.setattr(manager, name, recorder(name))
+
+    manager.run_startup_checks([])
+
+    start = events.index("start:run_self_tests")
+    for earlier in ("verify_data_security", "ensure_dependencies", "audit_color_contrast"):
+        assert events.index(f"end:{earlier}") < start
+    assert events.index("end:run_self_tests") < events.index("start:capture_diagnostics")
+
+
+def test_pending_diagnostics_stay_in_the_start_directory(tmp_path, monkeypatch):
+    """Der Flush beim Beenden schreibt nicht ins dann aktuelle Verzeichnis."""
+
+    start_dir = tmp_path / "start"
+    start_dir.mkdir()
+    monkeypatch.chdir(start_dir)
+    monkeypatch.setattr(startup, "STARTUP_LOG_FILE", startup.Path("logs/startup.log"))
+    manager = startup.StartupManager()
+    manager._write_diagnostic("Letzte Zeile")
+
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    manager._flush_diagnostics()
+
+    assert (start_dir / "logs" / "startup.log").read_text(encoding="utf-8") == "Letzte Zeile\n"
+    assert not (elsewhere / "logs").exists()